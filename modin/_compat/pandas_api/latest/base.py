@@ -14,7 +14,6 @@
 """Module for 'latest pandas' compatibility layer for Dataset (common DataFrame/Series)."""
 
 import pandas
-from pandas.core.dtypes.common import is_datetime_or_timedelta_dtype
 from pandas.core.window.ewm import ExponentialMovingWindow
 from pandas.util._validators import validate_bool_kwarg, validate_ascending
 from pandas._libs.lib import no_default, NoDefault
@@ -287,14 +286,6 @@ class LatestCompatibleBasePandasDataset(BaseCompatibleBasePandasDataset):
         return self._default_to_pandas(flags)
 
     def shift(self, periods=1, freq=None, axis=0, fill_value=no_default):
-        if fill_value is no_default:
-            nan_values = dict()
-            for name, dtype in dict(self.dtypes).items():
-                nan_values[name] = (
-                    pandas.NAT if is_datetime_or_timedelta_dtype(dtype) else pandas.NA
-                )
-
-            fill_value = nan_values
         return self._shift(periods=periods, freq=freq, axis=axis, fill_value=fill_value)
 
     def skew(
@@ -75,7 +75,7 @@ class Engine(EnvironmentVariable, type=str):
     """Distribution engine to run queries by."""
 
     varname = "MODIN_ENGINE"
-    choices = ("Ray", "Dask", "Python", "Native")
+    choices = ("Ray", "Dask", "Python", "Native", "Threads")
 
     @classmethod
     def _get_default(cls) -> str:
@@ -570,6 +570,48 @@ class MinPartitionSize(EnvironmentVariable, type=int):
         return min_partition_size
 
 
+class BroadcastJoinThreshold(EnvironmentVariable, type=int):
+    """
+    Maximum number of rows in the right frame of a merge for it to be broadcast.
+
+    Left and inner merges copy the right frame to every row partition of the left
+    frame if it has no more rows than this, otherwise both frames are shuffled
+    by the hash of the merge keys.
+    """
+
+    varname = "MODIN_BROADCAST_JOIN_THRESHOLD"
+    default = 1_000_000
+
+
+class GroupByShuffleThreshold(EnvironmentVariable, type=int):
+    """
+    Minimum number of partial groups, in percent of the grouped rows, to shuffle them.
+
+    The map phase of a groupby aggregation leaves partial results for the groups
+    of every row partition. If there are at least this many of them, they are
+    range-partitioned by the group keys and reduced in several row partitions
+    instead of a single one.
+    """
+
+    varname = "MODIN_GROUPBY_SHUFFLE_THRESHOLD"
+    default = 50
+
+
+class ApproximateReductions(EnvironmentVariable, type=bool):
+    """
+    Whether to estimate the quantiles and the numbers of unique values of columns.
+
+    The quantiles and medians of numeric columns are computed from mergeable
+    sketches of the partitions. If set, they are estimated from the sketches,
+    otherwise the sketches only narrow down the values to sort. The numbers of
+    unique values are estimated with HyperLogLog if set and counted exactly
+    otherwise.
+    """
+
+    varname = "MODIN_APPROXIMATE_REDUCTIONS"
+    default = False
+
+
 class TestReadFromSqlServer(EnvironmentVariable, type=bool):
     """Set to true to test reading from SQL server."""
 
@@ -18,6 +18,8 @@ from .map import Map
 from .tree_reduce import TreeReduce
 from .reduce import Reduce
 from .fold import Fold
+from .window import Window
+from .scan import Scan
 from .binary import Binary
 from .groupby import GroupByReduce, groupby_reduce_functions, is_reduce_function
 
@@ -27,6 +29,8 @@ __all__ = [
     "TreeReduce",
     "Reduce",
     "Fold",
+    "Window",
+    "Scan",
     "Binary",
     "GroupByReduce",
     "groupby_reduce_functions",
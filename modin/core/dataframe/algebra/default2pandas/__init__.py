@@ -20,6 +20,7 @@ from .str import StrDefault
 from .binary import BinaryDefault
 from .resample import ResampleDefault
 from .rolling import RollingDefault
+from .expanding import ExpandingDefault, EwmDefault
 from .default import DefaultMethod
 from .cat import CatDefault
 from .groupby import GroupByDefault
@@ -32,6 +33,8 @@ __all__ = [
     "BinaryDefault",
     "ResampleDefault",
     "RollingDefault",
+    "ExpandingDefault",
+    "EwmDefault",
     "DefaultMethod",
     "CatDefault",
     "GroupByDefault",
@@ -0,0 +1,104 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Module houses default Expanding and ExponentialMovingWindow functions builders."""
+
+from typing import Any, Callable
+from .default import DefaultMethod
+
+
+class ExpandingWindow:
+    """Builder for aggregation on expanding and exponentially weighted windows."""
+
+    @classmethod
+    def build_window(cls, func: Callable, method: str) -> Callable:
+        """
+        Build function that creates a window and executes `func` on it.
+
+        Parameters
+        ----------
+        func : callable
+            Function to execute on a window.
+        method : {"expanding", "ewm"}
+            Name of the frame method creating the window.
+
+        Returns
+        -------
+        callable
+            Function that takes pandas DataFrame and applies `func` on a window.
+        """
+
+        def fn(df: Any, window_kwargs: dict, *args: Any, **kwargs: Any) -> Any:
+            """Create a window for the passed frame and execute `func` on it."""
+            window = getattr(df, method)(**window_kwargs)
+            return func(window, *args, **kwargs)
+
+        return fn
+
+
+class ExpandingDefault(DefaultMethod):
+    """Builder for default-to-pandas aggregation on an expanding window functions."""
+
+    OBJECT_TYPE = "Expanding"
+
+    @classmethod
+    def register(cls, func: Callable, **kwargs: Any) -> Callable:
+        """
+        Build function that do fallback to pandas to apply `func` on an expanding window.
+
+        Parameters
+        ----------
+        func : callable
+            Function to execute on an expanding window.
+        **kwargs : kwargs
+            Additional arguments that will be passed to function builder.
+
+        Returns
+        -------
+        callable
+            Function that takes query compiler and defaults to pandas to apply aggregation
+            `func` on an expanding window.
+        """
+        return super().register(
+            ExpandingWindow.build_window(func, "expanding"),
+            fn_name=func.__name__,
+            **kwargs
+        )
+
+
+class EwmDefault(DefaultMethod):
+    """Builder for default-to-pandas aggregation on an exponentially weighted window."""
+
+    OBJECT_TYPE = "ExponentialMovingWindow"
+
+    @classmethod
+    def register(cls, func: Callable, **kwargs: Any) -> Callable:
+        """
+        Build function that do fallback to pandas to apply `func` on an ewm window.
+
+        Parameters
+        ----------
+        func : callable
+            Function to execute on an exponentially weighted window.
+        **kwargs : kwargs
+            Additional arguments that will be passed to function builder.
+
+        Returns
+        -------
+        callable
+            Function that takes query compiler and defaults to pandas to apply aggregation
+            `func` on an exponentially weighted window.
+        """
+        return super().register(
+            ExpandingWindow.build_window(func, "ewm"), fn_name=func.__name__, **kwargs
+        )
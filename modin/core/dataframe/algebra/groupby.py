@@ -350,11 +350,23 @@ class GroupByReduce(TreeReduce):
         # Otherwise `by` was already bound to the Map function in `build_map_reduce_functions`.
         broadcastable_by = getattr(by, "_modin_frame", None)
         apply_indices = list(map_func.keys()) if isinstance(map_func, dict) else None
+        # The groups may be reduced in several row partitions split by the range
+        # of the keys, which only keeps the order of the groups if they are sorted
+        sort = groupby_kwargs.get("sort", True)
         new_modin_frame = query_compiler._modin_frame.groupby_reduce(
-            axis, broadcastable_by, map_fn, reduce_fn, apply_indices=apply_indices
+            axis,
+            broadcastable_by,
+            map_fn,
+            reduce_fn,
+            apply_indices=apply_indices,
+            shuffle_reduce=sort,
         )
 
         result = query_compiler.__constructor__(new_modin_frame)
+        if sort and not groupby_kwargs.get("as_index", True):
+            # Every row partition is labeled from zero if the groups were reduced
+            # in several of them
+            result.index = pandas.RangeIndex(len(result.index))
         if result.index.name == MODIN_UNNAMED_SERIES_LABEL:
             result.index.name = None
         return result
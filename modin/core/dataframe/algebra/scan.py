@@ -0,0 +1,104 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Module houses builder class for Scan operator."""
+
+from typing import Any, Callable, Iterable
+
+import pandas
+
+from .operator import Operator
+
+
+class Scan(Operator):
+    """Builder class for Scan functions."""
+
+    @classmethod
+    def register(cls, scan_function: Callable) -> Callable:
+        """
+        Build Scan operator that will compute a cumulative function along rows/columns.
+
+        Parameters
+        ----------
+        scan_function : callable(pandas.DataFrame, skipna=bool) -> pandas.DataFrame
+            Cumulative function to apply, e.g. ``pandas.DataFrame.cumsum``. The result
+            of the function for a frame prepended with the last row of the result for
+            the preceding rows must be the continuation of that result.
+
+        Returns
+        -------
+        callable
+            Function that takes query compiler and executes Scan function.
+        """
+
+        def caller(
+            query_compiler: Any,
+            scan_axis: int | None,
+            *args: Iterable,
+            skipna: bool = True,
+            **kwargs: Any
+        ) -> Any:
+            """
+            Execute Scan function against passed query compiler.
+
+            Parameters
+            ----------
+            query_compiler : BaseQueryCompiler
+                The query compiler to execute the function on.
+            scan_axis : int or None
+                0 or None means scan along the rows, 1 means along the columns.
+            *args : iterable
+                Additional arguments passed to scan_function.
+            skipna : bool, default: True
+                Whether to skip the missing values. None means True.
+            **kwargs: dict
+                Additional keyword arguments passed to scan_function.
+
+            Returns
+            -------
+            BaseQueryCompiler
+                A new query compiler representing the result of executing the
+                function.
+            """
+            if skipna is None:
+                skipna = True
+
+            def scan_fn(df, offset):
+                if offset is None or len(offset) == 0:
+                    return scan_function(df, *args, skipna=skipna, **kwargs)
+                result = scan_function(
+                    pandas.concat([offset, df], copy=False),
+                    *args,
+                    skipna=skipna,
+                    **kwargs
+                )
+                return result.iloc[len(offset) :]
+
+            def carry_fn(df):
+                result = scan_function(df, *args, skipna=skipna, **kwargs)
+                # With ``skipna`` the missing values don't reset the accumulated
+                # value, so the carry is the last non-missing one.
+                return (result.ffill() if skipna else result).iloc[-1:]
+
+            return query_compiler.__constructor__(
+                query_compiler._modin_frame.scan(
+                    cls.validate_axis(scan_axis),
+                    carry_fn,
+                    lambda offset, carry: carry_fn(
+                        pandas.concat([offset, carry], copy=False)
+                    ),
+                    scan_fn,
+                )
+            )
+
+        return caller
@@ -0,0 +1,77 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Module houses builder class for Window operator."""
+
+from typing import Any, Callable, Iterable
+from .operator import Operator
+
+
+class Window(Operator):
+    """Builder class for Window functions."""
+
+    @classmethod
+    def register(cls, window_function: Callable) -> Callable:
+        """
+        Build Window operator that will be performed over sliding windows of rows/columns.
+
+        Parameters
+        ----------
+        window_function : callable(pandas.DataFrame) -> pandas.DataFrame
+            Function computing the window aggregation for every row (column)
+            of the passed frame.
+
+        Returns
+        -------
+        callable
+            Function that takes query compiler and executes Window function.
+        """
+
+        def caller(
+            query_compiler: Any,
+            window_axis: int | None,
+            window_size: int,
+            *args: Iterable,
+            **kwargs: Any
+        ) -> Any:
+            """
+            Execute Window function against passed query compiler.
+
+            Parameters
+            ----------
+            query_compiler : BaseQueryCompiler
+                The query compiler to execute the function on.
+            window_axis : int or None
+                0 or None means slide the windows over rows, 1 means over columns.
+            window_size : int
+                The number of rows (columns) every window spans.
+            *args : iterable
+                Additional arguments passed to window_function.
+            **kwargs: dict
+                Additional keyword arguments passed to window_function.
+
+            Returns
+            -------
+            BaseQueryCompiler
+                A new query compiler representing the result of executing the
+                function.
+            """
+            return query_compiler.__constructor__(
+                query_compiler._modin_frame.window(
+                    cls.validate_axis(window_axis),
+                    lambda x: window_function(x, *args, **kwargs),
+                    window_size,
+                )
+            )
+
+        return caller
@@ -37,6 +37,12 @@ from modin.core.dataframe.base.dataframe.utils import (
     Axis,
     JoinType,
 )
+from modin.core.dataframe.pandas.dataframe.utils import (
+    ShuffleSortFunctions,
+    hash_split_fn,
+    split_by_bins,
+)
+from modin.config import NPartitions
 
 if TYPE_CHECKING:
     from modin.core.dataframe.base.interchange.dataframe_protocol.dataframe import (
@@ -1652,7 +1658,13 @@ class PandasDataframe(ClassLogger):
         return self._compute_tree_reduce_metadata(axis.value, reduce_parts)
 
     @lazy_metadata_decorator(apply_axis=None)
-    def map(self, func: Callable, dtypes: Optional[str] = None) -> "PandasDataframe":
+    def map(
+        self,
+        func: Callable,
+        dtypes: Optional[str] = None,
+        new_columns: Optional[List[Hashable]] = None,
+        column_widths: Optional[List[int]] = None,
+    ) -> "PandasDataframe":
         """
         Perform a function that maps across the entire dataset.
 
@@ -1661,31 +1673,45 @@ class PandasDataframe(ClassLogger):
         func : callable(row|col|cell) -> row|col|cell
             The function to apply.
         dtypes : dtypes of the result, optional
-            The data types for the result. This is an optimization
-            because there are functions that always result in a particular data
-            type, and this allows us to avoid (re)computing it.
+            The data types for the result (a single dtype or a Series holding the
+            dtype of every column). This is an optimization because there are
+            functions that always result in a particular data type, and this
+            allows us to avoid (re)computing it.
+        new_columns : list-like, optional
+            The column labels of the result if `func` changes the columns of
+            the blocks. The blocks are then passed to `func` with up-to-date
+            column labels.
+        column_widths : list of ints, optional
+            The widths of the column partitions of the result. Must be specified
+            along with `new_columns`.
 
         Returns
         -------
         PandasDataframe
             A new dataframe.
         """
+        if new_columns is not None:
+            self._propagate_index_objs(axis=1)
         new_partitions = self._partition_mgr_cls.map_partitions(self._partitions, func)
-        if dtypes == "copy":
+        if new_columns is None:
+            new_columns = self.axes[1]
+            column_widths = self._column_widths_cache
+        if isinstance(dtypes, str) and dtypes == "copy":
             dtypes = self._dtypes
-        elif dtypes is not None:
+        elif dtypes is not None and not isinstance(dtypes, pandas.Series):
             dtypes = pandas.Series(
-                [np.dtype(dtypes)] * len(self.columns), index=self.columns
+                [np.dtype(dtypes)] * len(new_columns), index=new_columns
             )
         return self.__constructor__(
             new_partitions,
             self.axes[0],
-            self.axes[1],
+            new_columns,
             self._row_lengths_cache,
-            self._column_widths_cache,
+            column_widths,
             dtypes=dtypes,
         )
 
+    @lazy_metadata_decorator(apply_axis="both")
     def window(
         self,
         axis: Union[int, Axis],
@@ -1700,8 +1726,10 @@ class PandasDataframe(ClassLogger):
         ----------
         axis : int or modin.core.dataframe.base.utils.Axis
             The axis to slide over.
-        reduce_fn : callable(rowgroup|colgroup) -> row|col
-            The reduce function to apply over the data.
+        reduce_fn : callable(pandas.DataFrame) -> pandas.DataFrame
+            The function computing the reduction of the window ending at every row
+            of the passed frame, e.g. ``lambda df: df.rolling(window_size).sum()``.
+            It must keep the shape of the frame.
         window_size : int
             The number of row/columns to pass to the function.
             (The size of the sliding window).
@@ -1716,10 +1744,109 @@ class PandasDataframe(ClassLogger):
 
         Notes
         -----
-        The user-defined reduce function must reduce each window’s column
-        (row if axis=1) down to a single value.
+        Every row partition is prepended with the trailing ``window_size - 1`` rows
+        of the preceding partitions (the halo), so the windows of every partition
+        are computed locally; the results for the halo rows are dropped afterwards.
+        Only row-wise windows are supported.
         """
-        pass
+        axis = Axis(axis)
+        if axis != Axis.ROW_WISE:
+            raise NotImplementedError(
+                f"Algebra window only implemented row-wise. {axis.name} window not implemented yet!"
+            )
+
+        def window_fn(df, halo_size):
+            result = reduce_fn(df)
+            return result.iloc[halo_size:] if halo_size > 0 else result
+
+        new_partitions = self._partition_mgr_cls.map_partitions_with_halo(
+            self._partitions,
+            window_fn,
+            max(window_size - 1, 0),
+            self.row_lengths,
+        )
+        return self.__constructor__(
+            new_partitions,
+            self.index,
+            self.columns,
+            self.row_lengths,
+            self.column_widths,
+            dtypes=None if result_schema is None else pandas.Series(result_schema),
+        )
+
+    @lazy_metadata_decorator(apply_axis="both")
+    def scan(
+        self,
+        axis: Union[int, Axis],
+        carry_fn: Callable,
+        combine_fn: Callable,
+        scan_fn: Callable,
+        new_columns: Optional[List[Hashable]] = None,
+        dtypes: Optional[pandas.Series] = None,
+    ) -> "PandasDataframe":
+        """
+        Apply a prefix scan (cumulative operation) along the specified axis.
+
+        Parameters
+        ----------
+        axis : int or modin.core.dataframe.base.utils.Axis
+            The axis to scan along.
+        carry_fn : callable(pandas.DataFrame) -> pandas.DataFrame
+            The function computing the carry of a partition, e.g. its total.
+        combine_fn : callable(pandas.DataFrame, pandas.DataFrame) -> pandas.DataFrame
+            The function combining the accumulated carry of the preceding partitions
+            with the carry of the next partition.
+        scan_fn : callable(pandas.DataFrame, pandas.DataFrame or None) -> pandas.DataFrame
+            The function scanning a partition starting from the accumulated carry
+            of the preceding partitions (None for the first partition).
+        new_columns : list-like, optional
+            The column labels of the result. If specified, the functions are applied
+            to full rows, so the scan of a column may depend on the other columns.
+            Otherwise every column is scanned independently and the columns are kept.
+        dtypes : pandas.Series, optional
+            The data types of the result.
+
+        Returns
+        -------
+        PandasDataframe
+            A new PandasDataframe with the same row labels.
+
+        Notes
+        -----
+        The carries of all of the partitions are computed in parallel, combined
+        on the driver and sent back to the partitions, so no partition has to be
+        combined with the others. Only row-wise scans are supported.
+        """
+        axis = Axis(axis)
+        if axis != Axis.ROW_WISE:
+            raise NotImplementedError(
+                f"Algebra scan only implemented row-wise. {axis.name} scan not implemented yet!"
+            )
+
+        new_partitions = self._partition_mgr_cls.scan_partitions(
+            self._partitions,
+            carry_fn,
+            combine_fn,
+            scan_fn,
+            full_rows=new_columns is not None,
+        )
+        if new_columns is None:
+            return self.__constructor__(
+                new_partitions,
+                self.index,
+                self.columns,
+                self.row_lengths,
+                self.column_widths,
+                dtypes=dtypes,
+            )
+        return self.__constructor__(
+            new_partitions,
+            self.index,
+            new_columns,
+            self.row_lengths,
+            [len(new_columns)],
+            dtypes=dtypes,
+        )
 
     @lazy_metadata_decorator(apply_axis="both")
     def fold(self, axis, func):
@@ -1905,11 +2032,13 @@ class PandasDataframe(ClassLogger):
             new_dtypes,
         )
 
+    @lazy_metadata_decorator(apply_axis="both")
     def sort_by(
         self,
         axis: Union[int, Axis],
-        columns: Union[str, List[str]],
+        columns: Union[str, List[str], None],
         ascending: bool = True,
+        **kwargs,
     ) -> "PandasDataframe":
         """
         Logically reorder rows (columns if axis=1) lexicographically by the data in a column or set of columns.
@@ -1918,17 +2047,639 @@ class PandasDataframe(ClassLogger):
         ----------
         axis : int or modin.core.dataframe.base.utils.Axis
             The axis to perform the sort over.
-        columns : string or list
+        columns : string, list or None
             Column label(s) to use to determine lexicographical ordering.
-        ascending : boolean, default: True
+            Index level names are accepted as well. If None, rows are
+            ordered by their labels.
+        ascending : boolean or list of booleans, default: True
             Whether to sort in ascending or descending order.
+        **kwargs : dict
+            Keyword arguments to pass when sorting partitions
+            (``kind``, ``na_position``, ``key``).
 
         Returns
         -------
         PandasDataframe
             A new PandasDataframe sorted into lexicographical order by the specified column(s).
+
+        Notes
+        -----
+        The data is sorted with a sample-sort: the first sort key of every row partition
+        is sampled, the samples are used to pick range pivots, the rows are shuffled into
+        the new row partitions by those ranges and every new partition is sorted locally.
+        Only row-wise sorting is supported.
         """
-        pass
+        axis = Axis(axis)
+        if axis != Axis.ROW_WISE:
+            raise NotImplementedError(
+                f"Algebra sort only implemented row-wise. {axis.name} sort not implemented yet!"
+            )
+        if columns is not None and not is_list_like(columns):
+            columns = [columns]
+        if self._partitions.size == 0:
+            return self.copy()
+
+        shuffle_functions = ShuffleSortFunctions(
+            columns,
+            ascending,
+            NPartitions.get(),
+            # Row labels of the partitions are up to date if the index isn't materialized.
+            index_names=None if self._index_cache is None else self.index.names,
+            **kwargs,
+        )
+        if columns is None or columns[0] not in self.columns:
+            # Row labels are available in every block, so any of them can be sampled.
+            key_block_idx = [0]
+        else:
+            key_block_idx = list(
+                self._get_dict_of_block_index(
+                    1, self.columns.get_indexer_for(columns[:1])
+                ).keys()
+            )
+        new_partitions = self._partition_mgr_cls.shuffle_partitions(
+            self._partitions,
+            key_block_idx,
+            shuffle_functions,
+            shuffle_functions.sort_fn,
+        )
+        return self.__constructor__(
+            new_partitions,
+            columns=self.columns,
+            column_widths=[len(self.columns)],
+            dtypes=self._dtypes,
+        )
+
+    @lazy_metadata_decorator(apply_axis="both")
+    def hash_join(
+        self,
+        right: "PandasDataframe",
+        how: str,
+        left_on: List[Hashable],
+        right_on: List[Hashable],
+        sort: bool = False,
+        **kwargs: dict,
+    ) -> "PandasDataframe":
+        """
+        Merge this dataframe with the other by the values of the key columns.
+
+        Parameters
+        ----------
+        right : PandasDataframe
+            The right dataframe to merge with.
+        how : {"inner", "left", "right", "outer"}
+            The type of join to perform.
+        left_on : list of labels
+            Key columns of this dataframe.
+        right_on : list of labels
+            Key columns of the right dataframe, must have the same dtypes as
+            the `left_on` columns.
+        sort : bool, default: False
+            Whether to sort the result by the keys. Only supported if `left_on`
+            and `right_on` are the same.
+        **kwargs : dict
+            Additional keyword arguments to pass to ``pandas.merge``
+            (``suffixes``, ``indicator``, ``validate``, etc.).
+
+        Returns
+        -------
+        PandasDataframe
+            A new PandasDataframe with a default (range) index, rows are in the
+            same order as ``pandas.merge`` gives.
+
+        Notes
+        -----
+        Both dataframes are split into ``NPartitions`` pieces by the hash of the keys,
+        so rows with equal keys always get into the pair of pieces with the same number,
+        and every pair is merged independently. The original positions of the rows are
+        carried through the merge, and the merged rows are sorted by them afterwards to
+        restore the order pandas gives.
+        """
+        num_bins = NPartitions.get()
+        taken_labels = set(self.columns).union(right.columns)
+
+        def get_unused_label(label):
+            while label in taken_labels:
+                label = f"_{label}_"
+            taken_labels.add(label)
+            return label
+
+        left_pos, right_pos, left_group, right_group, group = (
+            get_unused_label(label)
+            for label in (
+                "__left_position__",
+                "__right_position__",
+                "__left_group__",
+                "__right_group__",
+                "__group__",
+            )
+        )
+        num_left_rows = sum(self.row_lengths)
+
+        if how == "left":
+            order_by = [left_pos, right_pos]
+        elif how == "right":
+            order_by = [right_pos, left_pos]
+        else:
+            # Keys go in the order of their first appearance in the left frame,
+            # followed by the keys found in the right frame only.
+            order_by = [group, left_pos, right_pos]
+
+        def join_func(left, right):
+            if how in ("inner", "outer"):
+                left[left_group] = left.groupby(left_on, sort=False, dropna=False)[
+                    left_pos
+                ].transform("min")
+                right[right_group] = right.groupby(right_on, sort=False, dropna=False)[
+                    right_pos
+                ].transform("min")
+            result = pandas.merge(
+                left,
+                right,
+                how=how,
+                left_on=left_on,
+                right_on=right_on,
+                sort=False,
+                **kwargs,
+            )
+            if how in ("inner", "outer"):
+                result[group] = result[left_group].fillna(
+                    num_left_rows + result[right_group]
+                )
+                result = result.drop(columns=[left_group, right_group])
+            return result.set_index(order_by)
+
+        def get_split_kwargs(frame, position_label):
+            offsets = np.cumsum([0] + frame.row_lengths[:-1])
+            return [
+                {"position_label": position_label, "row_offset": offset}
+                for offset in offsets
+            ]
+
+        left_pieces = self._partition_mgr_cls.split_row_partitions(
+            self._partitions,
+            lambda df, **kw: hash_split_fn(df, left_on, num_bins, **kw),
+            num_bins,
+            get_split_kwargs(self, left_pos),
+        )
+        right_pieces = self._partition_mgr_cls.split_row_partitions(
+            right._partitions,
+            lambda df, **kw: hash_split_fn(df, right_on, num_bins, **kw),
+            num_bins,
+            get_split_kwargs(right, right_pos),
+        )
+        joined = self.__constructor__(
+            self._partition_mgr_cls.combine_split_partitions(
+                left_pieces, join_func, right_pieces
+            )
+        )
+        # Stable sort is used so the rows with equal keys keep the order from `order_by`.
+        result = joined.sort_by(
+            0,
+            (list(left_on) if sort else []) + order_by,
+            ascending=True,
+            kind="stable",
+            na_position="last",
+        )
+        result.index = pandas.RangeIndex(
+            sum(part.length() for part in result._partitions.T[0])
+        )
+        return result
+
+    def _get_key_summaries(self, key, func):
+        """
+        Apply a function to the values of the key column of every row partition.
+
+        Parameters
+        ----------
+        key : label
+            Label of the key column, must be unique.
+        func : callable(pandas.DataFrame) -> pandas.DataFrame
+            Function to apply to a single-column frame holding the keys.
+
+        Returns
+        -------
+        list of partitions
+            The unmaterialized results, one per row partition.
+        """
+        key_frame = self.take_2d_labels_or_positional(col_labels=[key])
+        return [part.apply(func) for part in key_frame._partitions[:, 0]]
+
+    @lazy_metadata_decorator(apply_axis="both")
+    def asof_join(
+        self,
+        right: "PandasDataframe",
+        left_on: Hashable,
+        right_on: Hashable,
+        left_by: Optional[List[Hashable]] = None,
+        right_by: Optional[List[Hashable]] = None,
+        tolerance=None,
+        direction: str = "backward",
+        **kwargs: dict,
+    ) -> "PandasDataframe":
+        """
+        Merge this dataframe with the other by the nearest values of the key columns.
+
+        Parameters
+        ----------
+        right : PandasDataframe
+            The right dataframe to merge with.
+        left_on : label
+            Key column of this dataframe.
+        right_on : label
+            Key column of the right dataframe.
+        left_by : list of labels, optional
+            Columns of this dataframe to match exactly before searching the keys.
+        right_by : list of labels, optional
+            Columns of the right dataframe to match exactly before searching the keys.
+        tolerance : int or Timedelta, optional
+            The maximum distance between the matched keys.
+        direction : {"backward", "forward", "nearest"}, default: "backward"
+            Whether to search for the prior, the subsequent or the closest matches.
+        **kwargs : dict
+            Additional keyword arguments to pass to ``pandas.merge_asof``
+            (``suffixes``, ``allow_exact_matches``).
+
+        Returns
+        -------
+        PandasDataframe
+            A new PandasDataframe with a default (range) index, holding a row
+            per every row of this dataframe.
+
+        Notes
+        -----
+        Both dataframes are range-partitioned on the key with the first keys of the
+        row partitions of this dataframe as the splitters. Every new row partition of
+        this dataframe only needs the right rows of the same range and the last
+        (for the "backward" search) or the first (for the "forward" search) right row
+        of every ``by`` group outside of the range. These rows are carried from range
+        to range, limited by `tolerance`, so the search is done for every range locally.
+        """
+        merge_kwargs = dict(
+            left_on=left_on,
+            right_on=right_on,
+            left_by=left_by,
+            right_by=right_by,
+            tolerance=tolerance,
+            direction=direction,
+            **kwargs,
+        )
+        # Validate the arguments the same way pandas does without moving any data.
+        pandas.merge_asof(
+            pandas.DataFrame(columns=self.columns).astype(self.dtypes),
+            pandas.DataFrame(columns=right.columns).astype(right.dtypes),
+            **merge_kwargs,
+        )
+
+        def describe_keys(df):
+            keys = df.iloc[:, 0]
+            bounds = keys.iloc[[0, -1]] if len(keys) else keys
+            return pandas.DataFrame(
+                {
+                    "bound": bounds.reset_index(drop=True),
+                    "is_sorted": keys.is_monotonic_increasing,
+                    "hasnans": keys.hasnans,
+                }
+            )
+
+        left_summaries = self._get_key_summaries(left_on, describe_keys)
+        right_summaries = right._get_key_summaries(right_on, describe_keys)
+        summaries = self._partition_mgr_cls.get_objects_from_partitions(
+            left_summaries + right_summaries
+        )
+        for side, side_summaries in (
+            ("left", summaries[: len(left_summaries)]),
+            ("right", summaries[len(left_summaries) :]),
+        ):
+            side_summaries = pandas.concat(side_summaries)
+            if not (
+                side_summaries["is_sorted"].all()
+                and pandas.Index(side_summaries["bound"]).is_monotonic_increasing
+            ):
+                if side_summaries["hasnans"].any():
+                    raise ValueError(f"Merge keys contain null values on {side} side")
+                raise ValueError(f"{side} keys must be sorted")
+            if side == "left":
+                left_bounds = side_summaries["bound"]
+        # Bounds go in pairs of the first and the last key of a partition.
+        splitters = pandas.Index(left_bounds.iloc[::2]).unique()[1:]
+        num_bins = len(splitters) + 1
+
+        def split_fn(df, key):
+            return split_by_bins(
+                df, splitters.searchsorted(df[key], side="right"), num_bins
+            )
+
+        left_pieces = self._partition_mgr_cls.split_row_partitions(
+            self._partitions,
+            split_fn,
+            num_bins,
+            [{"key": left_on}] * len(left_summaries),
+        )
+        right_pieces = self._partition_mgr_cls.split_row_partitions(
+            right._partitions,
+            split_fn,
+            num_bins,
+            [{"key": right_on}] * len(right_summaries),
+        )
+        windows = self._partition_mgr_cls.combine_split_partitions(
+            right_pieces, lambda df: df
+        )[:, 0]
+
+        def get_edge_rows(df, other=None, bound=None, last=True):
+            if other is not None:
+                df = pandas.concat([other, df] if last else [df, other])
+            if right_by is None:
+                df = df.tail(1) if last else df.head(1)
+            else:
+                groups = df.groupby(right_by, sort=False, dropna=False)
+                df = groups.tail(1) if last else groups.head(1)
+            if tolerance is not None:
+                df = df[
+                    df[right_on] >= bound - tolerance
+                    if last
+                    else df[right_on] <= bound + tolerance
+                ]
+            return df
+
+        # The last right rows of the previous ranges, one entry per range.
+        carries = [None] * num_bins
+        # The first right rows of the next ranges, one entry per range.
+        heads = [None] * num_bins
+        if direction in ("backward", "nearest"):
+            for i in range(1, num_bins):
+                previous = carries[i - 1]
+                carries[i] = windows[i - 1].apply(
+                    get_edge_rows,
+                    None if previous is None else previous.list_of_blocks[0],
+                    bound=splitters[i - 1],
+                    last=True,
+                )
+        if direction in ("forward", "nearest"):
+            for i in range(num_bins - 2, -1, -1):
+                following = heads[i + 1]
+                heads[i] = windows[i + 1].apply(
+                    get_edge_rows,
+                    None if following is None else following.list_of_blocks[0],
+                    bound=splitters[i],
+                    last=False,
+                )
+        right_rows = [
+            [part for part in (carry, window, head) if part is not None]
+            for carry, window, head in zip(carries, windows, heads)
+        ]
+
+        def merge_func(left, right):
+            return pandas.merge_asof(left, right, **merge_kwargs)
+
+        result = self.__constructor__(
+            self._partition_mgr_cls.combine_split_partitions(
+                left_pieces, merge_func, right_rows
+            )
+        )
+        result.index = pandas.RangeIndex(sum(self.row_lengths))
+        return result
+
+    @lazy_metadata_decorator(apply_axis="both")
+    def ordered_join(
+        self,
+        right: "PandasDataframe",
+        how: str,
+        left_on: List[Hashable],
+        right_on: List[Hashable],
+        fill_method: Optional[str] = None,
+        **kwargs: dict,
+    ) -> "PandasDataframe":
+        """
+        Merge this dataframe with the other ordering the result by the key columns.
+
+        Parameters
+        ----------
+        right : PandasDataframe
+            The right dataframe to merge with.
+        how : {"inner", "left", "right", "outer"}
+            The type of join to perform.
+        left_on : list of labels
+            Key columns of this dataframe.
+        right_on : list of labels
+            Key columns of the right dataframe.
+        fill_method : {"ffill", None}, default: None
+            Whether to fill the unmatched rows from the previous matched ones.
+        **kwargs : dict
+            Additional keyword arguments to pass to ``pandas.merge_ordered``
+            (``suffixes``).
+
+        Returns
+        -------
+        PandasDataframe
+            A new PandasDataframe with a default (range) index.
+
+        Notes
+        -----
+        Both dataframes are range-partitioned on the first key with the splitters
+        sampled from both of them, so the rows with equal keys always get into the
+        pair of pieces with the same number and the pieces follow the order of the
+        keys. Every pair is merged independently. To forward fill the rows at the start
+        of a range, the rows the previous ranges would fill them with are put before
+        the others as a pair of matching rows, which is dropped after the merge.
+        """
+        merge_kwargs = dict(
+            left_on=left_on,
+            right_on=right_on,
+            fill_method=fill_method,
+            how=how,
+            **kwargs,
+        )
+        # Validate the arguments the same way pandas does without moving any data,
+        # the frames get a row of NaNs to place the key columns as for non-empty data.
+        columns = pandas.merge_ordered(
+            pandas.DataFrame(columns=self.columns).astype(self.dtypes).reindex([0]),
+            pandas.DataFrame(columns=right.columns).astype(right.dtypes).reindex([0]),
+            **merge_kwargs,
+        ).columns
+
+        left_functions = ShuffleSortFunctions(left_on, True, NPartitions.get())
+        right_functions = ShuffleSortFunctions(right_on, True, NPartitions.get())
+        num_bins = left_functions.pivot_fn(
+            self._partition_mgr_cls.get_objects_from_partitions(
+                self._get_key_summaries(left_on[0], left_functions.sample_fn)
+                + right._get_key_summaries(right_on[0], right_functions.sample_fn)
+            )
+        )
+        right_functions.pivots = left_functions.pivots
+        left_pieces = self._partition_mgr_cls.split_row_partitions(
+            self._partitions, left_functions.split_fn, num_bins
+        )
+        right_pieces = self._partition_mgr_cls.split_row_partitions(
+            right._partitions, right_functions.split_fn, num_bins
+        )
+
+        func_kwargs = [{} for _ in range(num_bins)]
+        if fill_method == "ffill" and how != "inner":
+
+            def get_fill_row(df, other, on, other_on, matched_only):
+                if matched_only:
+                    keys = other[other_on].set_axis(on, axis=1).drop_duplicates()
+                    matched = df[on].merge(keys, how="left", indicator=True)["_merge"]
+                    df = df[matched.to_numpy() == "both"]
+                return df.sort_values(on, kind="stable", na_position="last").tail(1)
+
+            fill_rows = self._partition_mgr_cls.get_objects_from_partitions(
+                list(
+                    self._partition_mgr_cls.combine_split_partitions(
+                        left_pieces,
+                        get_fill_row,
+                        right_pieces,
+                        func_kwargs=[
+                            {
+                                "on": left_on,
+                                "other_on": right_on,
+                                "matched_only": how == "right",
+                            }
+                        ]
+                        * num_bins,
+                    )[:, 0]
+                )
+                + list(
+                    self._partition_mgr_cls.combine_split_partitions(
+                        right_pieces,
+                        get_fill_row,
+                        left_pieces,
+                        func_kwargs=[
+                            {
+                                "on": right_on,
+                                "other_on": left_on,
+                                "matched_only": how == "left",
+                            }
+                        ]
+                        * num_bins,
+                    )[:, 0]
+                )
+            )
+            left_carry = right_carry = None
+            for i in range(num_bins):
+                if left_carry is not None or right_carry is not None:
+                    func_kwargs[i] = {
+                        "left_carry": left_carry,
+                        "right_carry": right_carry,
+                    }
+                if len(fill_rows[i]):
+                    left_carry = fill_rows[i]
+                if len(fill_rows[num_bins + i]):
+                    right_carry = fill_rows[num_bins + i]
+
+        def merge_func(left, right, left_carry=None, right_carry=None):
+            if left_carry is None and right_carry is None:
+                result = pandas.merge_ordered(left, right, **merge_kwargs)
+                # pandas puts the key columns elsewhere if the left frame is empty
+                return result[columns] if left.empty else result
+            # The carried rows go first as the keys of the previous ranges are less
+            # than the keys of this one, the missing ones are filled with NaNs.
+            if left_carry is None:
+                left_carry = pandas.DataFrame(
+                    {
+                        left_key: right_carry[right_key].to_numpy()
+                        for left_key, right_key in zip(left_on, right_on)
+                    }
+                )
+            if right_carry is None:
+                right_carry = pandas.DataFrame(index=[0])
+            else:
+                right_carry = right_carry.copy()
+            for left_key, right_key in zip(left_on, right_on):
+                right_carry[right_key] = left_carry[left_key].to_numpy()
+            result = pandas.merge_ordered(
+                pandas.concat([left_carry, left])[left.columns],
+                pandas.concat([right_carry, right])[right.columns],
+                **merge_kwargs,
+            )
+            return result.iloc[1:]
+
+        result = self.__constructor__(
+            self._partition_mgr_cls.combine_split_partitions(
+                left_pieces, merge_func, right_pieces, func_kwargs=func_kwargs
+            ),
+            columns=columns,
+            column_widths=[len(columns)],
+        )
+        result.index = pandas.RangeIndex(
+            sum(part.length() for part in result._partitions.T[0])
+        )
+        return result
+
+    @lazy_metadata_decorator(apply_axis="both")
+    def hash_shuffle_apply(
+        self,
+        columns: List[Hashable],
+        func: Callable,
+        new_columns: List[Hashable],
+        dtypes: Optional[pandas.Series] = None,
+    ) -> "PandasDataframe":
+        """
+        Apply a function to the rows grouped by the hash of the key columns.
+
+        Parameters
+        ----------
+        columns : list of labels
+            Labels of the key columns.
+        func : callable(pandas.DataFrame) -> pandas.DataFrame
+            The function to apply. It takes a frame holding all of the rows with
+            the same keys (and possibly some others) in their original order and
+            labeled with their positions, and must return one row per passed row
+            labeled the same way.
+        new_columns : list of labels
+            The column labels of the result.
+        dtypes : pandas.Series, optional
+            The data types of the result.
+
+        Returns
+        -------
+        PandasDataframe
+            A new PandasDataframe with the same row labels and row partitioning.
+
+        Notes
+        -----
+        The rows are split into ``NPartitions`` pieces by the hash of the keys,
+        so rows with equal keys always get into the same piece, and `func` is applied
+        to every piece independently. The results are then sent back to the row
+        partitions they came from using the positions of the rows.
+        """
+        num_bins = NPartitions.get()
+        row_offsets = np.cumsum([0] + self.row_lengths)
+        num_row_parts = len(row_offsets) - 1
+
+        def split_fn(df, row_offset):
+            df = df.copy(deep=False)
+            df.index = pandas.RangeIndex(row_offset, row_offset + len(df))
+            return hash_split_fn(df, columns, num_bins)
+
+        def split_back_fn(df):
+            bins = np.searchsorted(row_offsets[1:], df.index, side="right")
+            return split_by_bins(df, bins, num_row_parts)
+
+        pieces = self._partition_mgr_cls.split_row_partitions(
+            self._partitions,
+            split_fn,
+            num_bins,
+            [{"row_offset": offset} for offset in row_offsets[:-1]],
+        )
+        results = self._partition_mgr_cls.combine_split_partitions(pieces, func)
+        new_partitions = self._partition_mgr_cls.combine_split_partitions(
+            self._partition_mgr_cls.split_row_partitions(
+                results, split_back_fn, num_row_parts
+            ),
+            lambda df: df.sort_index(),
+        )
+        result = self.__constructor__(
+            new_partitions,
+            self.index,
+            new_columns,
+            self.row_lengths,
+            [len(new_columns)],
+            dtypes=dtypes,
+        )
+        # The partitions are labeled with the positions of the rows.
+        result.synchronize_labels(axis=0)
+        return result
 
     @lazy_metadata_decorator(apply_axis="both")
     def filter(self, axis: Union[Axis, int], condition: Callable) -> "PandasDataframe":
@@ -2879,6 +3630,7 @@ class PandasDataframe(ClassLogger):
         new_index=None,
         new_columns=None,
         apply_indices=None,
+        shuffle_reduce=False,
     ):
         """
         Groupby another Modin DataFrame dataframe and aggregate the result.
@@ -2901,6 +3653,10 @@ class PandasDataframe(ClassLogger):
             and if not provided it must be computed.
         apply_indices : list-like, default: None
             Indices of `axis ^ 1` to apply groupby over.
+        shuffle_reduce : bool, default: False
+            Whether the reduce phase may be split into several row partitions by
+            the range of the group keys if the map phase leaves many groups.
+            The result then follows the sorted order of the groups.
 
         Returns
         -------
@@ -2918,7 +3674,13 @@ class PandasDataframe(ClassLogger):
             )
 
         new_partitions = self._partition_mgr_cls.groupby_reduce(
-            axis, self._partitions, by_parts, map_func, reduce_func, apply_indices
+            axis,
+            self._partitions,
+            by_parts,
+            map_func,
+            reduce_func,
+            apply_indices,
+            shuffle_reduce=shuffle_reduce,
         )
         kw = self.__make_init_labels_args(new_partitions, new_index, new_columns)
         return self.__constructor__(new_partitions, **kw)
@@ -3155,9 +3917,33 @@ class PandasDataframe(ClassLogger):
             )
 
         from modin.core.dataframe.pandas.interchange.dataframe_protocol.from_dataframe import (
-            from_dataframe_to_pandas,
+            protocol_df_chunk_to_pandas,
+        )
+
+        df = df.__dataframe__()
+        if isinstance(df, dict):
+            df = df["dataframe"]
+
+        # Every chunk of the protocol dataframe is converted on its own and becomes
+        # a separate row partition, so the whole frame is never materialized at once
+        pandas_dfs = [protocol_df_chunk_to_pandas(chunk) for chunk in df.get_chunks()]
+        if len(pandas_dfs) == 0:
+            return cls.from_pandas(pandas.DataFrame())
+        partitions, row_lengths, col_widths = cls._partition_mgr_cls.from_pandas_chunks(
+            pandas_dfs
         )
+        # Chunks may come with different dtypes (e.g. only some of them holding nulls),
+        # so resolve them the same way as concatenating the chunks would do
+        dtypes = pandas.concat([chunk.iloc[:0] for chunk in pandas_dfs], axis=0).dtypes
 
-        ErrorMessage.default_to_pandas(message="`from_dataframe`")
-        pandas_df = from_dataframe_to_pandas(df)
-        return cls.from_pandas(pandas_df)
+        index = df.metadata.get("modin.index", df.metadata.get("pandas.index", None))
+        if index is None:
+            index = pandas.RangeIndex(sum(row_lengths))
+        return cls(
+            partitions,
+            index,
+            pandas_dfs[0].columns,
+            row_lengths,
+            col_widths,
+            dtypes=dtypes,
+        )
@@ -0,0 +1,404 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Collection of algebra utility functions, used to shuffle data across partitions."""
+
+import abc
+from typing import List, Hashable, Optional
+
+import numpy as np
+import pandas
+from pandas.core.dtypes.common import is_list_like
+
+
+class ShuffleFunctions(abc.ABC):
+    """
+    Interface for the functions used to shuffle data between row partitions.
+
+    A shuffle is performed in three steps: a small sample is taken from every row
+    partition (``sample_fn``), the samples are combined on the driver to pick the
+    pivots (``pivot_fn``) and finally every row partition is split into the pieces
+    that correspond to the new row partitions (``split_fn``).
+    """
+
+    @abc.abstractmethod
+    def sample_fn(self, partition):
+        """
+        Pick samples over the given partition.
+
+        Parameters
+        ----------
+        partition : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+            The samples for the partition.
+        """
+        pass
+
+    @abc.abstractmethod
+    def pivot_fn(self, samples):
+        """
+        Determine the pivots for the shuffle using the passed samples.
+
+        Parameters
+        ----------
+        samples : list of pandas.DataFrame
+            Samples of every row partition.
+
+        Returns
+        -------
+        int
+            The number of pieces every row partition is split into.
+        """
+        pass
+
+    @abc.abstractmethod
+    def split_fn(self, partition):
+        """
+        Split the given partition into the pieces defined by the pivots.
+
+        Parameters
+        ----------
+        partition : pandas.DataFrame
+
+        Returns
+        -------
+        list of pandas.DataFrame
+            The pieces of the partition, one per new row partition.
+        """
+        pass
+
+
+class ShuffleSortFunctions(ShuffleFunctions):
+    """
+    Perform the sampling, pivot picking and splitting steps of a distributed sample-sort.
+
+    Rows are range-partitioned by the first sort key, so every new row partition holds
+    a contiguous range of the sorted data and only has to be sorted locally.
+
+    Parameters
+    ----------
+    columns : list of labels or None
+        Labels of the columns (or index levels) to sort by. If None, the rows are
+        sorted by their labels instead.
+    ascending : bool or list of bools
+        Whether to sort in ascending or descending order (per key).
+    ideal_num_new_partitions : int
+        The ideal number of partitions of the sorted data.
+    index_names : list of labels, optional
+        Names of the row labels levels of the frame being sorted. The partitions may
+        hold outdated names, so these are restored before the partitions are used.
+    **kwargs : dict
+        Additional sorting options (`kind`, `na_position`, `key`).
+    """
+
+    # The number of samples taken from every partition per new partition.
+    # Oversampling makes the pivots (and thus the new partitions) more balanced.
+    oversampling_factor = 16
+
+    def __init__(
+        self,
+        columns: Optional[List[Hashable]],
+        ascending,
+        ideal_num_new_partitions: int,
+        index_names: Optional[List[Hashable]] = None,
+        **kwargs: dict,
+    ):
+        self.columns = columns
+        self.ascending = ascending
+        self.ideal_num_new_partitions = ideal_num_new_partitions
+        self.index_names = index_names
+        self.kwargs = kwargs
+        self.pivots = None
+
+    @property
+    def _first_key_ascending(self):
+        """
+        Get the sort order of the key used to range-partition the data.
+
+        Returns
+        -------
+        bool
+        """
+        return self.ascending[0] if is_list_like(self.ascending) else self.ascending
+
+    def _restore_index_names(self, df):
+        """
+        Set the row labels names of the frame being sorted to the passed partition.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+            A shallow copy of `df` if the names differ, `df` itself otherwise.
+        """
+        if self.index_names is None or list(df.index.names) == list(self.index_names):
+            return df
+        df = df.copy(deep=False)
+        df.index = df.index.set_names(self.index_names)
+        return df
+
+    def _get_keys(self, df):
+        """
+        Get the values used to range-partition the rows of the passed frame.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.Series or pandas.Index
+        """
+        df = self._restore_index_names(df)
+        if self.columns is None:
+            values = df.index
+        else:
+            col = self.columns[0]
+            values = df[col] if col in df.columns else df.index.get_level_values(col)
+        key = self.kwargs.get("key", None)
+        if key is not None:
+            values = key(values)
+        return values
+
+    def sample_fn(self, partition):
+        """
+        Pick a random sample of the first sort key over the given partition.
+
+        Parameters
+        ----------
+        partition : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+            A single-column frame with the sampled values.
+        """
+        values = self._get_keys(partition)
+        values = values[~pandas.isna(values)]
+        num_samples = self.ideal_num_new_partitions * self.oversampling_factor
+        if len(values) > num_samples:
+            positions = np.random.RandomState(seed=len(values)).choice(
+                len(values), num_samples, replace=False
+            )
+            values = values.take(np.sort(positions))
+        return pandas.DataFrame({"samples": np.asarray(values)})
+
+    def pivot_fn(self, samples):
+        """
+        Pick the pivots evenly from the sorted samples.
+
+        Parameters
+        ----------
+        samples : list of pandas.DataFrame
+            Samples of every row partition.
+
+        Returns
+        -------
+        int
+            The number of new row partitions.
+        """
+        samples = pandas.concat(samples, copy=False)["samples"].to_numpy()
+        num_parts = min(self.ideal_num_new_partitions, len(samples))
+        if num_parts <= 1:
+            self.pivots = samples[:0]
+            return 1
+        samples = np.sort(samples)
+        positions = np.arange(1, num_parts) * len(samples) // num_parts
+        self.pivots = np.unique(samples[positions])
+        return len(self.pivots) + 1
+
+    def split_fn(self, partition):
+        """
+        Split the given partition into the ranges defined by the pivots.
+
+        Parameters
+        ----------
+        partition : pandas.DataFrame
+
+        Returns
+        -------
+        list of pandas.DataFrame
+            The pieces of the partition, ordered as the new row partitions are.
+        """
+        num_parts = len(self.pivots) + 1
+        if num_parts == 1:
+            return [partition]
+        values = self._get_keys(partition)
+        na_mask = np.asarray(pandas.isna(values))
+        bins = np.empty(len(values), dtype=np.intp)
+        not_na_bins = np.searchsorted(self.pivots, np.asarray(values)[~na_mask])
+        if not self._first_key_ascending:
+            not_na_bins = num_parts - 1 - not_na_bins
+        bins[~na_mask] = not_na_bins
+        bins[na_mask] = (
+            0 if self.kwargs.get("na_position", "last") == "first" else num_parts - 1
+        )
+        return split_by_bins(partition, bins, num_parts)
+
+    def sort_fn(self, df):
+        """
+        Sort a single new row partition.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        df = self._restore_index_names(df)
+        if self.columns is None:
+            return df.sort_index(ascending=self.ascending, **self.kwargs)
+        return df.sort_values(by=self.columns, ascending=self.ascending, **self.kwargs)
+
+
+class ShuffleGroupByFunctions(ShuffleSortFunctions):
+    """
+    Perform the shuffle of the partial results of a groupby aggregation.
+
+    The partial results are labeled with their group keys. The rows are range-partitioned
+    by the first level of the keys, so all partial results of a group get into the same
+    new row partition and the new row partitions follow the sorted order of the groups.
+    Categorical keys are never split.
+
+    Parameters
+    ----------
+    ideal_num_new_partitions : int
+        The ideal number of new row partitions.
+    """
+
+    def __init__(self, ideal_num_new_partitions: int):
+        super().__init__(None, True, ideal_num_new_partitions)
+
+    def _get_keys(self, df):
+        """
+        Get the first level of the group keys of the passed frame.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.Index
+        """
+        return df.index.get_level_values(0)
+
+    def sample_fn(self, partition):
+        """
+        Pick a random sample of the first level of the group keys over the given partition.
+
+        Parameters
+        ----------
+        partition : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+            A single-column frame with the sampled values.
+        """
+        index = partition.index
+        dtypes = index.dtypes if isinstance(index, pandas.MultiIndex) else [index.dtype]
+        if any(isinstance(dtype, pandas.CategoricalDtype) for dtype in dtypes):
+            # Unobserved categories get into the result of every reduce, so
+            # all of the groups have to stay in a single partition
+            return pandas.DataFrame({"samples": []})
+        return super().sample_fn(partition)
+
+    def pivot_fn(self, samples):
+        """
+        Pick the pivots evenly from the sorted samples.
+
+        Parameters
+        ----------
+        samples : list of pandas.DataFrame
+            Samples of every row partition.
+
+        Returns
+        -------
+        int
+            The number of new row partitions.
+        """
+        try:
+            return super().pivot_fn(samples)
+        except TypeError:
+            # The keys can't be ordered, keep all of the groups in a single partition
+            self.pivots = np.array([])
+            return 1
+
+
+def split_by_bins(df, bins, num_bins):
+    """
+    Split the rows of the frame into the pieces defined by the bin of every row.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    bins : np.ndarray
+        Bin number of every row of `df`.
+    num_bins : int
+        The number of bins.
+
+    Returns
+    -------
+    list of pandas.DataFrame
+        `num_bins` pieces, the rows keep their relative order within a piece.
+    """
+    order = np.argsort(bins, kind="stable")
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(bins, minlength=num_bins))])
+    shuffled = df.iloc[order]
+    return [shuffled.iloc[bounds[i] : bounds[i + 1]] for i in range(num_bins)]
+
+
+def hash_split_fn(df, columns, num_bins, position_label=None, row_offset=0):
+    """
+    Split the rows of the frame by the hash of the values of the key columns.
+
+    Rows with equal keys always get into the same piece, no matter what frame they
+    come from, as long as the key columns have the same dtypes.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    columns : list of labels
+        Labels of the key columns.
+    num_bins : int
+        The number of pieces to split the frame into.
+    position_label : hashable, optional
+        If specified, the position of every row in the whole frame is stored
+        in a new column with this label.
+    row_offset : int, default: 0
+        Position of the first row of `df` in the whole frame.
+
+    Returns
+    -------
+    list of pandas.DataFrame
+    """
+    if position_label is not None:
+        df = df.copy(deep=False)
+        df[position_label] = np.arange(row_offset, row_offset + len(df))
+    hashes = np.zeros(len(df), dtype=np.uint64)
+    for col in columns:
+        values = df[col]
+        col_hashes = pandas.util.hash_pandas_object(values, index=False).to_numpy()
+        # Missing values are equal for the join no matter how they are represented.
+        col_hashes[np.asarray(pandas.isna(values))] = 0
+        hashes = hashes * np.uint64(31) + col_hashes
+    return split_by_bins(df, (hashes % np.uint64(num_bins)).astype(np.intp), num_bins)
@@ -282,28 +282,26 @@ def string_column_to_ndarray(col: ProtocolColumn) -> Tuple[np.ndarray, Any]:
         if sentinel_val == 0:
             null_pos = _inverse_null_buf(null_pos, null_kind)
 
-    # Assemble the strings from the code units
-    str_list = [None] * col.size()
-    for i in range(col.size()):
-        # Check for missing values
-        if null_pos is not None and null_pos[i]:
-            str_list[i] = np.nan
-            continue
-
-        # Extract a range of code units
-        units = data[offsets[i] : offsets[i + 1]]
-
-        # Convert the list of code units to bytes
-        str_bytes = bytes(units)
-
-        # Create the string
-        string = str_bytes.decode(encoding="utf-8")
-
-        # Add to our list of strings
-        str_list[i] = string
-
-    # Convert the string list to a NumPy array
-    return np.asarray(str_list, dtype="object"), buffers
+    # Decode the whole data buffer in one go and cut the strings out of the decoded
+    # text, mapping byte offsets to character offsets by counting the UTF-8 lead bytes
+    # (every byte that is not a continuation byte ``0b10xxxxxx`` starts a new character)
+    first, last = int(offsets[0]), int(offsets[-1])
+    code_units = data[first:last]
+    text = code_units.tobytes().decode(encoding="utf-8")
+    is_char_start = (code_units & 0xC0) != 0x80
+    char_offsets = np.empty(len(code_units) + 1, dtype=np.int64)
+    char_offsets[0] = 0
+    np.cumsum(is_char_start, out=char_offsets[1:])
+    char_offsets = char_offsets[offsets - first]
+
+    str_arr = np.empty(col.size(), dtype="object")
+    str_arr[:] = [
+        text[start:stop] for start, stop in zip(char_offsets[:-1], char_offsets[1:])
+    ]
+    if null_pos is not None:
+        str_arr[null_pos] = np.nan
+
+    return str_arr, buffers
 
 
 def datetime_column_to_ndarray(col: ProtocolColumn) -> Tuple[np.ndarray, Any]:
@@ -449,35 +447,11 @@ def bitmask_to_bool_ndarray(
     bitmask = bitmask[bytes_to_skip:]
     first_byte_offset %= 8
 
-    bool_mask = np.zeros(mask_length, dtype=bool)
-
-    # Proccessing the first byte separately as it has its own offset
-    val = bitmask[0]
-    mask_idx = 0
-    bits_in_first_byte = min(8 - first_byte_offset, mask_length)
-    for j in range(bits_in_first_byte):
-        if val & (1 << (j + first_byte_offset)):
-            bool_mask[mask_idx] = True
-        mask_idx += 1
-
-    # `mask_length // 8` describes how many full bytes to process
-    for i in range((mask_length - bits_in_first_byte) // 8):
-        # doing `+ 1` as we already processed the first byte
-        val = bitmask[i + 1]
-        for j in range(8):
-            if val & (1 << j):
-                bool_mask[mask_idx] = True
-            mask_idx += 1
-
-    if len(bitmask) > 1:
-        # Processing reminder of last byte
-        val = bitmask[-1]
-        for j in range(len(bool_mask) - mask_idx):
-            if val & (1 << j):
-                bool_mask[mask_idx] = True
-            mask_idx += 1
-
-    return bool_mask
+    # Bits are stored in the least significant bit order
+    bool_mask = np.unpackbits(bitmask, bitorder="little")[
+        first_byte_offset : first_byte_offset + mask_length
+    ]
+    return bool_mask.astype(bool)
 
 
 def set_nulls(
@@ -134,6 +134,76 @@ class PandasDataframeAxisPartition(BaseDataframeAxisPartition):
             )
         )
 
+    def split(self, split_func, num_splits, f_args=None, f_kwargs=None):
+        """
+        Split this axis partition into `num_splits` pieces using `split_func`.
+
+        Unlike ``apply``, the pieces are defined by `split_func` itself rather than
+        by evenly sized slices of the result, which allows data-dependent (shuffle)
+        splitting of the axis partition.
+
+        Parameters
+        ----------
+        split_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            The function that splits the concatenated axis partition.
+            It must return exactly `num_splits` objects.
+        num_splits : int
+            The number of pieces `split_func` returns.
+        f_args : list or tuple, optional
+            Positional arguments to pass to `split_func`.
+        f_kwargs : dict, optional
+            Keyword arguments to pass to `split_func`.
+
+        Returns
+        -------
+        list
+            A list of `PandasDataframePartition` objects.
+        """
+        return self._wrap_partitions(
+            self.deploy_splitting_func(
+                self.axis,
+                split_func,
+                f_args or (),
+                f_kwargs or {},
+                num_splits,
+                *self.list_of_blocks,
+            )
+        )
+
+    @classmethod
+    def deploy_splitting_func(
+        cls, axis, split_func, f_args, f_kwargs, num_splits, *partitions,
+    ):
+        """
+        Deploy a splitting function along a full axis.
+
+        Parameters
+        ----------
+        axis : {0, 1}
+            The axis to concatenate the `partitions` along.
+        split_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            The function to perform.
+        f_args : list or tuple
+            Positional arguments to pass to `split_func`.
+        f_kwargs : dict
+            Keyword arguments to pass to `split_func`.
+        num_splits : int
+            The number of pieces `split_func` returns.
+        *partitions : iterable
+            All partitions that make up the full axis (row or column).
+
+        Returns
+        -------
+        list
+            A list of pandas DataFrames.
+        """
+        dataframe = pandas.concat(list(partitions), axis=axis, copy=False)
+        result = split_func(dataframe, *f_args, **f_kwargs)
+        assert (
+            len(result) == num_splits
+        ), f"Expected {num_splits} splits, got {len(result)}"
+        return result
+
     @classmethod
     def deploy_axis_func(
         cls,
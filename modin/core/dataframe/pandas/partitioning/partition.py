@@ -240,6 +240,27 @@ class PandasDataframePartition(ABC):  # pragma: no cover
         """
         pass
 
+    @classmethod
+    def put_many(cls, objs):
+        """
+        Put a batch of objects into a store and wrap them with partition objects.
+
+        Parameters
+        ----------
+        objs : list
+            Objects to be put.
+
+        Returns
+        -------
+        list
+            New `PandasDataframePartition` objects in the order of `objs`.
+
+        Notes
+        -----
+        Execution engines can override this to issue the puts concurrently.
+        """
+        return [cls.put(obj) for obj in objs]
+
     @classmethod
     def preprocess_func(cls, func):
         """
@@ -22,12 +22,21 @@ from functools import wraps
 import numpy as np
 import pandas
 from pandas._libs.lib import no_default
+from pandas.core.dtypes.common import is_numeric_dtype
 import warnings
 
 from modin.error_message import ErrorMessage
 from modin.core.storage_formats.pandas.utils import compute_chunksize
 from modin.core.dataframe.pandas.utils import concatenate
-from modin.config import NPartitions, ProgressBar, BenchmarkMode, Engine, StorageFormat
+from modin.core.dataframe.pandas.dataframe.utils import ShuffleGroupByFunctions
+from modin.config import (
+    NPartitions,
+    ProgressBar,
+    BenchmarkMode,
+    Engine,
+    StorageFormat,
+    GroupByShuffleThreshold,
+)
 from modin.logging import ClassLogger
 
 import os
@@ -210,7 +219,14 @@ class PandasDataframePartitionManager(ClassLogger, ABC):
 
     @classmethod
     def groupby_reduce(
-        cls, axis, partitions, by, map_func, reduce_func, apply_indices=None
+        cls,
+        axis,
+        partitions,
+        by,
+        map_func,
+        reduce_func,
+        apply_indices=None,
+        shuffle_reduce=False,
     ):
         """
         Groupby data using the `map_func` provided along the `axis` over the `partitions` then reduce using `reduce_func`.
@@ -228,7 +244,12 @@ class PandasDataframePartitionManager(ClassLogger, ABC):
         reduce_func : callable,
             Reduce function.
         apply_indices : list of ints, default: None
-            Indices of `axis ^ 1` to apply function over.
+            Indices of `axis ^ 1` to apply groupby over.
+        shuffle_reduce : bool, default: False
+            Whether the partial results of the map phase may be range-partitioned by
+            the group keys and reduced in several row partitions. This is done only if
+            there are many groups (see ``modin.config.GroupByShuffleThreshold``), and
+            the result then follows the sorted order of the groups.
 
         Returns
         -------
@@ -246,10 +267,52 @@ class PandasDataframePartitionManager(ClassLogger, ABC):
             )
         else:
             mapped_partitions = cls.map_partitions(partitions, map_func)
+        if (
+            shuffle_reduce
+            and axis == 0
+            and cls._has_many_groups(partitions, mapped_partitions)
+        ):
+            shuffle_functions = ShuffleGroupByFunctions(NPartitions.get())
+            return cls.shuffle_partitions(
+                mapped_partitions,
+                [0],
+                shuffle_functions,
+                # Every new row partition holds all of the columns
+                lambda df: reduce_func(df, partition_idx=0),
+            )
         return cls.map_axis_partitions(
             axis, mapped_partitions, reduce_func, enumerate_partitions=True
         )
 
+    @classmethod
+    def _has_many_groups(cls, partitions, mapped_partitions):
+        """
+        Check whether the map phase of a groupby left too many groups to reduce them in one partition.
+
+        Parameters
+        ----------
+        partitions : NumPy 2D array
+            Partitions of the grouped frame.
+        mapped_partitions : NumPy 2D array
+            Partitions with the partial results of the map phase.
+
+        Returns
+        -------
+        bool
+        """
+        if len(partitions) < 2:
+            return False
+        num_rows = sum(part.length() for part in partitions[:, 0])
+        num_partial_groups = sum(
+            cls.get_objects_from_partitions(
+                [part.apply(len) for part in mapped_partitions[:, 0]]
+            )
+        )
+        return (
+            num_rows > 0
+            and num_partial_groups * 100 >= GroupByShuffleThreshold.get() * num_rows
+        )
+
     @classmethod
     @wait_computations_if_benchmark_mode
     def broadcast_apply_select_indices(
@@ -580,6 +643,131 @@ class PandasDataframePartitionManager(ClassLogger, ABC):
             **kwargs,
         )
 
+    @classmethod
+    @wait_computations_if_benchmark_mode
+    def map_partitions_with_halo(cls, partitions, map_func, halo_size, row_lengths):
+        """
+        Apply `map_func` to every partition extended with the trailing rows of the preceding ones.
+
+        Every block is prepended with the last `halo_size` rows of the blocks above it
+        (the halo), so `map_func` can compute functions that depend on a fixed number
+        of preceding rows (sliding windows) for every block independently.
+
+        Parameters
+        ----------
+        partitions : NumPy 2D array
+            Partitions of Modin Frame.
+        map_func : callable(pandas.DataFrame, int) -> pandas.DataFrame
+            Function to apply. It takes the block with the halo and the number of
+            the halo rows, and must return the result for the block rows only.
+        halo_size : int
+            The number of preceding rows to prepend to every block.
+        row_lengths : list of ints
+            The lengths of the row partitions.
+
+        Returns
+        -------
+        NumPy array
+            An array of new partitions with the same partitioning as `partitions`.
+        """
+        preprocessed_map_func = cls.preprocess_func(map_func)
+        new_partitions = np.empty_like(partitions)
+        for row_idx in range(len(partitions)):
+            # (row partition index, number of its trailing rows to take) pairs
+            halo_parts = []
+            rows_left = halo_size
+            prev_idx = row_idx - 1
+            while rows_left > 0 and prev_idx >= 0:
+                num_rows = min(rows_left, row_lengths[prev_idx])
+                if num_rows > 0:
+                    halo_parts.append((prev_idx, num_rows))
+                rows_left -= num_rows
+                prev_idx -= 1
+            halo_parts.reverse()
+            for col_idx in range(partitions.shape[1]):
+                blocks = [
+                    partitions[idx, col_idx].mask(
+                        slice(row_lengths[idx] - num_rows, None), slice(None)
+                    )
+                    for idx, num_rows in halo_parts
+                ] + [partitions[row_idx, col_idx]]
+                axis_partition = cls._column_partitions_class(blocks)
+                new_partitions[row_idx, col_idx] = axis_partition.apply(
+                    preprocessed_map_func, halo_size - rows_left, num_splits=1
+                )[0]
+        return new_partitions
+
+    @classmethod
+    @wait_computations_if_benchmark_mode
+    def scan_partitions(
+        cls, partitions, carry_func, combine_func, scan_func, full_rows=False
+    ):
+        """
+        Compute a prefix scan (cumulative operation) over the row partitions.
+
+        The scan is done in two passes: the carry (e.g. the total) of every row
+        partition is computed in parallel, the exclusive scan of the carries is
+        computed on the driver and every row partition is then scanned locally
+        starting from the combined carry of the partitions above it.
+
+        Parameters
+        ----------
+        partitions : NumPy 2D array
+            Partitions of Modin Frame.
+        carry_func : callable(pandas.DataFrame) -> pandas.DataFrame
+            Function computing the carry of a single partition. The carry must be
+            small since all of the carries are materialized on the driver.
+        combine_func : callable(pandas.DataFrame, pandas.DataFrame) -> pandas.DataFrame
+            Function combining the accumulated carry of the preceding partitions
+            with the carry of the next one. It is executed on the driver.
+        scan_func : callable(pandas.DataFrame, pandas.DataFrame or None) -> pandas.DataFrame
+            Function scanning a single partition. It takes the partition and
+            the accumulated carry of the preceding partitions (None for the first one).
+        full_rows : bool, default: False
+            Whether the functions are applied to the full rows of every row partition
+            or to every block independently.
+
+        Returns
+        -------
+        NumPy array
+            An array of new partitions. The row partitioning is kept, if `full_rows`
+            is True every row partition holds a single block.
+        """
+        carry_func = cls.preprocess_func(carry_func)
+        scan_func = cls.preprocess_func(scan_func)
+        if full_rows:
+            axis_parts = [[row_part] for row_part in cls.row_partitions(partitions)]
+        else:
+            axis_parts = [
+                [cls._column_partitions_class([block]) for block in row]
+                for row in partitions
+            ]
+        # The carry of the last row partition is never used.
+        carries = cls.get_objects_from_partitions(
+            [
+                axis_part.apply(carry_func, num_splits=1)[0]
+                for row in axis_parts[:-1]
+                for axis_part in row
+            ]
+        )
+        num_cols = len(axis_parts[0]) if len(axis_parts) else 0
+        offsets = [None] * num_cols
+        new_partitions = []
+        for row_idx, row in enumerate(axis_parts):
+            new_partitions.append(
+                [
+                    axis_part.apply(scan_func, offset, num_splits=1)[0]
+                    for axis_part, offset in zip(row, offsets)
+                ]
+            )
+            if row_idx < len(axis_parts) - 1:
+                row_carries = carries[row_idx * num_cols : (row_idx + 1) * num_cols]
+                offsets = [
+                    carry if offset is None else combine_func(offset, carry)
+                    for offset, carry in zip(offsets, row_carries)
+                ]
+        return np.array(new_partitions)
+
     @classmethod
     def concat(cls, axis, left_parts, right_parts):
         """
@@ -705,13 +893,7 @@ class PandasDataframePartitionManager(ClassLogger, ABC):
             A NumPy array with partitions (with dimensions or not).
         """
 
-        def update_bar(pbar, f):
-            if ProgressBar.get():
-                pbar.update(1)
-            return f
-
         num_splits = NPartitions.get()
-        put_func = cls._partition_class.put
         row_chunksize = compute_chunksize(df.shape[0], num_splits)
         col_chunksize = compute_chunksize(df.shape[1], num_splits)
 
@@ -738,15 +920,19 @@ class PandasDataframePartitionManager(ClassLogger, ABC):
             )
         else:
             pbar = None
+        row_starts = range(0, len(df), row_chunksize)
+        col_starts = range(0, len(df.columns), col_chunksize)
+        blocks = cls._split_pandas_frame(
+            df, row_starts, row_chunksize, col_starts, col_chunksize
+        )
+        # Hand all the blocks to the engine at once so that it can put them
+        # into the object store concurrently
+        put_parts = cls._partition_class.put_many(blocks)
+        if ProgressBar.get():
+            pbar.update(len(put_parts))
         parts = [
-            [
-                update_bar(
-                    pbar,
-                    put_func(df.iloc[i : i + row_chunksize, j : j + col_chunksize]),
-                )
-                for j in range(0, len(df.columns), col_chunksize)
-            ]
-            for i in range(0, len(df), row_chunksize)
+            put_parts[i * len(col_starts) : (i + 1) * len(col_starts)]
+            for i in range(len(row_starts))
         ]
         if ProgressBar.get():
             pbar.close()
@@ -767,6 +953,99 @@ class PandasDataframePartitionManager(ClassLogger, ABC):
             ]
             return np.array(parts), row_lengths, col_widths
 
+    @classmethod
+    def from_pandas_chunks(cls, dfs):
+        """
+        Return the partitions from pandas DataFrames holding consecutive row chunks.
+
+        Every chunk becomes a row of partitions, neighbouring chunks are only
+        combined when there are more of them than ``NPartitions``.
+
+        Parameters
+        ----------
+        dfs : list of pandas.DataFrame
+            Non-empty list of row chunks sharing the same columns.
+
+        Returns
+        -------
+        (np.ndarray, row_lengths, col_widths)
+            A NumPy array with partitions and their dimensions.
+        """
+        num_splits = NPartitions.get()
+        dfs = [df for df in dfs if len(df) > 0] or dfs[:1]
+        if len(dfs) > num_splits:
+            chunksize = compute_chunksize(len(dfs), num_splits)
+            dfs = [
+                pandas.concat(dfs[i : i + chunksize], axis=0, copy=False)
+                for i in range(0, len(dfs), chunksize)
+            ]
+        num_cols = len(dfs[0].columns)
+        col_chunksize = compute_chunksize(num_cols, num_splits)
+        col_starts = range(0, num_cols, col_chunksize)
+        blocks = [
+            block
+            for df in dfs
+            for block in cls._split_pandas_frame(
+                df, [0], len(df), col_starts, col_chunksize
+            )
+        ]
+        put_parts = cls._partition_class.put_many(blocks)
+        parts = [
+            put_parts[i * len(col_starts) : (i + 1) * len(col_starts)]
+            for i in range(len(dfs))
+        ]
+        row_lengths = [len(df) for df in dfs]
+        col_widths = [min(col_chunksize, num_cols - j) for j in col_starts]
+        return np.array(parts), row_lengths, col_widths
+
+    @staticmethod
+    def _split_pandas_frame(df, row_starts, row_chunksize, col_starts, col_chunksize):
+        """
+        Slice a pandas DataFrame into a flat, row-major list of blocks.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            DataFrame to slice.
+        row_starts : range
+            Positions of the first row of every row block.
+        row_chunksize : int
+            Number of rows in a block.
+        col_starts : range
+            Positions of the first column of every column block.
+        col_chunksize : int
+            Number of columns in a block.
+
+        Returns
+        -------
+        list of pandas.DataFrame
+
+        Notes
+        -----
+        Frames holding a single numeric NumPy dtype are sliced as views over
+        one 2D array, so building the blocks does not copy the data of `df`.
+        """
+        dtypes = set(df.dtypes)
+        if len(dtypes) == 1 and all(
+            isinstance(dtype, np.dtype) and is_numeric_dtype(dtype) for dtype in dtypes
+        ):
+            values = df.to_numpy()
+            return [
+                pandas.DataFrame(
+                    values[i : i + row_chunksize, j : j + col_chunksize],
+                    index=df.index[i : i + row_chunksize],
+                    columns=df.columns[j : j + col_chunksize],
+                    copy=False,
+                )
+                for i in row_starts
+                for j in col_starts
+            ]
+        return [
+            df.iloc[i : i + row_chunksize, j : j + col_chunksize]
+            for i in row_starts
+            for j in col_starts
+        ]
+
     @classmethod
     def from_arrow(cls, at, return_dims=False):
         """
@@ -1327,6 +1606,136 @@ class PandasDataframePartitionManager(ClassLogger, ABC):
             ]
         )
 
+    @classmethod
+    @wait_computations_if_benchmark_mode
+    def shuffle_partitions(
+        cls, partitions, index, shuffle_functions, final_shuffle_func
+    ):
+        """
+        Return shuffled partitions.
+
+        Every row partition is sampled, the samples are used to pick the pivots,
+        every row partition is then split into pieces defined by the pivots and
+        the pieces that belong to the same new row partition are combined by
+        `final_shuffle_func`.
+
+        Parameters
+        ----------
+        partitions : np.ndarray
+            The 2-d array of partitions to shuffle.
+        index : list of ints
+            Indices of the column partitions that hold the data the samples are
+            taken from.
+        shuffle_functions : ShuffleFunctions
+            An object implementing the functions to use for the shuffle.
+        final_shuffle_func : callable(pandas.DataFrame) -> pandas.DataFrame
+            Function that is applied to every new row partition.
+
+        Returns
+        -------
+        np.ndarray
+            A 2-d NumPy array of the shuffled partitions, each new row partition
+            holding a single block.
+        """
+        sample_func = cls.preprocess_func(shuffle_functions.sample_fn)
+        samples = [
+            row_part.apply(sample_func, num_splits=1)[0]
+            for row_part in cls.row_partitions(partitions[:, index])
+        ]
+        num_bins = shuffle_functions.pivot_fn(cls.get_objects_from_partitions(samples))
+        split_row_partitions = cls.split_row_partitions(
+            partitions, shuffle_functions.split_fn, num_bins
+        )
+        return cls.combine_split_partitions(split_row_partitions, final_shuffle_func)
+
+    @classmethod
+    def split_row_partitions(
+        cls, partitions, split_func, num_splits, split_kwargs=None
+    ):
+        """
+        Split every row partition into `num_splits` pieces using `split_func`.
+
+        Parameters
+        ----------
+        partitions : np.ndarray
+            The 2-d array of partitions to split.
+        split_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            The function that splits a row partition. It must return exactly
+            `num_splits` objects.
+        num_splits : int
+            The number of pieces every row partition is split into.
+        split_kwargs : list of dicts, optional
+            Keyword arguments to pass to `split_func`, one dictionary per row partition.
+
+        Returns
+        -------
+        np.ndarray
+            A 2-d NumPy array of the pieces, the i-th row of the array holds
+            the i-th pieces of every row partition.
+        """
+        split_func = cls.preprocess_func(split_func)
+        row_partitions = cls.row_partitions(partitions)
+        if split_kwargs is None:
+            split_kwargs = [None] * len(row_partitions)
+        return np.array(
+            [
+                row_part.split(split_func, num_splits=num_splits, f_kwargs=kwargs)
+                for row_part, kwargs in zip(row_partitions, split_kwargs)
+            ]
+        ).T
+
+    @classmethod
+    @wait_computations_if_benchmark_mode
+    def combine_split_partitions(
+        cls, pieces, func, other_pieces=None, func_kwargs=None
+    ):
+        """
+        Combine the pieces of every new row partition and apply `func` to them.
+
+        Parameters
+        ----------
+        pieces : np.ndarray
+            The 2-d array of pieces from ``split_row_partitions``.
+        func : callable(pandas.DataFrame) -> pandas.DataFrame
+            Function to apply to every new row partition. If `other_pieces` is
+            specified, the function takes the row partition of the other frame
+            as the second argument.
+        other_pieces : np.ndarray or list of lists, optional
+            The pieces of the other frame split into the same number of pieces.
+        func_kwargs : list of dicts, optional
+            Keyword arguments to pass to `func`, one dictionary per new row partition.
+
+        Returns
+        -------
+        np.ndarray
+            A 2-d NumPy array of the new row partitions, each holding a single block.
+        """
+        func = cls.preprocess_func(func)
+        if func_kwargs is None:
+            func_kwargs = [{}] * len(pieces)
+        if other_pieces is None:
+            return np.array(
+                [
+                    cls._column_partitions_class(row_pieces).apply(
+                        func, num_splits=1, **kwargs
+                    )
+                    for row_pieces, kwargs in zip(pieces, func_kwargs)
+                ]
+            )
+        return np.array(
+            [
+                cls._column_partitions_class(row_pieces).apply(
+                    func,
+                    num_splits=1,
+                    other_axis_partition=cls._column_partitions_class(other_row_pieces),
+                    **kwargs,
+                )
+                for row_pieces, other_row_pieces, kwargs in zip(
+                    pieces, other_pieces, func_kwargs
+                )
+            ]
+        )
+
     @classmethod
     def finalize(cls, partitions):
         """
@@ -1342,7 +1751,7 @@ class PandasDataframePartitionManager(ClassLogger, ABC):
     @classmethod
     def rebalance_partitions(cls, partitions):
         """
-        Rebalance a 2-d array of partitions if we are using ``PandasOnRay`` or ``PandasOnDask`` executions.
+        Rebalance a 2-d array of partitions if we are using ``PandasOnRay``, ``PandasOnDask`` or ``PandasOnThreads`` executions.
 
         For all other executions, the partitions are returned unchanged.
 
@@ -1365,8 +1774,12 @@ class PandasDataframePartitionManager(ClassLogger, ABC):
         list[int] or None
             Row lengths if possible to compute it.
         """
-        if Engine.get() in ["Ray", "Dask"] and StorageFormat.get() == "Pandas":
-            # Rebalancing partitions is currently only implemented for PandasOnRay and PandasOnDask.
+        if (
+            Engine.get() in ["Ray", "Dask", "Threads"]
+            and StorageFormat.get() == "Pandas"
+        ):
+            # Rebalancing partitions is currently only implemented for PandasOnRay,
+            # PandasOnDask and PandasOnThreads.
             # We rebalance when the ratio of the number of existing partitions to
             # the ideal number of partitions is larger than this threshold. The
             # threshold is a heuristic that may need to be tuned for performance.
@@ -14,6 +14,9 @@
 
 """Collection of utility functions for the PandasDataFrame."""
 
+from functools import wraps
+
+import numpy as np
 import pandas
 from pandas.api.types import union_categoricals
 
@@ -44,3 +47,125 @@ def concatenate(dfs):
                 df.iloc[:, i], categories=union.categories
             )
     return pandas.concat(dfs)
+
+
+def _get_buffers(obj):
+    """
+    Get the NumPy arrays holding the values of a pandas object.
+
+    Parameters
+    ----------
+    obj : pandas.DataFrame or pandas.Series
+        Object to get the arrays of.
+
+    Yields
+    ------
+    np.ndarray
+    """
+    for values in obj._mgr.arrays:
+        if isinstance(values, np.ndarray):
+            yield values
+            continue
+        # Extension arrays backed by NumPy arrays (categorical, datetime, masked)
+        for attr in ("_ndarray", "_data", "_mask"):
+            buffer = getattr(values, attr, None)
+            if isinstance(buffer, np.ndarray):
+                yield buffer
+
+
+def freeze(obj):
+    """
+    Make the values of a pandas object read-only.
+
+    Parameters
+    ----------
+    obj : object
+        Object to freeze. Lists and tuples are frozen element-wise, objects
+        other than pandas DataFrames and Series are left untouched.
+
+    Returns
+    -------
+    object
+        The same `obj`.
+
+    Notes
+    -----
+    Writing to the values of a frozen object raises ``ValueError``, which lets
+    ``copy_on_write`` detect the functions mutating their arguments.
+    """
+    if isinstance(obj, (pandas.DataFrame, pandas.Series)):
+        for buffer in _get_buffers(obj):
+            buffer.flags.writeable = False
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            freeze(item)
+    return obj
+
+
+def _copy_pandas_objects(args, kwargs, deep):
+    """
+    Copy the pandas objects among the arguments of a function.
+
+    Parameters
+    ----------
+    args : list or tuple
+        Positional arguments.
+    kwargs : dict
+        Keyword arguments.
+    deep : bool
+        Whether to copy the values of the objects or only their metadata.
+
+    Returns
+    -------
+    tuple
+        A pair of the copied positional and keyword arguments.
+    """
+
+    def copy(obj):
+        if isinstance(obj, (pandas.DataFrame, pandas.Series)):
+            return obj.copy(deep=deep)
+        return obj
+
+    return [copy(arg) for arg in args], {
+        key: copy(value) for key, value in kwargs.items()
+    }
+
+
+def copy_on_write(func):
+    """
+    Make `func` copy the values of its pandas arguments only if it writes to them.
+
+    The function is called with shallow copies of its pandas arguments first, so
+    it can freely change their labels but shares the values with the originals.
+    If it fails to write to the values because they are frozen, it is called
+    again with deep copies of the arguments.
+
+    Parameters
+    ----------
+    func : callable
+        Function to wrap.
+
+    Returns
+    -------
+    callable
+
+    Notes
+    -----
+    Only the writes to the values made read-only by ``freeze`` are detected,
+    a function mutating its arguments this way must not have side effects
+    other than its result, as it can be called twice.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        shallow_args, shallow_kwargs = _copy_pandas_objects(args, kwargs, deep=False)
+        try:
+            return func(*shallow_args, **shallow_kwargs)
+        except ValueError as err:
+            # Both NumPy and Cython buffers report writes to frozen values this way
+            if "read-only" not in str(err):
+                raise
+        deep_args, deep_kwargs = _copy_pandas_objects(args, kwargs, deep=True)
+        return func(*deep_args, **deep_kwargs)
+
+    return wrapper
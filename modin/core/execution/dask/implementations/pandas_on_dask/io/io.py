@@ -67,3 +67,8 @@ class PandasOnDaskIO(BaseIO):
     read_excel = type(
         "", (DaskWrapper, PandasExcelParser, ExcelDispatcher), build_args
     ).read
+    to_csv = type("", (DaskWrapper, PandasCSVParser, CSVDispatcher), build_args).write
+    to_parquet = type(
+        "", (DaskWrapper, PandasParquetParser, ParquetDispatcher), build_args
+    ).write
+    to_sql = type("", (DaskWrapper, PandasSQLParser, SQLDispatcher), build_args).write
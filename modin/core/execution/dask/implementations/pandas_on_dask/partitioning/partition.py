@@ -239,6 +239,29 @@ class PandasOnDaskDataframePartition(PandasDataframePartition):
         """
         return cls(DaskWrapper.put(obj, hash=False), len(obj.index), len(obj.columns))
 
+    @classmethod
+    def put_many(cls, objs):
+        """
+        Scatter a batch of objects to the workers in a single call.
+
+        Parameters
+        ----------
+        objs : list
+            Objects to be put.
+
+        Returns
+        -------
+        list
+            New ``PandasOnDaskDataframePartition`` objects in the order of `objs`.
+        """
+        if len(objs) == 0:
+            return []
+        futures = DaskWrapper.put(list(objs), hash=False)
+        return [
+            cls(future, len(obj.index), len(obj.columns))
+            for future, obj in zip(futures, objs)
+        ]
+
     @classmethod
     def preprocess_func(cls, func):
         """
@@ -206,6 +206,48 @@ class PandasOnDaskDataframeVirtualPartition(PandasDataframeAxisPartition):
             pure=False,
         )
 
+    @classmethod
+    def deploy_splitting_func(
+        cls, axis, split_func, f_args, f_kwargs, num_splits, *partitions,
+    ):
+        """
+        Deploy a splitting function along a full axis.
+
+        Parameters
+        ----------
+        axis : {0, 1}
+            The axis to concatenate the `partitions` along.
+        split_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            The function to perform.
+        f_args : list or tuple
+            Positional arguments to pass to `split_func`.
+        f_kwargs : dict
+            Keyword arguments to pass to `split_func`.
+        num_splits : int
+            The number of pieces `split_func` returns.
+        *partitions : iterable
+            All partitions that make up the full axis (row or column).
+
+        Returns
+        -------
+        list
+            A list of distributed.Future.
+        """
+        return DaskWrapper.deploy(
+            func=deploy_dask_func,
+            f_args=(
+                PandasDataframeAxisPartition.deploy_splitting_func,
+                axis,
+                split_func,
+                f_args,
+                f_kwargs,
+                num_splits,
+                *partitions,
+            ),
+            num_returns=num_splits * 4,
+            pure=False,
+        )
+
     @classmethod
     def deploy_func_between_two_axis_partitions(
         cls,
@@ -340,6 +382,32 @@ class PandasOnDaskDataframeVirtualPartition(PandasDataframeAxisPartition):
             # If this is a full axis partition, just take out the single split in the result.
             return result[0]
 
+    def split(self, split_func, num_splits, f_args=None, f_kwargs=None):
+        """
+        Split this axis partition into `num_splits` pieces using `split_func`.
+
+        Parameters
+        ----------
+        split_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            The function that splits the concatenated axis partition.
+        num_splits : int
+            The number of pieces `split_func` returns.
+        f_args : list or tuple, optional
+            Positional arguments to pass to `split_func`.
+        f_kwargs : dict, optional
+            Keyword arguments to pass to `split_func`.
+
+        Returns
+        -------
+        list
+            A list of ``PandasOnDaskDataframePartition`` objects.
+        """
+        if len(self.call_queue) > 0:
+            self.drain_call_queue()
+        return super(PandasOnDaskDataframeVirtualPartition, self).split(
+            split_func, num_splits, f_args=f_args, f_kwargs=f_kwargs
+        )
+
     def force_materialization(self, get_ip=False):
         """
         Materialize partitions into a single partition.
@@ -23,7 +23,7 @@ import warnings
 import typing
 import re
 
-from modin.config import Engine
+from modin.config import Engine, StorageFormat
 from modin.utils import _inherit_docstrings
 from modin.core.io import BaseIO
 from pandas.util._decorators import doc
@@ -469,36 +469,42 @@ class PandasOnDaskFactory(BaseFactory):
         cls.io_cls = PandasOnDaskIO
 
 
+@doc(_doc_factory_class, execution_name="PandasOnThreads")
+class PandasOnThreadsFactory(BaseFactory):
+    @classmethod
+    @doc(_doc_factory_prepare_method, io_module_name="``PandasOnThreadsIO``")
+    def prepare(cls):
+        from modin.core.execution.threads.implementations.pandas_on_threads.io import (
+            PandasOnThreadsIO,
+        )
+
+        cls.io_cls = PandasOnThreadsIO
+
+
 @doc(_doc_abstract_factory_class, role="experimental")
 class ExperimentalBaseFactory(BaseFactory):
     @classmethod
     @_inherit_docstrings(BaseFactory._read_sql)
     def _read_sql(cls, **kwargs):
-        if Engine.get() != "Ray":
-            if "partition_column" in kwargs:
-                if kwargs["partition_column"] is not None:
-                    warnings.warn(
-                        "Distributed read_sql() was only implemented for Ray engine."
-                    )
-                del kwargs["partition_column"]
-            if "lower_bound" in kwargs:
-                if kwargs["lower_bound"] is not None:
+        # Distributed reading is implemented by the experimental IO for Ray and
+        # by the SQL dispatcher of the pandas storage format for Dask and Threads
+        if StorageFormat.get() != "Pandas" or Engine.get() not in (
+            "Ray",
+            "Dask",
+            "Threads",
+        ):
+            distributed_args = (
+                "partition_column",
+                "lower_bound",
+                "upper_bound",
+                "max_sessions",
+            )
+            for arg in distributed_args:
+                if kwargs.pop(arg, None) is not None:
                     warnings.warn(
-                        "Distributed read_sql() was only implemented for Ray engine."
+                        "Distributed read_sql() is only implemented for Ray, "
+                        + "Dask and Threads engines."
                     )
-                del kwargs["lower_bound"]
-            if "upper_bound" in kwargs:
-                if kwargs["upper_bound"] is not None:
-                    warnings.warn(
-                        "Distributed read_sql() was only implemented for Ray engine."
-                    )
-                del kwargs["upper_bound"]
-            if "max_sessions" in kwargs:
-                if kwargs["max_sessions"] is not None:
-                    warnings.warn(
-                        "Distributed read_sql() was only implemented for Ray engine."
-                    )
-                del kwargs["max_sessions"]
         return cls.io_cls.read_sql(**kwargs)
 
 
@@ -560,6 +566,13 @@ class ExperimentalPandasOnDaskFactory(ExperimentalBaseFactory, PandasOnDaskFacto
     pass
 
 
+@doc(_doc_factory_class, execution_name="experimental PandasOnThreads")
+class ExperimentalPandasOnThreadsFactory(
+    ExperimentalBaseFactory, PandasOnThreadsFactory
+):
+    pass
+
+
 @doc(_doc_factory_class, execution_name="experimental PandasOnPython")
 class ExperimentalPandasOnPythonFactory(ExperimentalBaseFactory, PandasOnPythonFactory):
     pass
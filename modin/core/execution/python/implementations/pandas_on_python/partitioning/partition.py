@@ -14,6 +14,7 @@
 """The module defines interface for a partition with pandas storage format and Python engine."""
 
 from modin.core.dataframe.pandas.partitioning.partition import PandasDataframePartition
+from modin.core.dataframe.pandas.utils import copy_on_write, freeze
 
 
 class PandasOnPythonDataframePartition(PandasDataframePartition):
@@ -39,10 +40,15 @@ class PandasOnPythonDataframePartition(PandasDataframePartition):
     -----
     Objects of this class are treated as immutable by partition manager
     subclasses. There is no logic for updating in-place.
+
+    The partition takes the ownership of `data` and makes its values read-only,
+    so the partitions and the functions applied to them share the values
+    without copying. A function writing to the values gets its own copy of
+    them (see ``modin.core.dataframe.pandas.utils.copy_on_write``).
     """
 
     def __init__(self, data, length=None, width=None, call_queue=None):
-        self._data = data
+        self._data = freeze(data)
         if call_queue is None:
             call_queue = []
         self.call_queue = call_queue
@@ -51,19 +57,21 @@ class PandasOnPythonDataframePartition(PandasDataframePartition):
 
     def get(self):
         """
-        Flush the `call_queue` and return copy of the data.
+        Flush the `call_queue` and return the data.
 
         Returns
         -------
         pandas.DataFrame
-            Copy of DataFrame that was wrapped by this partition.
+            DataFrame that was wrapped by this partition.
 
         Notes
         -----
-        Since this object is a simple wrapper, just return the copy of data.
+        Since this object is a simple wrapper, just return the data. Its values
+        are read-only, the same way as the data got from the object stores
+        of the distributed engines.
         """
         self.drain_call_queue()
-        return self._data.copy() if hasattr(self._data, "copy") else self._data
+        return self._data
 
     def apply(self, func, *args, **kwargs):
         """
@@ -86,7 +94,7 @@ class PandasOnPythonDataframePartition(PandasDataframePartition):
 
         def call_queue_closure(data, call_queue):
             """
-            Apply callables from `call_queue` on copy of the `data` and return the result.
+            Apply callables from `call_queue` on the `data` and return the result.
 
             Parameters
             ----------
@@ -99,19 +107,19 @@ class PandasOnPythonDataframePartition(PandasDataframePartition):
             -------
             pandas.DataFrame or pandas.Series
             """
-            result = data.copy()
+            result = data
             for func, f_args, f_kwargs in call_queue:
                 try:
-                    result = func(result, *f_args, **f_kwargs)
+                    result = copy_on_write(func)(result, *f_args, **f_kwargs)
                 except Exception as err:
                     self.call_queue = []
                     raise err
             return result
 
-        self._data = call_queue_closure(self._data, self.call_queue)
+        self._data = freeze(call_queue_closure(self._data, self.call_queue))
         self.call_queue = []
         return PandasOnPythonDataframePartition(
-            func(self._data.copy(), *args, **kwargs)
+            copy_on_write(func)(self._data, *args, **kwargs)
         )
 
     def add_to_apply_calls(self, func, *args, length=None, width=None, **kwargs):
@@ -137,7 +145,7 @@ class PandasOnPythonDataframePartition(PandasDataframePartition):
             New ``PandasOnPythonDataframePartition`` object with extended call queue.
         """
         return PandasOnPythonDataframePartition(
-            self._data.copy(),
+            self._data,
             call_queue=self.call_queue + [[func, args, kwargs]],
             length=length,
             width=width,
@@ -172,6 +180,7 @@ class PandasOnPythonDataframePartition(PandasDataframePartition):
         PandasOnPythonDataframePartition
             New ``PandasOnPythonDataframePartition`` object.
         """
+        # The partition makes the values of its data read-only, so it needs its own copy
         return cls(obj.copy())
 
     @classmethod
@@ -18,6 +18,7 @@ import pandas
 from modin.core.dataframe.pandas.partitioning.axis_partition import (
     PandasDataframeAxisPartition,
 )
+from modin.core.dataframe.pandas.utils import copy_on_write
 from .partition import PandasOnPythonDataframePartition
 
 
@@ -46,6 +47,53 @@ class PandasOnPythonDataframeAxisPartition(PandasDataframeAxisPartition):
     partition_type = PandasOnPythonDataframePartition
     instance_type = pandas.DataFrame
 
+    def apply(self, func, *args, **kwargs):
+        """
+        Apply a function to this axis partition along full axis.
+
+        Parameters
+        ----------
+        func : callable
+            The function to apply.
+        *args : iterable
+            Positional arguments to pass to ``PandasDataframeAxisPartition.apply``.
+        **kwargs : dict
+            Keyword arguments to pass to ``PandasDataframeAxisPartition.apply``.
+
+        Returns
+        -------
+        list
+            A list of ``PandasOnPythonDataframePartition`` objects.
+
+        Notes
+        -----
+        The blocks are concatenated without copying, so `func` is made to copy
+        the values only if it writes to them.
+        """
+        return super().apply(copy_on_write(func), *args, **kwargs)
+
+    def split(self, split_func, num_splits, f_args=None, f_kwargs=None):
+        """
+        Split this axis partition into `num_splits` pieces using `split_func`.
+
+        Parameters
+        ----------
+        split_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            The function that splits the concatenated axis partition.
+        num_splits : int
+            The number of pieces `split_func` returns.
+        f_args : list or tuple, optional
+            Positional arguments to pass to `split_func`.
+        f_kwargs : dict, optional
+            Keyword arguments to pass to `split_func`.
+
+        Returns
+        -------
+        list
+            A list of ``PandasOnPythonDataframePartition`` objects.
+        """
+        return super().split(copy_on_write(split_func), num_splits, f_args, f_kwargs)
+
 
 class PandasOnPythonDataframeColumnPartition(PandasOnPythonDataframeAxisPartition):
     """
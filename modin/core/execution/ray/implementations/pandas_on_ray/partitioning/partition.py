@@ -13,6 +13,7 @@
 
 """Module houses class that wraps data (block partition) and its metadata."""
 
+from concurrent.futures import ThreadPoolExecutor
 import ray
 from ray.util import get_node_ip_address
 import uuid
@@ -22,6 +23,7 @@ from modin.core.execution.ray.common import RayWrapper
 from modin.core.dataframe.pandas.partitioning.partition import PandasDataframePartition
 from modin.pandas.indexing import compute_sliced_len
 from modin.logging import get_logger
+from modin.config import CpuCount
 
 compute_sliced_len = ray.remote(compute_sliced_len)
 
@@ -276,6 +278,28 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
             ray.put(obj), len(obj.index), len(obj.columns)
         )
 
+    @classmethod
+    def put_many(cls, objs):
+        """
+        Put a batch of objects into Plasma store from several threads.
+
+        Parameters
+        ----------
+        objs : list
+            Objects to be put.
+
+        Returns
+        -------
+        list
+            New ``PandasOnRayDataframePartition`` objects in the order of `objs`.
+        """
+        if len(objs) < 2:
+            return [cls.put(obj) for obj in objs]
+        # The serialization of large blocks mostly copies memory without
+        # holding the GIL, so the puts can overlap
+        with ThreadPoolExecutor(max_workers=min(len(objs), CpuCount.get())) as pool:
+            return list(pool.map(cls.put, objs))
+
     @classmethod
     def preprocess_func(cls, func):
         """
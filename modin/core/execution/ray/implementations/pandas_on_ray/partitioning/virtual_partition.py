@@ -26,6 +26,7 @@ from modin.utils import _inherit_docstrings
 
 
 _DEPLOY_AXIS_FUNC = ray.put(PandasDataframeAxisPartition.deploy_axis_func)
+_DEPLOY_SPLITTING_FUNC = ray.put(PandasDataframeAxisPartition.deploy_splitting_func)
 _DRAIN = ray.put(PandasDataframeAxisPartition.drain)
 
 
@@ -209,6 +210,43 @@ class PandasOnRayDataframeVirtualPartition(PandasDataframeAxisPartition):
             lengths=lengths,
         )
 
+    @classmethod
+    def deploy_splitting_func(
+        cls, axis, split_func, f_args, f_kwargs, num_splits, *partitions,
+    ):
+        """
+        Deploy a splitting function along a full axis.
+
+        Parameters
+        ----------
+        axis : {0, 1}
+            The axis to concatenate the `partitions` along.
+        split_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            The function to perform.
+        f_args : list or tuple
+            Positional arguments to pass to `split_func`.
+        f_kwargs : dict
+            Keyword arguments to pass to `split_func`.
+        num_splits : int
+            The number of pieces `split_func` returns.
+        *partitions : iterable
+            All partitions that make up the full axis (row or column).
+
+        Returns
+        -------
+        list
+            A list of ``ray.ObjectRef``-s.
+        """
+        return deploy_ray_func.options(num_returns=num_splits * 4).remote(
+            _DEPLOY_SPLITTING_FUNC,
+            axis,
+            split_func,
+            f_args,
+            f_kwargs,
+            num_splits,
+            *partitions,
+        )
+
     @classmethod
     def deploy_func_between_two_axis_partitions(
         cls,
@@ -353,6 +391,32 @@ class PandasOnRayDataframeVirtualPartition(PandasDataframeAxisPartition):
             # If this is a full axis partition, just take out the single split in the result.
             return result[0]
 
+    def split(self, split_func, num_splits, f_args=None, f_kwargs=None):
+        """
+        Split this axis partition into `num_splits` pieces using `split_func`.
+
+        Parameters
+        ----------
+        split_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            The function that splits the concatenated axis partition.
+        num_splits : int
+            The number of pieces `split_func` returns.
+        f_args : list or tuple, optional
+            Positional arguments to pass to `split_func`.
+        f_kwargs : dict, optional
+            Keyword arguments to pass to `split_func`.
+
+        Returns
+        -------
+        list
+            A list of ``PandasOnRayDataframePartition`` objects.
+        """
+        if len(self.call_queue) > 0:
+            self.drain_call_queue()
+        return super(PandasOnRayDataframeVirtualPartition, self).split(
+            split_func, num_splits, f_args=f_args, f_kwargs=f_kwargs
+        )
+
     def force_materialization(self, get_ip=False):
         """
         Materialize partitions into a single partition.
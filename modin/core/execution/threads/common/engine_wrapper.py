@@ -0,0 +1,172 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""
+Module houses class responsible for execution of remote operations.
+
+Remote operations run in a pool of threads of the driver process. The objects
+they produce stay in the memory of the process, so the workers read them
+directly without any serialization, and ``concurrent.futures.Future`` objects
+play the role of references to them.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from modin.config import CpuCount
+
+
+class ThreadsWrapper:
+    """The class responsible for execution of remote operations."""
+
+    _pool = None
+
+    @classmethod
+    def get_pool(cls):
+        """
+        Get the pool of the worker threads, creating it on the first call.
+
+        Returns
+        -------
+        concurrent.futures.ThreadPoolExecutor
+        """
+        if cls._pool is None:
+            cls._pool = ThreadPoolExecutor(
+                max_workers=CpuCount.get(), thread_name_prefix="modin-worker"
+            )
+        return cls._pool
+
+    @classmethod
+    def deploy(cls, func, f_args=None, f_kwargs=None, num_returns=1):
+        """
+        Run a function in a worker thread.
+
+        Parameters
+        ----------
+        func : callable
+            Function to be run in a worker thread.
+        f_args : list or tuple, optional
+            Positional arguments to pass to ``func``. Futures are replaced
+            with their results before the call.
+        f_kwargs : dict, optional
+            Keyword arguments to pass to ``func``. Futures are replaced
+            with their results before the call.
+        num_returns : int, default: 1
+            The number of returned objects.
+
+        Returns
+        -------
+        concurrent.futures.Future or list
+            The future of the ``func`` result or a list of futures of its parts
+            in accordance with ``num_returns``.
+        """
+        # The callers are free to reuse the containers of the arguments once the task
+        # is submitted, so the task gets its own copies of them
+        args = [] if f_args is None else list(f_args)
+        kwargs = {} if f_kwargs is None else dict(f_kwargs)
+        future = cls.get_pool().submit(_run_task, func, args, kwargs)
+        if num_returns == 1:
+            return future
+
+        parts = [Future() for _ in range(num_returns)]
+
+        def split_result(future):
+            error = future.exception()
+            for i, part in enumerate(parts):
+                if error is None:
+                    part.set_result(future.result()[i])
+                else:
+                    part.set_exception(error)
+
+        future.add_done_callback(split_result)
+        return parts
+
+    @classmethod
+    def materialize(cls, future):
+        """
+        Get the objects matching `future`, waiting for their computation.
+
+        Parameters
+        ----------
+        future : concurrent.futures.Future or list
+            Future object or list of future objects whereby data needs to be materialized.
+
+        Returns
+        -------
+        Any
+            An object(s) matching the future(s).
+        """
+        if isinstance(future, list):
+            return [cls.materialize(obj) for obj in future]
+        return future.result() if isinstance(future, Future) else future
+
+    @classmethod
+    def put(cls, data, **kwargs):
+        """
+        Wrap data into a resolved future.
+
+        Parameters
+        ----------
+        data : object
+            Data to wrap.
+        **kwargs : dict
+            Ignored, accepted for compatibility with the other engine wrappers.
+
+        Returns
+        -------
+        concurrent.futures.Future
+        """
+        future = Future()
+        future.set_result(data)
+        return future
+
+    @classmethod
+    def wait(cls, futures):
+        """
+        Wait for the computation of `futures` without getting their results.
+
+        Parameters
+        ----------
+        futures : list
+            List of ``concurrent.futures.Future``.
+        """
+        wait([obj for obj in futures if isinstance(obj, Future)])
+
+
+def _run_task(func, args, kwargs):
+    """
+    Call `func` with the futures among its arguments replaced by their results.
+
+    Parameters
+    ----------
+    func : callable
+        Function to call.
+    args : list or tuple
+        Positional arguments to pass to `func`.
+    kwargs : dict
+        Keyword arguments to pass to `func`.
+
+    Returns
+    -------
+    object
+        The result of `func`.
+
+    Notes
+    -----
+    Only the top-level arguments are resolved, the same way as remote
+    functions in Ray. Tasks never wait for the futures submitted after them,
+    so the pool, taking the tasks in their submission order, can not deadlock
+    on the dependencies.
+    """
+    args = [ThreadsWrapper.materialize(arg) for arg in args]
+    kwargs = {key: ThreadsWrapper.materialize(value) for key, value in kwargs.items()}
+    return func(*args, **kwargs)
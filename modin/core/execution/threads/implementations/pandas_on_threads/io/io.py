@@ -0,0 +1,82 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Module houses class that implements ``BaseIO`` using the thread pool as an execution engine."""
+
+from modin.core.io import BaseIO
+from modin.core.storage_formats.pandas.query_compiler import PandasQueryCompiler
+from modin.core.execution.threads.implementations.pandas_on_threads.dataframe.dataframe import (
+    PandasOnThreadsDataframe,
+)
+from modin.core.execution.threads.implementations.pandas_on_threads.partitioning.partition import (
+    PandasOnThreadsDataframePartition,
+)
+from modin.core.io import (
+    CSVDispatcher,
+    JSONDispatcher,
+    ParquetDispatcher,
+    FeatherDispatcher,
+    SQLDispatcher,
+    ExcelDispatcher,
+)
+from modin.core.storage_formats.pandas.parsers import (
+    PandasCSVParser,
+    PandasJSONParser,
+    PandasParquetParser,
+    PandasFeatherParser,
+    PandasSQLParser,
+    PandasExcelParser,
+)
+from modin.core.execution.threads.common import ThreadsWrapper
+
+
+class PandasOnThreadsIO(BaseIO):
+    """The class implements interface in ``BaseIO`` using the thread pool as an execution engine."""
+
+    frame_cls = PandasOnThreadsDataframe
+    query_compiler_cls = PandasQueryCompiler
+    build_args = dict(
+        frame_cls=PandasOnThreadsDataframe,
+        frame_partition_cls=PandasOnThreadsDataframePartition,
+        query_compiler_cls=PandasQueryCompiler,
+    )
+
+    read_csv = type(
+        "", (ThreadsWrapper, PandasCSVParser, CSVDispatcher), build_args
+    ).read
+    read_json = type(
+        "", (ThreadsWrapper, PandasJSONParser, JSONDispatcher), build_args
+    ).read
+    read_parquet = type(
+        "", (ThreadsWrapper, PandasParquetParser, ParquetDispatcher), build_args
+    ).read
+    # Blocked on pandas-dev/pandas#12236. It is faster to default to pandas.
+    # read_hdf = type("", (ThreadsWrapper, PandasHDFParser, HDFReader), build_args).read
+    read_feather = type(
+        "", (ThreadsWrapper, PandasFeatherParser, FeatherDispatcher), build_args
+    ).read
+    read_sql = type(
+        "", (ThreadsWrapper, PandasSQLParser, SQLDispatcher), build_args
+    ).read
+    read_excel = type(
+        "", (ThreadsWrapper, PandasExcelParser, ExcelDispatcher), build_args
+    ).read
+    to_csv = type(
+        "", (ThreadsWrapper, PandasCSVParser, CSVDispatcher), build_args
+    ).write
+    to_parquet = type(
+        "", (ThreadsWrapper, PandasParquetParser, ParquetDispatcher), build_args
+    ).write
+    to_sql = type(
+        "", (ThreadsWrapper, PandasSQLParser, SQLDispatcher), build_args
+    ).write
@@ -0,0 +1,381 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Module houses class that wraps data (block partition) and its metadata."""
+
+from concurrent.futures import Future
+
+from modin.core.dataframe.pandas.partitioning.partition import PandasDataframePartition
+from modin.core.dataframe.pandas.utils import copy_on_write, freeze
+from modin.pandas.indexing import compute_sliced_len
+from modin.core.execution.threads.common import ThreadsWrapper
+
+
+class PandasOnThreadsDataframePartition(PandasDataframePartition):
+    """
+    The class implements the interface in ``PandasDataframePartition``.
+
+    Parameters
+    ----------
+    data : concurrent.futures.Future
+        A reference to pandas DataFrame that need to be wrapped with this class.
+    length : concurrent.futures.Future or int, optional
+        Length or reference to it of wrapped pandas DataFrame.
+    width : concurrent.futures.Future or int, optional
+        Width or reference to it of wrapped pandas DataFrame.
+    call_queue : list, optional
+        Call queue that needs to be executed on wrapped pandas DataFrame.
+
+    Notes
+    -----
+    The wrapped pandas DataFrame is shared by all the partitions referring to it
+    and its values are read-only, so the functions run on it without copying.
+    A function writing to the values gets its own copy of them
+    (see ``modin.core.dataframe.pandas.utils.copy_on_write``).
+    """
+
+    def __init__(self, data, length=None, width=None, call_queue=None):
+        assert isinstance(data, Future)
+        self._data = data
+        if call_queue is None:
+            call_queue = []
+        self.call_queue = call_queue
+        self._length_cache = length
+        self._width_cache = width
+
+    def get(self):
+        """
+        Get the object wrapped by this partition.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The object wrapped by this partition.
+        """
+        self.drain_call_queue()
+        return ThreadsWrapper.materialize(self._data)
+
+    def _deploy_call_queue(self, call_queue):
+        """
+        Run the functions of `call_queue` on the wrapped object in a worker thread.
+
+        Parameters
+        ----------
+        call_queue : list
+            A call queue of ``[func, args, kwargs]`` triples.
+
+        Returns
+        -------
+        concurrent.futures.Future
+        """
+        if len(call_queue) > 1:
+            return ThreadsWrapper.deploy(
+                func=apply_list_of_funcs, f_args=(call_queue, self._data)
+            )
+        # We handle `len(call_queue) == 1` in a different way because
+        # this improves performance a bit.
+        func, f_args, f_kwargs = call_queue[0]
+        return ThreadsWrapper.deploy(
+            func=apply_func, f_args=(self._data, func, *f_args), f_kwargs=f_kwargs
+        )
+
+    def apply(self, func, *args, **kwargs):
+        """
+        Apply a function to the object wrapped by this partition.
+
+        Parameters
+        ----------
+        func : callable
+            A function to apply.
+        *args : iterable
+            Additional positional arguments to be passed in `func`.
+        **kwargs : dict
+            Additional keyword arguments to be passed in `func`.
+
+        Returns
+        -------
+        PandasOnThreadsDataframePartition
+            A new ``PandasOnThreadsDataframePartition`` object.
+        """
+        return PandasOnThreadsDataframePartition(
+            self._deploy_call_queue(self.call_queue + [[func, args, kwargs]])
+        )
+
+    def add_to_apply_calls(self, func, *args, length=None, width=None, **kwargs):
+        """
+        Add a function to the call queue.
+
+        Parameters
+        ----------
+        func : callable
+            Function to be added to the call queue.
+        *args : iterable
+            Additional positional arguments to be passed in `func`.
+        length : concurrent.futures.Future or int, optional
+            Length, or reference to length, of wrapped ``pandas.DataFrame``.
+        width : concurrent.futures.Future or int, optional
+            Width, or reference to width, of wrapped ``pandas.DataFrame``.
+        **kwargs : dict
+            Additional keyword arguments to be passed in `func`.
+
+        Returns
+        -------
+        PandasOnThreadsDataframePartition
+            A new ``PandasOnThreadsDataframePartition`` object.
+        """
+        return PandasOnThreadsDataframePartition(
+            self._data,
+            call_queue=self.call_queue + [[func, args, kwargs]],
+            length=length,
+            width=width,
+        )
+
+    def drain_call_queue(self):
+        """Execute all operations stored in the call queue on the object wrapped by this partition."""
+        if len(self.call_queue) == 0:
+            return
+        self._data = self._deploy_call_queue(self.call_queue)
+        self.call_queue = []
+
+    def wait(self):
+        """Wait completing computations on the object wrapped by the partition."""
+        self.drain_call_queue()
+        ThreadsWrapper.wait([self._data])
+
+    def mask(self, row_labels, col_labels):
+        """
+        Lazily create a mask that extracts the indices provided.
+
+        Parameters
+        ----------
+        row_labels : list-like, slice or label
+            The row labels for the rows to extract.
+        col_labels : list-like, slice or label
+            The column labels for the columns to extract.
+
+        Returns
+        -------
+        PandasOnThreadsDataframePartition
+            A new ``PandasOnThreadsDataframePartition`` object.
+        """
+        new_obj = super().mask(row_labels, col_labels)
+        if isinstance(row_labels, slice) and isinstance(self._length_cache, Future):
+            if row_labels == slice(None):
+                # fast path - full axis take
+                new_obj._length_cache = self._length_cache
+            else:
+                new_obj._length_cache = ThreadsWrapper.deploy(
+                    func=compute_sliced_len, f_args=(row_labels, self._length_cache)
+                )
+        if isinstance(col_labels, slice) and isinstance(self._width_cache, Future):
+            if col_labels == slice(None):
+                # fast path - full axis take
+                new_obj._width_cache = self._width_cache
+            else:
+                new_obj._width_cache = ThreadsWrapper.deploy(
+                    func=compute_sliced_len, f_args=(col_labels, self._width_cache)
+                )
+        return new_obj
+
+    def __copy__(self):
+        """
+        Create a copy of this partition.
+
+        Returns
+        -------
+        PandasOnThreadsDataframePartition
+            A copy of this partition.
+        """
+        return PandasOnThreadsDataframePartition(
+            self._data,
+            length=self._length_cache,
+            width=self._width_cache,
+            call_queue=self.call_queue,
+        )
+
+    def __reduce__(self):
+        """
+        Get the state to pickle this partition with.
+
+        Returns
+        -------
+        tuple
+            The function restoring the partition and its arguments.
+
+        Notes
+        -----
+        Futures can not be pickled, so the wrapped object is pickled instead.
+        """
+        return type(self).put, (self.get(),)
+
+    @classmethod
+    def put(cls, obj):
+        """
+        Put an object into the memory shared by the workers and wrap it with partition object.
+
+        Parameters
+        ----------
+        obj : pandas.DataFrame
+            A DataFrame to be put.
+
+        Returns
+        -------
+        PandasOnThreadsDataframePartition
+            A new ``PandasOnThreadsDataframePartition`` object.
+
+        Notes
+        -----
+        `obj` is copied so that its later modifications don't affect the partition.
+        """
+        return cls(ThreadsWrapper.put(_copy(obj)), len(obj.index), len(obj.columns))
+
+    @classmethod
+    def put_many(cls, objs):
+        """
+        Put a batch of objects copying them in the worker threads concurrently.
+
+        Parameters
+        ----------
+        objs : list
+            Objects to be put.
+
+        Returns
+        -------
+        list
+            New ``PandasOnThreadsDataframePartition`` objects in the order of `objs`.
+        """
+        return [
+            cls(
+                ThreadsWrapper.deploy(func=_copy, f_args=(obj,)),
+                len(obj.index),
+                len(obj.columns),
+            )
+            for obj in objs
+        ]
+
+    @classmethod
+    def preprocess_func(cls, func):
+        """
+        Preprocess a function before an ``apply`` call.
+
+        Parameters
+        ----------
+        func : callable
+            The function to preprocess.
+
+        Returns
+        -------
+        callable
+            An object that can be accepted by ``apply``.
+
+        Notes
+        -----
+        The workers share the memory with the driver, so no special
+        preprocessing action is required and unmodified `func` is returned.
+        """
+        return func
+
+    def length(self):
+        """
+        Get the length of the object wrapped by this partition.
+
+        Returns
+        -------
+        int
+            The length of the object.
+        """
+        if self._length_cache is None:
+            self._length_cache = self.apply(lambda df: len(df))._data
+        if isinstance(self._length_cache, Future):
+            self._length_cache = ThreadsWrapper.materialize(self._length_cache)
+        return self._length_cache
+
+    def width(self):
+        """
+        Get the width of the object wrapped by the partition.
+
+        Returns
+        -------
+        int
+            The width of the object.
+        """
+        if self._width_cache is None:
+            self._width_cache = self.apply(lambda df: len(df.columns))._data
+        if isinstance(self._width_cache, Future):
+            self._width_cache = ThreadsWrapper.materialize(self._width_cache)
+        return self._width_cache
+
+
+def _copy(obj):
+    """
+    Copy an object to be owned by a partition.
+
+    Parameters
+    ----------
+    obj : pandas.DataFrame
+        Object to copy.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A copy of `obj` with read-only values.
+    """
+    return freeze(obj.copy())
+
+
+def apply_func(partition, func, *args, **kwargs):
+    """
+    Execute a function on the partition in a worker thread.
+
+    Parameters
+    ----------
+    partition : pandas.DataFrame
+        A pandas DataFrame the function needs to be executed on.
+    func : callable
+        The function to perform.
+    *args : list
+        Positional arguments to pass to ``func``.
+    **kwargs : dict
+        Keyword arguments to pass to ``func``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The resulting pandas DataFrame.
+    """
+    return freeze(copy_on_write(func)(partition, *args, **kwargs))
+
+
+def apply_list_of_funcs(call_queue, partition):
+    """
+    Execute all operations stored in the call queue on the partition in a worker thread.
+
+    Parameters
+    ----------
+    call_queue : list
+        A call queue of ``[func, args, kwargs]`` triples that needs to be executed on the partition.
+    partition : pandas.DataFrame
+        A pandas DataFrame the call queue needs to be executed on.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The resulting pandas DataFrame.
+    """
+    for func, f_args, f_kwargs in call_queue:
+        f_args = [ThreadsWrapper.materialize(arg) for arg in f_args]
+        f_kwargs = {
+            key: ThreadsWrapper.materialize(value) for key, value in f_kwargs.items()
+        }
+        partition = copy_on_write(func)(partition, *f_args, **f_kwargs)
+    return freeze(partition)
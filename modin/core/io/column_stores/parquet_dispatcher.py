@@ -11,22 +11,26 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
-"""Module houses `ParquetDispatcher` class, that is used for reading `.parquet` files."""
+"""Module houses `ParquetDispatcher` class, that is used for reading and writing `.parquet` files."""
 
 import os
 
 import json
+from urllib.parse import quote
 import fsspec
 from fsspec.core import url_to_fs
 from fsspec.spec import AbstractBufferedFile
 import numpy as np
+import pandas
 from packaging import version
 
 from modin.core.storage_formats.pandas.utils import compute_chunksize
 from modin.config import NPartitions
 
 
+from modin.core.dataframe.pandas.dataframe.utils import hash_split_fn
 from modin.core.io.column_stores.column_store_dispatcher import ColumnStoreDispatcher
+from modin.core.io.io import BaseIO
 from modin.utils import import_optional_dependency, _inherit_docstrings
 
 
@@ -129,7 +133,27 @@ class ColumnStoreDataset:
                 self._fs, self._fs_path = url_to_fs(self.path, **self.storage_options)
         return self._fs_path
 
-    def to_pandas_dataframe(self, columns):
+    def filter_row_groups(self, filters):
+        """
+        Get the row groups of each file that may contain rows matching `filters`.
+
+        The row groups are pruned using the min/max statistics from the file
+        footers, so the surviving row groups still have to be filtered row-wise.
+
+        Parameters
+        ----------
+        filters : list of tuples or list of lists of tuples
+            Filters in disjunctive normal form.
+
+        Returns
+        -------
+        list
+            List that contains the list of row group indices for each file
+            in the given parquet dataset.
+        """
+        raise NotImplementedError
+
+    def to_pandas_dataframe(self, columns, filters=None):
         """
         Read the given columns as a pandas dataframe.
 
@@ -137,6 +161,8 @@ class ColumnStoreDataset:
         ----------
         columns : list
             List of columns that should be read from file.
+        filters : list of tuples or list of lists of tuples, optional
+            Filters to select the rows with.
         """
         raise NotImplementedError
 
@@ -201,28 +227,79 @@ class PyArrowDataset(ColumnStoreDataset):
         from pyarrow.parquet import ParquetFile
 
         if self._row_groups_per_file is None:
-            row_groups_per_file = []
-            # Count up the total number of row groups across all files and
-            # keep track of row groups per file to use later.
-            for file in self.files:
-                with self.fs.open(file) as f:
-                    row_groups = ParquetFile(f).num_row_groups
-                    row_groups_per_file.append(row_groups)
+            row_groups_per_file = self._row_groups_from_summary()
+            if row_groups_per_file is None:
+                row_groups_per_file = []
+                # Count up the total number of row groups across all files and
+                # keep track of row groups per file to use later.
+                for file in self.files:
+                    with self.fs.open(file) as f:
+                        row_groups = ParquetFile(f).num_row_groups
+                        row_groups_per_file.append(row_groups)
             self._row_groups_per_file = row_groups_per_file
         return self._row_groups_per_file
 
+    def _row_groups_from_summary(self):
+        """
+        Get the number of row groups per file from the ``_metadata`` summary file.
+
+        Returns
+        -------
+        list or None
+            The number of row groups per file, None if the dataset has no summary
+            file or the summary doesn't describe all of the files.
+        """
+        from pyarrow.parquet import read_metadata
+
+        if not isinstance(self.fs_path, str):
+            return None
+        root = self.fs_path.rstrip("/")
+        summary_path = f"{root}/_metadata"
+        if not self.fs.isfile(summary_path):
+            return None
+        with self.fs.open(summary_path) as f:
+            summary = read_metadata(f)
+        if summary.num_columns == 0:
+            return None
+        row_groups = {}
+        for i in range(summary.num_row_groups):
+            file_path = summary.row_group(i).column(0).file_path
+            row_groups[file_path] = row_groups.get(file_path, 0) + 1
+        files = [
+            file[len(root) + 1 :] if file.startswith(root + "/") else None
+            for file in self.dataset.files
+        ]
+        if any(file not in row_groups for file in files):
+            return None
+        return [row_groups[file] for file in files]
+
     @property
     def files(self):
         if self._files is None:
             self._files = self._get_files(self.dataset.files)
         return self._files
 
-    def to_pandas_dataframe(
-        self, columns,
-    ):
+    def filter_row_groups(self, filters):
+        from modin.core.storage_formats.pandas.parsers import _filters_to_expression
+
+        expression = _filters_to_expression(filters)
+        return [
+            [
+                row_group.id
+                for row_group_fragment in fragment.split_by_row_group(
+                    expression, schema=self.dataset.schema
+                )
+                for row_group in row_group_fragment.row_groups
+            ]
+            for fragment in self.dataset.fragments
+        ]
+
+    def to_pandas_dataframe(self, columns, filters=None):
         from pyarrow.parquet import read_table
 
-        return read_table(self.path, columns=columns, filesystem=self.fs).to_pandas()
+        return read_table(
+            self.path, columns=columns, filesystem=self.fs, filters=filters
+        ).to_pandas()
 
 
 @_inherit_docstrings(ColumnStoreDataset)
@@ -267,8 +344,29 @@ class FastParquetDataset(ColumnStoreDataset):
             self._files = self._get_files(self._get_fastparquet_files())
         return self._files
 
-    def to_pandas_dataframe(self, columns):
-        return self.dataset.to_pandas(columns=columns)
+    def filter_row_groups(self, filters):
+        from fastparquet import ParquetFile
+        from fastparquet.api import filter_row_groups
+
+        row_groups_per_file = []
+        for file in self.files:
+            with self.fs.open(file) as f:
+                parquet_file = ParquetFile(f)
+                matching = {
+                    id(row_group)
+                    for row_group in filter_row_groups(parquet_file, filters)
+                }
+                row_groups_per_file.append(
+                    [
+                        i
+                        for i, row_group in enumerate(parquet_file.row_groups)
+                        if id(row_group) in matching
+                    ]
+                )
+        return row_groups_per_file
+
+    def to_pandas_dataframe(self, columns, filters=None):
+        return self.dataset.to_pandas(columns=columns, filters=filters or [])
 
     def _get_fastparquet_files(self):  # noqa: GL08
         # fastparquet doesn't have a nice method like PyArrow, so we
@@ -287,7 +385,7 @@ class FastParquetDataset(ColumnStoreDataset):
 
 
 class ParquetDispatcher(ColumnStoreDispatcher):
-    """Class handles utils for reading `.parquet` files."""
+    """Class handles utils for reading and writing `.parquet` files."""
 
     @classmethod
     def get_dataset(cls, path, engine, storage_options):
@@ -364,55 +462,39 @@ class ParquetDispatcher(ColumnStoreDispatcher):
         if len(col_partitions) == 0:
             return []
 
-        row_groups_per_file = dataset.row_groups_per_file
-        num_row_groups = sum(row_groups_per_file)
-        parquet_files = dataset.files
+        filters = kwargs.get("filters", None)
+        if filters is None:
+            row_groups_per_file = [range(num) for num in dataset.row_groups_per_file]
+        else:
+            # Skip the files and row groups whose statistics can't satisfy the
+            # filters, the rest of the rows are filtered out while parsing
+            row_groups_per_file = dataset.filter_row_groups(filters)
+        row_groups = [
+            (file_path, row_group)
+            for file_path, file_row_groups in zip(dataset.files, row_groups_per_file)
+            for row_group in file_row_groups
+        ]
 
         # step determines how many row groups are going to be in a partition
-        step = compute_chunksize(num_row_groups, NPartitions.get(), min_block_size=1,)
-        current_partition_size = 0
-        file_index = 0
+        step = compute_chunksize(len(row_groups), NPartitions.get(), min_block_size=1,)
         partition_files = []  # 2D array - each element contains list of chunks to read
-        row_groups_used_in_current_file = 0
-        total_row_groups_added = 0
-        # On each iteration, we add a chunk of one file. That will
-        # take us either to the end of a partition, or to the end
-        # of a file.
-        while total_row_groups_added < num_row_groups:
-            if current_partition_size == 0:
-                partition_files.append([])
-            partition_file = partition_files[-1]
-            file_path = parquet_files[file_index]
-            row_group_start = row_groups_used_in_current_file
-            row_groups_left_in_file = (
-                row_groups_per_file[file_index] - row_groups_used_in_current_file
-            )
-            row_groups_left_for_this_partition = step - current_partition_size
-            if row_groups_left_for_this_partition <= row_groups_left_in_file:
-                # File has at least what we need to finish partition
-                # So finish this partition and start a new one.
-                num_row_groups_to_add = row_groups_left_for_this_partition
-                current_partition_size = 0
-            else:
-                # File doesn't have enough to complete this partition. Add
-                # it into current partition and go to next file.
-                num_row_groups_to_add = row_groups_left_in_file
-                current_partition_size += num_row_groups_to_add
-            if num_row_groups_to_add == row_groups_left_in_file:
-                file_index += 1
-                row_groups_used_in_current_file = 0
-            else:
-                row_groups_used_in_current_file += num_row_groups_to_add
-            partition_file.append(
-                ParquetFileToRead(
-                    file_path, row_group_start, row_group_start + num_row_groups_to_add
-                )
-            )
-            total_row_groups_added += num_row_groups_to_add
-
-        assert (
-            total_row_groups_added == num_row_groups
-        ), "row groups added does not match total num of row groups across parquet files"
+        for start in range(0, len(row_groups), step):
+            files_to_read = []
+            # Consecutive row groups of the same file are read in one chunk
+            for file_path, row_group in row_groups[start : start + step]:
+                if (
+                    files_to_read
+                    and files_to_read[-1].path == file_path
+                    and files_to_read[-1].row_group_end == row_group
+                ):
+                    files_to_read[-1] = files_to_read[-1]._replace(
+                        row_group_end=row_group + 1
+                    )
+                else:
+                    files_to_read.append(
+                        ParquetFileToRead(file_path, row_group, row_group + 1)
+                    )
+            partition_files.append(files_to_read)
 
         all_partitions = []
         for files_to_read in partition_files:
@@ -471,7 +553,7 @@ class ParquetDispatcher(ColumnStoreDispatcher):
         )
 
     @classmethod
-    def build_index(cls, dataset, partition_ids, index_columns):
+    def build_index(cls, dataset, partition_ids, index_columns, filters=None):
         """
         Compute index and its split sizes of resulting Modin DataFrame.
 
@@ -483,6 +565,8 @@ class ParquetDispatcher(ColumnStoreDispatcher):
             Array with references to the partitions data.
         index_columns : list
             List of index columns specified by pandas metadata.
+        filters : list of tuples or list of lists of tuples, optional
+            Filters the rows were selected with.
 
         Returns
         -------
@@ -509,11 +593,18 @@ class ParquetDispatcher(ColumnStoreDispatcher):
             elif column["name"] is not None:
                 column_names_to_read.append(column["name"])
 
+        if range_index and filters is not None:
+            # The stored range doesn't describe the filtered rows, pandas
+            # gives them a default index
+            row_lengths = cls.materialize([part_id[0][2] for part_id in partition_ids])
+            complete_index = pandas.RangeIndex(sum(row_lengths))
         # For the second check, let us consider the case where we have an empty dataframe,
         # that has a valid index.
-        if range_index or (len(partition_ids) == 0 and len(column_names_to_read) != 0):
+        elif range_index or (
+            len(partition_ids) == 0 and len(column_names_to_read) != 0
+        ):
             complete_index = dataset.to_pandas_dataframe(
-                columns=column_names_to_read
+                columns=column_names_to_read, filters=filters
             ).index
         # Empty DataFrame case
         elif len(partition_ids) == 0:
@@ -550,7 +641,9 @@ class ParquetDispatcher(ColumnStoreDispatcher):
         partition_ids = cls.call_deploy(
             dataset, col_partitions, storage_options, **kwargs
         )
-        index, sync_index = cls.build_index(dataset, partition_ids, index_columns)
+        index, sync_index = cls.build_index(
+            dataset, partition_ids, index_columns, kwargs.get("filters", None)
+        )
         remote_parts = cls.build_partition(partition_ids, column_widths)
         if len(partition_ids) > 0:
             row_lengths = [part.length() for part in remote_parts.T[0]]
@@ -638,3 +731,257 @@ class ParquetDispatcher(ColumnStoreDispatcher):
         ]
 
         return cls.build_query_compiler(dataset, columns, index_columns, **kwargs)
+
+    @staticmethod
+    def _to_parquet_check_support(qc, kwargs):
+        """
+        Check if parallel version of ``to_parquet`` could be used.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe that we want to run
+            ``to_parquet`` on.
+        kwargs : dict
+            Keyword arguments passed to ``.to_parquet()``.
+
+        Returns
+        -------
+        bool
+            Whether parallel version of ``to_parquet`` is applicable.
+        """
+        path = kwargs["path"]
+        if not isinstance(path, str):
+            return False
+        if any((path.endswith(ext) for ext in [".gz", ".bz2", ".zip", ".xz"])):
+            return False
+        if kwargs["engine"] not in ("auto", "pyarrow"):
+            return False
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            return False
+        columns = qc.columns
+        # pandas raises for these, so let it do the validation
+        if not columns.is_unique or not all(isinstance(col, str) for col in columns):
+            return False
+        if len(qc.index) == 0:
+            return False
+        partition_cols = kwargs["partition_cols"]
+        if partition_cols is not None:
+            if isinstance(partition_cols, str):
+                partition_cols = [partition_cols]
+            if not set(partition_cols).issubset(columns) or len(
+                set(partition_cols)
+            ) == len(columns):
+                return False
+        return True
+
+    @staticmethod
+    def _write_files(
+        df,
+        fs,
+        root,
+        file_prefix,
+        file_suffix,
+        partition_cols,
+        preserve_index,
+        max_rows_per_file,
+        write_kwargs,
+    ):
+        """
+        Write the rows of a partition into the parquet files of a dataset.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            The rows to write.
+        fs : fsspec.AbstractFileSystem
+            The filesystem of the dataset.
+        root : str
+            The root directory of the dataset.
+        file_prefix : str
+            The prefix of the names of the written files.
+        file_suffix : str
+            The suffix of the names of the written files.
+        partition_cols : list of str or None
+            The columns to partition the rows into ``key=value`` directories by.
+        preserve_index : bool or None
+            Whether to store the index of `df`.
+        max_rows_per_file : int or None
+            The maximum number of rows to put into a single file.
+        write_kwargs : dict
+            Keyword arguments to pass to ``pyarrow.parquet.write_table``.
+
+        Returns
+        -------
+        list of pyarrow.parquet.FileMetaData
+            The footers of the written files with the file paths set relative
+            to `root`.
+        """
+        import pyarrow
+        from pyarrow.parquet import write_table
+
+        if partition_cols is None:
+            pieces = [("", df)]
+        else:
+            pieces = []
+            for key, group in df.groupby(
+                partition_cols, sort=False, dropna=False, observed=True
+            ):
+                if not isinstance(key, tuple):
+                    key = (key,)
+                # hive partitioning directory names, as pyarrow writes them
+                directory = "/".join(
+                    f"{col}="
+                    + (
+                        "__HIVE_DEFAULT_PARTITION__"
+                        if pandas.isna(value)
+                        else quote(str(value), safe="")
+                    )
+                    for col, value in zip(partition_cols, key)
+                )
+                pieces.append(
+                    (directory + "/", group.drop(columns=partition_cols))
+                )
+
+        metadata = []
+        for directory, piece in pieces:
+            fs.makedirs(f"{root}/{directory}", exist_ok=True)
+            table = pyarrow.Table.from_pandas(piece, preserve_index=preserve_index)
+            step = max_rows_per_file or max(len(table), 1)
+            for i, offset in enumerate(range(0, max(len(table), 1), step)):
+                file_name = file_prefix
+                if max_rows_per_file is not None:
+                    file_name += f"-{i:04d}"
+                file_path = f"{directory}{file_name}{file_suffix}"
+                collector = []
+                with fs.open(f"{root}/{file_path}", "wb") as file:
+                    write_table(
+                        table.slice(offset, step),
+                        file,
+                        metadata_collector=collector,
+                        **write_kwargs,
+                    )
+                collector[0].set_file_path(file_path)
+                metadata.append(collector[0])
+        return metadata
+
+    @classmethod
+    def write(cls, qc, **kwargs):
+        """
+        Write a ``DataFrame`` to the binary parquet format.
+
+        Every row partition is written to its own file of a dataset in the
+        `path` directory. If `partition_cols` are specified, the rows are
+        shuffled by the hash of these columns first, so every ``key=value``
+        directory is written by a single worker.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe that we want to run `to_parquet` on.
+        **kwargs : dict
+            Parameters for `pandas.to_parquet(**kwargs)`. Besides the options of
+            ``pyarrow.parquet.write_table``, the `max_rows_per_file` and the
+            `max_rows_per_group` options of ``pyarrow.dataset.write_dataset``
+            are accepted.
+
+        Notes
+        -----
+        The footers of the written files are gathered into the ``_metadata``
+        summary file and the schema is stored in the ``_common_metadata`` file,
+        so the readers could plan the reading without opening every file.
+        The summary files are not written if the files turn out to have different
+        schemas, which can happen if some column is inferred differently from
+        the rows of different partitions.
+        """
+        if not cls._to_parquet_check_support(qc, kwargs):
+            return BaseIO.to_parquet(qc, **kwargs)
+
+        from pyarrow.parquet import write_metadata
+
+        kwargs = kwargs.copy()
+        path = kwargs.pop("path")
+        kwargs.pop("engine")
+        index = kwargs.pop("index")
+        partition_cols = kwargs.pop("partition_cols")
+        if isinstance(partition_cols, str):
+            partition_cols = [partition_cols]
+        max_rows_per_file = kwargs.pop("max_rows_per_file", None)
+        max_rows_per_group = kwargs.pop("max_rows_per_group", None)
+        if max_rows_per_group is not None:
+            kwargs.setdefault("row_group_size", max_rows_per_group)
+        compression = kwargs["compression"]
+        fs, root = url_to_fs(path, **(kwargs.pop("storage_options", None) or {}))
+        root = root.rstrip("/")
+        fs.makedirs(root, exist_ok=True)
+
+        file_suffix = (
+            f".{compression}.parquet" if isinstance(compression, str) else ".parquet"
+        )
+        write_files = cls._write_files
+        frame = qc._modin_frame
+        # Ensure that the metadata is synchronized
+        frame._propagate_index_objs(axis=None)
+        partition_mgr_cls = frame._partition_mgr_cls
+        write_files_kwargs = dict(
+            fs=fs,
+            root=root,
+            file_suffix=file_suffix,
+            partition_cols=partition_cols,
+            preserve_index=index,
+            max_rows_per_file=max_rows_per_file,
+            write_kwargs=kwargs,
+        )
+        if partition_cols is None:
+            write_files = partition_mgr_cls.preprocess_func(write_files)
+            results = [
+                row_part.apply(
+                    write_files,
+                    num_splits=1,
+                    file_prefix=f"part-{i:04d}",
+                    **write_files_kwargs,
+                )[0]
+                for i, row_part in enumerate(
+                    partition_mgr_cls.row_partitions(frame._partitions)
+                )
+            ]
+        else:
+            if index is None and isinstance(qc.index, pandas.RangeIndex):
+                # the shuffled rows aren't labeled by a range anymore, pyarrow
+                # wouldn't store the default index as a column either
+                write_files_kwargs["preserve_index"] = False
+            num_bins = NPartitions.get()
+            pieces = partition_mgr_cls.split_row_partitions(
+                frame._partitions,
+                lambda df: hash_split_fn(df, partition_cols, num_bins),
+                num_bins,
+            )
+            results = [
+                row[0]
+                for row in partition_mgr_cls.combine_split_partitions(
+                    pieces,
+                    lambda df, **kw: write_files(df, **kw, **write_files_kwargs),
+                    func_kwargs=[
+                        {"file_prefix": f"part-{i:04d}"} for i in range(num_bins)
+                    ],
+                )
+            ]
+        metadata = [
+            file_metadata
+            for files_metadata in partition_mgr_cls.get_objects_from_partitions(
+                results
+            )
+            for file_metadata in files_metadata
+        ]
+
+        summary = metadata[0]
+        if not all(m.schema.equals(summary.schema) for m in metadata[1:]):
+            return
+        for file_metadata in metadata[1:]:
+            summary.append_row_groups(file_metadata)
+        with fs.open(f"{root}/_common_metadata", "wb") as file:
+            write_metadata(summary.schema.to_arrow_schema(), file)
+        with fs.open(f"{root}/_metadata", "wb") as file:
+            summary.write_metadata_file(file)
@@ -19,20 +19,33 @@ inherits util functions for handling files from `FileDispatcher` class and can b
 used as base class for dipatchers of SQL queries.
 """
 
+import datetime
 import math
 import numpy as np
 import pandas
 
 from modin.core.io.file_dispatcher import FileDispatcher
+from modin.core.io.io import BaseIO
+from modin.core.storage_formats.pandas.utils import compute_chunksize
 from modin.db_conn import ModinDatabaseConnection
 from modin.config import NPartitions, ReadSqlEngine
 
 
 class SQLDispatcher(FileDispatcher):
-    """Class handles utils for reading SQL queries or database tables."""
+    """Class handles utils for reading SQL queries or database tables and writing to them."""
 
     @classmethod
-    def _read(cls, sql, con, index_col=None, **kwargs):
+    def _read(
+        cls,
+        sql,
+        con,
+        index_col=None,
+        partition_column=None,
+        lower_bound=None,
+        upper_bound=None,
+        max_sessions=None,
+        **kwargs,
+    ):
         """
         Read a SQL query or database table into a query compiler.
 
@@ -44,6 +57,18 @@ class SQLDispatcher(FileDispatcher):
             Connection object to database.
         index_col : str or list of str, optional
             Column(s) to set as index(MultiIndex).
+        partition_column : str, optional
+            Numeric or datetime column to split the query into key ranges by.
+            If not specified, the query is split into ``LIMIT``/``OFFSET`` windows.
+        lower_bound : int, float or datetime, optional
+            The lower bound of `partition_column` used to compute the ranges.
+            The minimum of `partition_column` is queried if not specified.
+        upper_bound : int, float or datetime, optional
+            The upper bound of `partition_column` used to compute the ranges.
+            The maximum of `partition_column` is queried if not specified.
+        max_sessions : int, optional
+            The number of key ranges to read concurrently. ``NPartitions``
+            is used if not specified.
         **kwargs : dict
             Parameters to pass into `pandas.read_sql` function.
 
@@ -51,6 +76,13 @@ class SQLDispatcher(FileDispatcher):
         -------
         BaseQueryCompiler
             Query compiler with imported data for further processing.
+
+        Notes
+        -----
+        The bounds only define how the range of `partition_column` is split:
+        rows outside of them, as well as rows with NULL keys, are read by the
+        first and the last partitions. The rows of the result are ordered by
+        these ranges.
         """
         if isinstance(con, str):
             con = ModinDatabaseConnection("sqlalchemy", con)
@@ -67,45 +99,189 @@ class SQLDispatcher(FileDispatcher):
                 + "https://modin.readthedocs.io/en/latest/supported_apis/io_supported.html#connecting-to-a-database-for-read-sql",
                 **kwargs,
             )
-        row_count_query = con.row_count_query(sql)
         connection_for_pandas = con.get_connection()
         colum_names_query = con.column_names_query(sql)
-        row_cnt = pandas.read_sql(row_count_query, connection_for_pandas).squeeze()
         cols_names_df = pandas.read_sql(
             colum_names_query, connection_for_pandas, index_col=index_col
         )
         cols_names = cols_names_df.columns
-        num_partitions = NPartitions.get()
+        num_splits = NPartitions.get()
+        if partition_column is None:
+            row_count_query = con.row_count_query(sql)
+            row_cnt = pandas.read_sql(row_count_query, connection_for_pandas).squeeze()
+            limit = math.ceil(row_cnt / num_splits)
+            queries = [
+                con.partition_query(sql, limit, part * limit)
+                for part in range(num_splits)
+            ]
+        else:
+            if lower_bound is None or upper_bound is None:
+                min_max_query = con.min_max_query(sql, partition_column)
+                min_max = pandas.read_sql(min_max_query, connection_for_pandas)
+                lower_bound = min_max.iat[0, 0] if lower_bound is None else lower_bound
+                upper_bound = min_max.iat[0, 1] if upper_bound is None else upper_bound
+            bounds = cls._get_key_range_bounds(
+                lower_bound, upper_bound, max_sessions or num_splits
+            )
+            queries = [
+                con.key_range_query(sql, partition_column, lower, upper)
+                for lower, upper in zip([None] + bounds, bounds + [None])
+            ]
+        num_partitions = len(queries)
         partition_ids = [None] * num_partitions
         index_ids = [None] * num_partitions
         dtypes_ids = [None] * num_partitions
-        limit = math.ceil(row_cnt / num_partitions)
-        for part in range(num_partitions):
-            offset = part * limit
-            query = con.partition_query(sql, limit, offset)
+        for part, query in enumerate(queries):
             *partition_ids[part], index_ids[part], dtypes_ids[part] = cls.deploy(
                 func=cls.parse,
                 f_kwargs={
-                    "num_splits": num_partitions,
+                    "num_splits": num_splits,
                     "sql": query,
                     "con": con,
                     "index_col": index_col,
                     "read_sql_engine": ReadSqlEngine.get(),
                     **kwargs,
                 },
-                num_returns=num_partitions + 2,
+                num_returns=num_splits + 2,
             )
             partition_ids[part] = [
                 cls.frame_partition_cls(obj) for obj in partition_ids[part]
             ]
         if index_col is None:  # sum all lens returned from partitions
-            index_lens = cls.materialize(index_ids)
-            new_index = pandas.RangeIndex(sum(index_lens))
+            row_lengths = cls.materialize(index_ids)
+            new_index = pandas.RangeIndex(sum(row_lengths))
         else:  # concat index returned from partitions
-            index_lst = [
-                x for part_index in cls.materialize(index_ids) for x in part_index
-            ]
+            part_indices = cls.materialize(index_ids)
+            row_lengths = [len(part_index) for part_index in part_indices]
+            index_lst = [x for part_index in part_indices for x in part_index]
             new_index = pandas.Index(index_lst).set_names(index_col)
-        new_frame = cls.frame_cls(np.array(partition_ids), new_index, cols_names)
+        chunksize = compute_chunksize(len(cols_names), num_splits)
+        column_widths = [
+            min(chunksize, max(0, len(cols_names) - chunksize * i))
+            for i in range(num_splits)
+        ]
+        new_frame = cls.frame_cls(
+            np.array(partition_ids),
+            new_index,
+            cols_names,
+            row_lengths=row_lengths,
+            column_widths=column_widths,
+        )
         new_frame.synchronize_labels(axis=0)
         return cls.query_compiler_cls(new_frame)
+
+    @staticmethod
+    def _get_key_range_bounds(lower_bound, upper_bound, num_partitions):
+        """
+        Split the range of a partition column into `num_partitions` strides.
+
+        Parameters
+        ----------
+        lower_bound : int, float, str or datetime
+            The lower end of the range.
+        upper_bound : int, float, str or datetime
+            The upper end of the range.
+        num_partitions : int
+            The number of strides to split the range into.
+
+        Returns
+        -------
+        list
+            The inner bounds separating the strides, without duplicates.
+            Empty if the range is empty, e.g. when the column has only NULLs.
+        """
+
+        def normalize(bound):
+            if isinstance(bound, (str, datetime.date, np.datetime64)):
+                return pandas.Timestamp(bound)
+            if isinstance(bound, np.generic):
+                return bound.item()
+            return bound
+
+        lower_bound, upper_bound = normalize(lower_bound), normalize(upper_bound)
+        if pandas.isna(lower_bound) or pandas.isna(upper_bound):
+            return []
+        if lower_bound > upper_bound:
+            raise ValueError(
+                f"lower_bound ({lower_bound}) must not be greater than "
+                + f"upper_bound ({upper_bound})"
+            )
+        stride = upper_bound - lower_bound
+        if isinstance(stride, int):
+            bounds = [
+                lower_bound + stride * i // num_partitions
+                for i in range(1, num_partitions)
+            ]
+        else:
+            bounds = [
+                lower_bound + stride * i / num_partitions
+                for i in range(1, num_partitions)
+            ]
+        return sorted(set(bound for bound in bounds if bound > lower_bound))
+
+    @staticmethod
+    def _to_sql(df, con, **kwargs):
+        """
+        Write the rows of a frame to a SQL database.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            The rows to write.
+        con : str or ModinDatabaseConnection
+            The database to write to.
+        **kwargs : dict
+            Parameters for ``pandas.DataFrame.to_sql``.
+        """
+        if not isinstance(con, ModinDatabaseConnection):
+            df.to_sql(con=con, **kwargs)
+            return
+        connection = con.get_connection()
+        try:
+            df.to_sql(con=connection, **kwargs)
+            if hasattr(connection, "commit"):
+                connection.commit()
+        finally:
+            connection.close()
+
+    @classmethod
+    def write(cls, qc, **kwargs):
+        """
+        Write records stored in the `qc` to a SQL database.
+
+        The table is created from the driver first, which also validates the
+        input against pandas, then every row partition appends its rows to the
+        table concurrently.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe that we want to run ``to_sql`` on.
+        **kwargs : dict
+            Parameters for ``pandas.to_sql(**kwargs)``.
+
+        Notes
+        -----
+        The connection is made by every worker, so it has to be passed as a
+        connection string or a ``ModinDatabaseConnection``.
+        """
+        con = kwargs.pop("con")
+        if not isinstance(con, (str, ModinDatabaseConnection)) or not len(qc.index):
+            return BaseIO.to_sql(qc, con=con, **kwargs)
+
+        # Ensure that the metadata is synchronized
+        qc._modin_frame._propagate_index_objs(axis=None)
+        cls._to_sql(qc.getitem_row_array([0]).to_pandas().head(0), con, **kwargs)
+        # so each partition will append its respective rows
+        kwargs["if_exists"] = "append"
+        partition_mgr_cls = qc._modin_frame._partition_mgr_cls
+        to_sql = partition_mgr_cls.preprocess_func(cls._to_sql)
+        # pending completion
+        partition_mgr_cls.get_objects_from_partitions(
+            [
+                row_part.apply(to_sql, num_splits=1, con=con, **kwargs)[0]
+                for row_part in partition_mgr_cls.row_partitions(
+                    qc._modin_frame._partitions
+                )
+            ]
+        )
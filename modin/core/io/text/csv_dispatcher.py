@@ -11,15 +11,22 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
-"""Module houses `CSVDispatcher` class, that is used for reading `.csv` files."""
+"""Module houses `CSVDispatcher` class, that is used for reading and writing `.csv`."""
+
+import bz2
+import gzip
+import os
 
 import pandas
+from pandas.io.common import infer_compression, is_fsspec_url
 
+from modin.core.io.io import BaseIO
 from modin.core.io.text.text_file_dispatcher import TextFileDispatcher
+from modin._compat.core.pd_common import get_handle as pd_get_handle
 
 
 class CSVDispatcher(TextFileDispatcher):
-    """Class handles utils for reading `.csv` files."""
+    """Class handles utils for reading and writing `.csv` files."""
 
     def read_callback(*args, **kwargs):
         """
@@ -38,3 +45,201 @@ class CSVDispatcher(TextFileDispatcher):
             Function call result.
         """
         return pandas.read_csv(*args, **kwargs)
+
+    @staticmethod
+    def _get_write_compression(kwargs):
+        """
+        Get the compression to write the chunks of a CSV file with.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Keyword arguments passed to ``.to_csv()``.
+
+        Returns
+        -------
+        tuple or None
+            The pair of the compression method and its level, where the method is
+            None for the uncompressed output, None if the compression isn't supported.
+
+        Notes
+        -----
+        The gzip and bz2 files can be made of several concatenated compressed
+        members, so the chunks are compressed independently of each other.
+        """
+        compression = kwargs["compression"]
+        if isinstance(compression, dict):
+            compression = compression.copy()
+            method = compression.pop("method", None)
+            level = compression.pop("compresslevel", 9)
+            if compression:
+                return None
+        else:
+            method, level = compression, 9
+        method = infer_compression(kwargs["path_or_buf"], method)
+        if method not in (None, "gzip", "bz2"):
+            return None
+        return method, level
+
+    @classmethod
+    def _to_csv_check_support(cls, kwargs):
+        """
+        Check if parallel version of ``to_csv`` could be used.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Keyword arguments passed to ``.to_csv()``.
+
+        Returns
+        -------
+        bool
+            Whether parallel version of ``to_csv`` is applicable.
+        """
+        path_or_buf = kwargs["path_or_buf"]
+        if not isinstance(path_or_buf, str):
+            return False
+        if not is_fsspec_url(path_or_buf) and "://" in path_or_buf:
+            return False
+        # case when the pointer is placed at the beginning of the file.
+        if "r" in kwargs["mode"] or "+" in kwargs["mode"]:
+            return False
+        # encodings with BOM don't support;
+        # instead of one mark in result bytes we will have them by the number of partitions
+        # so we should fallback in pandas for `utf-16`, `utf-32` with all aliases, in instance
+        # (`utf_32_be`, `utf_16_le` and so on) and for `utf-8-sig`
+        if kwargs["encoding"] is not None:
+            encoding = kwargs["encoding"].lower()
+            if "u" in encoding or "utf" in encoding:
+                if "16" in encoding or "32" in encoding or "sig" in encoding:
+                    return False
+        return cls._get_write_compression(kwargs) is not None
+
+    @classmethod
+    def write(cls, qc, **kwargs):
+        """
+        Write records stored in the `qc` to a CSV file.
+
+        The row partitions are encoded (and compressed) in parallel first, so the
+        offset of every chunk in the file is known from the sizes of the preceding
+        chunks. Then all of the chunks are written at their offsets concurrently.
+        The chunks are appended one by one from the driver only if the file isn't
+        on the local file system.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe that we want to run ``to_csv`` on.
+        **kwargs : dict
+            Parameters for ``pandas.to_csv(**kwargs)``.
+        """
+        if not cls._to_csv_check_support(kwargs) or not len(
+            qc._modin_frame._partitions
+        ):
+            return BaseIO.to_csv(qc, **kwargs)
+
+        path_or_buf = kwargs["path_or_buf"]
+        method, level = cls._get_write_compression(kwargs)
+        encoding = kwargs["encoding"] or "utf-8"
+        errors = kwargs["errors"]
+        # the chunks are dumped to strings, the file is opened by the writer itself
+        csv_kwargs = {
+            key: value
+            for key, value in kwargs.items()
+            if key
+            not in (
+                "path_or_buf",
+                "mode",
+                "encoding",
+                "errors",
+                "compression",
+                "storage_options",
+            )
+        }
+
+        def encode(df, partition_idx):
+            """
+            Dump a chunk of rows as encoded csv.
+
+            Parameters
+            ----------
+            df : pandas.DataFrame
+                A chunk of rows to write to a CSV file.
+            partition_idx : int
+                The index of the chunk.
+
+            Returns
+            -------
+            bytes
+            """
+            if partition_idx != 0:
+                # It is enough to write the header for the first partition
+                content = df.to_csv(**{**csv_kwargs, "header": False})
+            else:
+                content = df.to_csv(**csv_kwargs)
+            content = content.encode(encoding, errors)
+            if method == "gzip":
+                return gzip.compress(content, compresslevel=level)
+            if method == "bz2":
+                return bz2.compress(content, compresslevel=level)
+            return content
+
+        # Ensure that the metadata is syncrhonized
+        qc._modin_frame._propagate_index_objs(axis=None)
+        partition_mgr_cls = qc._modin_frame._partition_mgr_cls
+        encode = partition_mgr_cls.preprocess_func(encode)
+        chunks = [
+            row_part.apply(encode, num_splits=1, partition_idx=i)[0]
+            for i, row_part in enumerate(
+                partition_mgr_cls.row_partitions(qc._modin_frame._partitions)
+            )
+        ]
+        # the first character of the mode decides whether to truncate or append
+        mode = kwargs["mode"].replace("t", "").replace("b", "") + "b"
+        if is_fsspec_url(path_or_buf):
+            with pd_get_handle(
+                path_or_buf,
+                mode,
+                storage_options=kwargs.get("storage_options", None),
+                is_text=False,
+            ) as handles:
+                for chunk in chunks:
+                    handles.handle.write(chunk.get())
+            return
+
+        sizes = partition_mgr_cls.get_objects_from_partitions(
+            [chunk.apply(len) for chunk in chunks]
+        )
+        with pd_get_handle(path_or_buf, mode, is_text=False) as handles:
+            start = handles.handle.tell()
+            handles.handle.truncate(start + sum(sizes))
+
+        def write_chunk(content, offset):
+            """
+            Write a chunk at its offset into the file.
+
+            Parameters
+            ----------
+            content : bytes
+                The chunk to write.
+            offset : int
+                The position of the chunk in the file.
+            """
+            with open(path_or_buf, "r+b") as file:
+                if hasattr(os, "pwrite"):
+                    view = memoryview(content)
+                    while len(view):
+                        written = os.pwrite(file.fileno(), view, offset)
+                        view, offset = view[written:], offset + written
+                else:
+                    file.seek(offset)
+                    file.write(content)
+
+        offsets = [start + sum(sizes[:i]) for i in range(len(sizes))]
+        # pending completion
+        partition_mgr_cls.get_objects_from_partitions(
+            [
+                chunk.apply(write_chunk, offset)
+                for chunk, offset in zip(chunks, offsets)
+            ]
+        )
@@ -13,6 +13,8 @@
 
 """Module houses `JSONDispatcher` class, that is used for reading `.json` files."""
 
+import codecs
+
 from modin.core.io.file_dispatcher import OpenFile
 from modin.core.io.text.text_file_dispatcher import TextFileDispatcher
 from io import BytesIO
@@ -21,6 +23,10 @@ import numpy as np
 
 from modin.config import NPartitions
 
+# bytes that the scanner of JSON arrays needs to track
+_JSON_TOKENS = np.zeros(256, dtype=bool)
+_JSON_TOKENS[list(b'"[]{},')] = True
+
 
 class JSONDispatcher(TextFileDispatcher):
     """Class handles utils for reading `.json` files."""
@@ -53,29 +59,51 @@ class JSONDispatcher(TextFileDispatcher):
             return cls.single_worker_read(
                 path_or_buf, reason=cls.BUFFER_UNSUPPORTED_MSG, **kwargs
             )
-        if not kwargs.get("lines", False):
-            return cls.single_worker_read(
-                path_or_buf, reason="`lines` argument not supported", **kwargs
-            )
-        with OpenFile(path_or_buf, "rb") as f:
-            columns = pandas.read_json(BytesIO(b"" + f.readline()), lines=True).columns
+        if kwargs.get("lines", False):
+            with OpenFile(path_or_buf, "rb") as f:
+                columns = pandas.read_json(
+                    BytesIO(b"" + f.readline()), lines=True
+                ).columns
+            with OpenFile(path_or_buf, "rb", kwargs.get("compression", "infer")) as f:
+                splits = cls.partitioned_file(f, num_partitions=NPartitions.get(),)
+        else:
+            reason = cls._json_array_unsupported_reason(**kwargs)
+            if reason is None:
+                with OpenFile(
+                    path_or_buf, "rb", kwargs.get("compression", "infer")
+                ) as f:
+                    splits, first_element = cls.partitioned_json_array(
+                        f, num_partitions=NPartitions.get()
+                    )
+                    if splits is None:
+                        reason = "only top-level JSON arrays can be read in parallel"
+                    elif len(splits) == 0:
+                        reason = "empty JSON array"
+                    else:
+                        # The column names are taken from the first element, the
+                        # workers check that the rest of the elements match them
+                        first_start, first_end = first_element
+                        f.seek(first_start)
+                        columns = pandas.read_json(
+                            BytesIO(b"[" + f.read(first_end - first_start) + b"]"),
+                            orient=kwargs.get("orient", None),
+                        ).columns
+            if reason is not None:
+                return cls.single_worker_read(path_or_buf, reason=reason, **kwargs)
         kwargs["columns"] = columns
         empty_pd_df = pandas.DataFrame(columns=columns)
 
-        with OpenFile(path_or_buf, "rb", kwargs.get("compression", "infer")) as f:
-            column_widths, num_splits = cls._define_metadata(empty_pd_df, columns)
-            args = {"fname": path_or_buf, "num_splits": num_splits, **kwargs}
-            splits = cls.partitioned_file(f, num_partitions=NPartitions.get(),)
-            partition_ids = [None] * len(splits)
-            index_ids = [None] * len(splits)
-            dtypes_ids = [None] * len(splits)
-            for idx, (start, end) in enumerate(splits):
-                args.update({"start": start, "end": end})
-                *partition_ids[idx], index_ids[idx], dtypes_ids[idx], _ = cls.deploy(
-                    func=cls.parse, f_kwargs=args, num_returns=num_splits + 3,
-                )
-        # partition_id[-1] contains the columns for each partition, which will be useful
-        # for implementing when `lines=False`.
+        column_widths, num_splits = cls._define_metadata(empty_pd_df, columns)
+        args = {"fname": path_or_buf, "num_splits": num_splits, **kwargs}
+        partition_ids = [None] * len(splits)
+        index_ids = [None] * len(splits)
+        dtypes_ids = [None] * len(splits)
+        for idx, (start, end) in enumerate(splits):
+            args.update({"start": start, "end": end})
+            *partition_ids[idx], index_ids[idx], dtypes_ids[idx], _ = cls.deploy(
+                func=cls.parse, f_kwargs=args, num_returns=num_splits + 3,
+            )
+        # partition_id[-1] contains the columns for each partition
         row_lengths = cls.materialize(index_ids)
         new_index = pandas.RangeIndex(sum(row_lengths))
 
@@ -97,3 +125,166 @@ class JSONDispatcher(TextFileDispatcher):
         )
         new_frame.synchronize_labels(axis=0)
         return cls.query_compiler_cls(new_frame)
+
+    @classmethod
+    def _json_array_unsupported_reason(cls, **kwargs):
+        """
+        Check whether `read_json` parameters allow reading a JSON array in parallel.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            Parameters of `read_json` function.
+
+        Returns
+        -------
+        str or None
+            The reason to read the file with a single worker, None if the file
+            can be read in parallel.
+        """
+        if kwargs.get("typ", "frame") != "frame":
+            return "`typ` argument not supported"
+        if kwargs.get("orient", None) not in (None, "records", "values"):
+            return "`orient` argument not supported"
+        if kwargs.get("chunksize", None) is not None:
+            return "`chunksize` argument not supported"
+        encoding = kwargs.get("encoding", None)
+        if encoding is not None and codecs.lookup(encoding).name != "utf-8":
+            return "`encoding` argument not supported"
+        return None
+
+    @classmethod
+    def partitioned_json_array(cls, f, num_partitions=None):
+        """
+        Compute chunk sizes in bytes for every partition of a top-level JSON array.
+
+        The file is scanned once block by block, keeping track of string literals
+        and of the nesting depth, to find the commas separating the elements of
+        the top-level array. Every chunk contains a whole number of elements
+        without the enclosing brackets and the separating commas.
+
+        Parameters
+        ----------
+        f : file-like object
+            File handle of file to be partitioned.
+        num_partitions : int, optional
+            For what number of partitions split a file.
+            If not specified grabs the value from `modin.config.NPartitions.get()`.
+
+        Returns
+        -------
+        list or None
+            List with the next elements:
+                int : partition start read byte
+                int : partition end read byte
+            The list is empty if the array has no elements. None if the file
+            doesn't contain a top-level JSON array.
+        tuple of ints or None
+            Start and end bytes of the first element of the array, None if the
+            array has no elements.
+        """
+        if num_partitions is None:
+            num_partitions = NPartitions.get()
+        block_size = 1 << 22
+        whitespaces = b" \t\r\n"
+        partition_size = max(1, cls.file_size(f) // num_partitions)
+
+        # Skip the leading whitespaces and check that the file contains an array
+        block = b""
+        while block == b"":
+            raw_block = f.read(block_size)
+            if not raw_block:
+                return None, None
+            block = raw_block.lstrip(whitespaces)
+        if not block.startswith(b"["):
+            return None, None
+        offset = f.tell() - len(block)
+
+        result = []
+        chunk_start = offset + 1
+        first_element = None
+        has_elements = False
+        in_string = False
+        depth = 0
+        # number of backslashes at the end of the previous block
+        backslashes = 0
+        while block:
+            data = np.frombuffer(block, dtype=np.uint8)
+            tokens = np.flatnonzero(_JSON_TOKENS[data])
+            token_bytes = data[tokens]
+
+            # A quote is escaped if it follows an odd number of backslashes
+            quotes = token_bytes == ord('"')
+            quote_positions = tokens[quotes]
+            run_lengths = np.zeros(len(quote_positions), dtype=np.int64)
+            backslash_positions = np.flatnonzero(data == ord("\\"))
+            if len(backslash_positions):
+                run_start_idx = np.flatnonzero(
+                    np.diff(backslash_positions, prepend=-2) != 1
+                )
+                run_starts = backslash_positions[run_start_idx]
+                run_ends = (
+                    backslash_positions[
+                        np.append(run_start_idx[1:], len(backslash_positions)) - 1
+                    ]
+                    + 1
+                )
+                run = np.maximum(np.searchsorted(run_starts, quote_positions) - 1, 0)
+                adjacent = run_ends[run] == quote_positions
+                run_lengths[adjacent] = (
+                    quote_positions[adjacent] - run_starts[run[adjacent]]
+                )
+                trailing = (
+                    len(data) - run_starts[-1] if run_ends[-1] == len(data) else 0
+                )
+            else:
+                trailing = 0
+            # the runs at the block start continue the previous block's run
+            run_lengths[quote_positions == run_lengths] += backslashes
+            string_bounds = quotes.copy()
+            string_bounds[np.flatnonzero(quotes)[run_lengths % 2 == 1]] = False
+            outside = (np.cumsum(string_bounds) + in_string) % 2 == 0
+
+            delta = np.zeros(len(tokens), dtype=np.int64)
+            delta[(token_bytes == ord("[")) | (token_bytes == ord("{"))] = 1
+            delta[(token_bytes == ord("]")) | (token_bytes == ord("}"))] = -1
+            delta[~outside] = 0
+            levels = np.cumsum(delta) + depth
+
+            closing = np.flatnonzero(
+                outside & (token_bytes == ord("]")) & (levels == 0)
+            )
+            end_token = closing[0] if len(closing) else len(tokens)
+            end = tokens[end_token] if len(closing) else len(data)
+            separators = offset + tokens[:end_token][
+                outside[:end_token]
+                & (token_bytes[:end_token] == ord(","))
+                & (levels[:end_token] == 1)
+            ]
+            if not has_elements:
+                has_elements = bool(
+                    len(separators)
+                    or block[max(0, chunk_start - offset) : end].strip(whitespaces)
+                )
+            if first_element is None and len(separators):
+                first_element = (chunk_start, int(separators[0]))
+            while True:
+                idx = np.searchsorted(separators, chunk_start + partition_size)
+                if idx == len(separators):
+                    break
+                result.append((chunk_start, int(separators[idx])))
+                chunk_start = int(separators[idx]) + 1
+            if len(closing):
+                if has_elements:
+                    result.append((chunk_start, offset + int(end)))
+                    if first_element is None:
+                        first_element = result[0]
+                return result, first_element
+
+            in_string = bool((string_bounds.sum() + in_string) % 2)
+            depth = int(levels[-1]) if len(levels) else depth
+            backslashes = trailing + (backslashes if trailing == len(data) else 0)
+            offset += len(block)
+            block = f.read(block_size)
+        # the array isn't closed, let pandas report the error
+        return None, None
@@ -552,7 +552,9 @@ def doc_window_method(
     action : str, optional
         What method does with the created window.
     win_type : str, default: "rolling_window"
-        Type of window that the method creates.
+        Type of window that the method creates: "expanding window" and
+        "exponentially weighted window" refer to the ``Expanding`` and
+        ``ExponentialMovingWindow`` classes, the others to ``Rolling``.
     params : str, optional
         Method parameters in the NumPy docstyle format to substitute
         to the docstring template.
@@ -569,8 +571,8 @@ def doc_window_method(
         Parameters
         ----------
         fold_axis : {{0, 1}}
-        {window_args_name} : list
-            Rolling windows arguments with the same signature as ``modin.pandas.DataFrame.rolling``.
+        {window_args_name} : {window_args_type}
+            Window arguments with the same signature as ``modin.pandas.DataFrame.{window_method}``.
         {extra_params}
         Returns
         -------
@@ -593,7 +595,24 @@ def doc_window_method(
     }
     if action is None:
         action = f"compute {result}"
-    window_args_name = "rolling_args" if win_type == "rolling window" else "window_args"
+    # The arguments name and type, the window class and the method creating it.
+    window_args_name, window_args_type, window_cls, window_method = {
+        "expanding window": ("expanding_kwargs", "dict", "Expanding", "expanding"),
+        "exponentially weighted window": (
+            "ewm_kwargs",
+            "dict",
+            "ExponentialMovingWindow",
+            "ewm",
+        ),
+    }.get(
+        win_type,
+        (
+            "rolling_args" if win_type == "rolling window" else "window_args",
+            "list",
+            "Rolling",
+            "rolling",
+        ),
+    )
 
     # We need that `params` value ended with new line to have
     # an empty line between "parameters" and "return" sections
@@ -610,8 +629,10 @@ def doc_window_method(
         win_type=win_type,
         extra_params=params,
         build_rules=doc_build_rules.get(build_rules, build_rules),
-        refer_to=f"Rolling.{refer_to}",
+        refer_to=f"{window_cls}.{refer_to}",
         window_args_name=window_args_name,
+        window_args_type=window_args_type,
+        window_method=window_method,
     )
 
 
@@ -27,6 +27,8 @@ from modin.core.dataframe.algebra.default2pandas import (
     BinaryDefault,
     ResampleDefault,
     RollingDefault,
+    ExpandingDefault,
+    EwmDefault,
     CatDefault,
     GroupByDefault,
 )
@@ -38,6 +40,7 @@ from modin.utils import MODIN_UNNAMED_SERIES_LABEL
 from pandas.core.dtypes.common import is_scalar
 import pandas.core.resample
 import pandas
+from pandas._libs.lib import no_default
 import numpy as np
 from typing import List, Hashable
 
@@ -839,6 +842,66 @@ class BaseQueryCompiler(ClassLogger, abc.ABC):
             self, right=right, **kwargs
         )
 
+    @doc_utils.add_refer_to("merge_asof")
+    def merge_asof(self, right, **kwargs):  # noqa: PR02
+        """
+        Merge QueryCompiler objects by the nearest keys.
+
+        Parameters
+        ----------
+        right : BaseQueryCompiler
+            QueryCompiler of the right frame to merge with.
+        on : label
+        left_on : label
+        right_on : label
+        left_index : bool
+        right_index : bool
+        by : label or list of such
+        left_by : label or list of such
+        right_by : label or list of such
+        suffixes : list-like
+        tolerance : int or Timedelta
+        allow_exact_matches : bool
+        direction : {"backward", "forward", "nearest"}
+        **kwargs : dict
+            Serves the compatibility purpose. Does not affect the result.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            QueryCompiler that contains result of the merge.
+        """
+        return DataFrameDefault.register(pandas.merge_asof)(self, right=right, **kwargs)
+
+    @doc_utils.add_refer_to("merge_ordered")
+    def merge_ordered(self, right, **kwargs):  # noqa: PR02
+        """
+        Merge QueryCompiler objects with the result ordered by the keys.
+
+        Parameters
+        ----------
+        right : BaseQueryCompiler
+            QueryCompiler of the right frame to merge with.
+        on : label or list of such
+        left_on : label or list of such
+        right_on : label or list of such
+        left_by : label or list of such
+        right_by : label or list of such
+        fill_method : {"ffill", None}
+        suffixes : list-like
+        how : {"left", "right", "outer", "inner"}
+        **kwargs : dict
+            Serves the compatibility purpose. Does not affect the result.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            QueryCompiler that contains result of the merge.
+        """
+        return DataFrameDefault.register(pandas.merge_ordered)(
+            self, right=right, **kwargs
+        )
+
     @doc_utils.add_refer_to("DataFrame.join")
     def join(self, right, **kwargs):  # noqa: PR02
         """
@@ -1762,6 +1825,49 @@ class BaseQueryCompiler(ClassLogger, abc.ABC):
         """
         return DataFrameDefault.register(pandas.DataFrame.diff)(self, **kwargs)
 
+    @doc_utils.add_refer_to("DataFrame.shift")
+    def shift(self, periods=1, axis=0, fill_value=no_default):
+        """
+        Shift data by the desired number of periods.
+
+        Parameters
+        ----------
+        periods : int, default: 1
+            Number of periods to shift, can be negative.
+        axis : {0, 1}, default: 0
+            Axis to shift along.
+        fill_value : object, optional
+            The scalar value to use for the newly introduced missing values.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            QueryCompiler of the same shape as `self` with the data shifted by `periods`.
+        """
+        return DataFrameDefault.register(pandas.DataFrame.shift)(
+            self, periods=periods, axis=axis, fill_value=fill_value
+        )
+
+    @doc_utils.add_refer_to("DataFrame.duplicated")
+    def duplicated(self, **kwargs):  # noqa: PR02
+        """
+        Mark the duplicate rows.
+
+        Parameters
+        ----------
+        keep : {"first", "last", False}
+            Which occurrence of the duplicate rows is not marked.
+        **kwargs : dict
+            Serves the compatibility purpose. Does not affect the result.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            One-column QueryCompiler with the row labels of `self`, where each row
+            contains whether the corresponding row of `self` is a duplicate.
+        """
+        return DataFrameDefault.register(pandas.DataFrame.duplicated)(self, **kwargs)
+
     @doc_utils.add_refer_to("DataFrame.dropna")
     def dropna(self, **kwargs):  # noqa: PR02
         """
@@ -2003,6 +2109,57 @@ class BaseQueryCompiler(ClassLogger, abc.ABC):
         """
         return DataFrameDefault.register(pandas.DataFrame.melt)(self, *args, **kwargs)
 
+    @doc_utils.add_refer_to("lreshape")
+    def lreshape(self, groups, dropna=True, label=None):
+        """
+        Reshape QueryCompiler data from wide to long format by groups of columns.
+
+        Parameters
+        ----------
+        groups : dict or list of tuples
+            Labels of the new columns mapped to the lists of the columns to stack
+            under them.
+        dropna : bool, default: True
+            Whether to drop the rows having missing values in the new columns.
+        label : optional
+            Deprecated parameter.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            New QueryCompiler with reshaped data.
+        """
+        return DataFrameDefault.register(pandas.lreshape)(
+            self, groups=groups, dropna=dropna, label=label
+        )
+
+    @doc_utils.add_refer_to("wide_to_long")
+    def wide_to_long(self, stubnames, i, j, sep="", suffix=r"\d+"):
+        """
+        Unpivot QueryCompiler data from wide to long format by stubs of column names.
+
+        Parameters
+        ----------
+        stubnames : str or list of str
+            Stub names of the wide columns.
+        i : label or list of labels
+            Columns to use as the id variables.
+        j : label
+            Label of the sub-observation variable.
+        sep : str, default: ""
+            Separator between the stub names and the suffixes.
+        suffix : str, default: "\\d+"
+            Regular expression matching the suffixes.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            New QueryCompiler with unpivoted data.
+        """
+        return DataFrameDefault.register(pandas.wide_to_long)(
+            self, stubnames=stubnames, i=i, j=j, sep=sep, suffix=suffix
+        )
+
     @doc_utils.add_refer_to("DataFrame.sort_values")
     def sort_columns_by_row_values(self, rows, ascending=True, **kwargs):  # noqa: PR02
         """
@@ -2753,6 +2910,24 @@ class BaseQueryCompiler(ClassLogger, abc.ABC):
             drop=drop,
         )
 
+    @doc_utils.doc_groupby_method(
+        action="number each item in each group",
+        result="number of the item in its group",
+        refer_to="cumcount",
+    )
+    def groupby_cumcount(
+        self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False,
+    ):
+        return self.groupby_agg(
+            by=by,
+            agg_func="cumcount",
+            axis=axis,
+            groupby_kwargs=groupby_kwargs,
+            agg_args=agg_args,
+            agg_kwargs=agg_kwargs,
+            drop=drop,
+        )
+
     @doc_utils.doc_groupby_method(
         action="shift data with the specified settings",
         result="shifted value",
@@ -2871,6 +3046,7 @@ class BaseQueryCompiler(ClassLogger, abc.ABC):
         prefix : str or list of such
         prefix_sep : str
         dummy_na : bool
+        sparse : bool
         drop_first : bool
         dtype : dtype
         **kwargs : dict
@@ -4504,6 +4680,156 @@ class BaseQueryCompiler(ClassLogger, abc.ABC):
 
     # End of Window methods
 
+    # Expanding methods
+
+    @doc_utils.doc_window_method(
+        win_type="expanding window", result="number of non-NA values", refer_to="count"
+    )
+    def expanding_count(self, fold_axis, expanding_kwargs):
+        return ExpandingDefault.register(pandas.core.window.expanding.Expanding.count)(
+            self, expanding_kwargs
+        )
+
+    @doc_utils.doc_window_method(
+        win_type="expanding window",
+        result="maximum value",
+        refer_to="max",
+        params="""
+        *args : iterable
+        **kwargs : dict""",
+    )
+    def expanding_max(self, fold_axis, expanding_kwargs, *args, **kwargs):
+        return ExpandingDefault.register(pandas.core.window.expanding.Expanding.max)(
+            self, expanding_kwargs, *args, **kwargs
+        )
+
+    @doc_utils.doc_window_method(
+        win_type="expanding window",
+        result="mean",
+        refer_to="mean",
+        params="""
+        *args : iterable
+        **kwargs : dict""",
+    )
+    def expanding_mean(self, fold_axis, expanding_kwargs, *args, **kwargs):
+        return ExpandingDefault.register(pandas.core.window.expanding.Expanding.mean)(
+            self, expanding_kwargs, *args, **kwargs
+        )
+
+    @doc_utils.doc_window_method(
+        win_type="expanding window",
+        result="minimum value",
+        refer_to="min",
+        params="""
+        *args : iterable
+        **kwargs : dict""",
+    )
+    def expanding_min(self, fold_axis, expanding_kwargs, *args, **kwargs):
+        return ExpandingDefault.register(pandas.core.window.expanding.Expanding.min)(
+            self, expanding_kwargs, *args, **kwargs
+        )
+
+    @doc_utils.doc_window_method(
+        win_type="expanding window",
+        result="standard deviation",
+        refer_to="std",
+        params="""
+        ddof : int, default: 1
+        *args : iterable
+        **kwargs : dict""",
+    )
+    def expanding_std(self, fold_axis, expanding_kwargs, ddof=1, *args, **kwargs):
+        return ExpandingDefault.register(pandas.core.window.expanding.Expanding.std)(
+            self, expanding_kwargs, ddof, *args, **kwargs
+        )
+
+    @doc_utils.doc_window_method(
+        win_type="expanding window",
+        result="sum",
+        refer_to="sum",
+        params="""
+        *args : iterable
+        **kwargs : dict""",
+    )
+    def expanding_sum(self, fold_axis, expanding_kwargs, *args, **kwargs):
+        return ExpandingDefault.register(pandas.core.window.expanding.Expanding.sum)(
+            self, expanding_kwargs, *args, **kwargs
+        )
+
+    @doc_utils.doc_window_method(
+        win_type="expanding window",
+        result="variance",
+        refer_to="var",
+        params="""
+        ddof : int, default: 1
+        *args : iterable
+        **kwargs : dict""",
+    )
+    def expanding_var(self, fold_axis, expanding_kwargs, ddof=1, *args, **kwargs):
+        return ExpandingDefault.register(pandas.core.window.expanding.Expanding.var)(
+            self, expanding_kwargs, ddof, *args, **kwargs
+        )
+
+    # End of Expanding methods
+
+    # ExponentialMovingWindow methods
+
+    @doc_utils.doc_window_method(
+        win_type="exponentially weighted window",
+        result="mean",
+        refer_to="mean",
+        params="""
+        *args : iterable
+        **kwargs : dict""",
+    )
+    def ewm_mean(self, fold_axis, ewm_kwargs, *args, **kwargs):
+        return EwmDefault.register(pandas.core.window.ewm.ExponentialMovingWindow.mean)(
+            self, ewm_kwargs, *args, **kwargs
+        )
+
+    @doc_utils.doc_window_method(
+        win_type="exponentially weighted window",
+        result="standard deviation",
+        refer_to="std",
+        params="""
+        bias : bool, default: False
+        *args : iterable
+        **kwargs : dict""",
+    )
+    def ewm_std(self, fold_axis, ewm_kwargs, bias=False, *args, **kwargs):
+        return EwmDefault.register(pandas.core.window.ewm.ExponentialMovingWindow.std)(
+            self, ewm_kwargs, bias, *args, **kwargs
+        )
+
+    @doc_utils.doc_window_method(
+        win_type="exponentially weighted window",
+        result="sum",
+        refer_to="sum",
+        params="""
+        *args : iterable
+        **kwargs : dict""",
+    )
+    def ewm_sum(self, fold_axis, ewm_kwargs, *args, **kwargs):
+        return EwmDefault.register(pandas.core.window.ewm.ExponentialMovingWindow.sum)(
+            self, ewm_kwargs, *args, **kwargs
+        )
+
+    @doc_utils.doc_window_method(
+        win_type="exponentially weighted window",
+        result="variance",
+        refer_to="var",
+        params="""
+        bias : bool, default: False
+        *args : iterable
+        **kwargs : dict""",
+    )
+    def ewm_var(self, fold_axis, ewm_kwargs, bias=False, *args, **kwargs):
+        return EwmDefault.register(pandas.core.window.ewm.ExponentialMovingWindow.var)(
+            self, ewm_kwargs, bias, *args, **kwargs
+        )
+
+    # End of ExponentialMovingWindow methods
+
     # Categories methods
 
     @doc_utils.add_one_column_warning
@@ -0,0 +1,462 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""
+Module houses kernels computing expanding and exponentially weighted moments.
+
+The moments of the rows seen so far are summarized by a small state per column,
+so the rows can be processed by partitions: the state of the preceding partitions
+is carried into the next one, see ``PandasDataframe.scan``.
+"""
+
+import numpy as np
+import pandas
+
+
+class Moments:
+    """
+    Base class for the kernels computing window aggregations from carried states.
+
+    A state maps the names from `STATS` to arrays of the values per column (1D)
+    or per row and column (2D) and is passed between partitions as a
+    ``pandas.DataFrame`` with a row per statistic. The values are positional,
+    so the labels of the partitions are never aligned.
+    """
+
+    STATS = []
+    # Values of the statistics for no rows.
+    EMPTY = {}
+
+    @classmethod
+    def local(cls, values, **params):
+        """
+        Compute the state of every row of a partition not preceded by other rows.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            2D float array of the partition values.
+        **params : dict
+            Parameters of the window.
+
+        Returns
+        -------
+        dict
+            The state holding 2D arrays.
+        """
+        raise NotImplementedError()
+
+    @classmethod
+    def merge(cls, left, right, **params):
+        """
+        Merge the state of the preceding rows into the state of the following rows.
+
+        Parameters
+        ----------
+        left : dict
+            The state of the preceding rows, holding 1D arrays.
+        right : dict
+            The state of the following rows, holding 1D or 2D arrays.
+        **params : dict
+            Parameters of the window.
+
+        Returns
+        -------
+        dict
+            The state of all of the rows, shaped like `right`.
+        """
+        raise NotImplementedError()
+
+    @classmethod
+    def finalize(cls, state, agg, min_periods, *args, **params):
+        """
+        Compute an aggregation from the state.
+
+        Parameters
+        ----------
+        state : dict
+            The state to compute the aggregation from.
+        agg : str
+            The name of the aggregation.
+        min_periods : int
+            Minimum number of observations required to have a value.
+        *args : iterable
+            Additional arguments of the aggregation.
+        **params : dict
+            Parameters of the window.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def _get_values(df):
+        """
+        Get the values of the frame as a float array.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return df.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    @classmethod
+    def carry(cls, df, **params):
+        """
+        Compute the state of the last row of a partition.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            The partition.
+        **params : dict
+            Parameters of the window.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        values = cls._get_values(df)
+        if len(values) == 0:
+            state = {key: np.full(values.shape[1], cls.EMPTY[key]) for key in cls.STATS}
+        else:
+            state = {
+                key: value[-1] for key, value in cls.local(values, **params).items()
+            }
+        return pandas.DataFrame([state[key] for key in cls.STATS], index=cls.STATS)
+
+    @classmethod
+    def combine(cls, offset, carry, **params):
+        """
+        Combine the state of the preceding partitions with the state of the next one.
+
+        Parameters
+        ----------
+        offset : pandas.DataFrame
+            The state of the preceding partitions.
+        carry : pandas.DataFrame
+            The state of the next partition.
+        **params : dict
+            Parameters of the window.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        state = cls.merge(cls._from_frame(offset), cls._from_frame(carry), **params)
+        return pandas.DataFrame([state[key] for key in cls.STATS], index=cls.STATS)
+
+    @classmethod
+    def scan(cls, df, offset, agg, min_periods, *args, **params):
+        """
+        Compute an aggregation for every row of a partition.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            The partition.
+        offset : pandas.DataFrame or None
+            The state of the preceding partitions, None for the first partition.
+        agg : str
+            The name of the aggregation.
+        min_periods : int
+            Minimum number of observations required to have a value.
+        *args : iterable
+            Additional arguments of the aggregation.
+        **params : dict
+            Parameters of the window.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        state = cls.local(cls._get_values(df), **params)
+        if offset is not None:
+            state = cls.merge(cls._from_frame(offset), state, **params)
+        return pandas.DataFrame(
+            cls.finalize(state, agg, min_periods, *args, **params),
+            index=df.index,
+            columns=df.columns,
+        )
+
+    @classmethod
+    def _from_frame(cls, frame):
+        """
+        Convert the state from the frame it was passed between partitions in.
+
+        Parameters
+        ----------
+        frame : pandas.DataFrame
+
+        Returns
+        -------
+        dict
+        """
+        return {key: frame.loc[key].to_numpy() for key in cls.STATS}
+
+
+class ExpandingMoments(Moments):
+    """
+    Kernels computing expanding window aggregations.
+
+    The state of a column is the number of rows, the number, sum, mean and sum of
+    squared deviations from the mean of the observations and their extremes.
+    """
+
+    STATS = ["rows", "count", "sum", "mean", "m2", "min", "max"]
+    EMPTY = {
+        "rows": 0,
+        "count": 0,
+        "sum": 0,
+        "mean": np.nan,
+        "m2": 0,
+        "min": np.nan,
+        "max": np.nan,
+    }
+
+    @classmethod
+    def local(cls, values):
+        is_valid = ~np.isnan(values)
+        count = np.cumsum(is_valid, axis=0, dtype=np.float64)
+        # The deviations from the first observation are accumulated instead of
+        # the values themselves, so the precision isn't lost for large values.
+        if len(values):
+            shift = values[is_valid.argmax(axis=0), np.arange(values.shape[1])]
+            shift = np.nan_to_num(shift)
+        else:
+            shift = np.zeros(values.shape[1])
+        deviation = np.where(is_valid, values - shift, 0)
+        sum_dev = np.cumsum(deviation, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = shift + sum_dev / count
+            m2 = np.where(
+                count > 0, np.cumsum(deviation ** 2, axis=0) - sum_dev ** 2 / count, 0
+            )
+        rows = np.arange(1, len(values) + 1, dtype=np.float64)
+        return {
+            "rows": np.broadcast_to(rows[:, None], values.shape),
+            "count": count,
+            "sum": np.nancumsum(values, axis=0),
+            "mean": mean,
+            "m2": m2,
+            "min": np.fmin.accumulate(values, axis=0),
+            "max": np.fmax.accumulate(values, axis=0),
+        }
+
+    @classmethod
+    def merge(cls, left, right):
+        count = left["count"] + right["count"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta = right["mean"] - left["mean"]
+            mean = np.where(
+                left["count"] == 0,
+                right["mean"],
+                np.where(
+                    right["count"] == 0,
+                    left["mean"],
+                    left["mean"] + delta * right["count"] / count,
+                ),
+            )
+            m2 = (
+                left["m2"]
+                + right["m2"]
+                + np.where(
+                    (left["count"] > 0) & (right["count"] > 0),
+                    delta ** 2 * left["count"] * right["count"] / count,
+                    0,
+                )
+            )
+        return {
+            "rows": left["rows"] + right["rows"],
+            "count": count,
+            "sum": left["sum"] + right["sum"],
+            "mean": mean,
+            "m2": m2,
+            "min": np.fmin(left["min"], right["min"]),
+            "max": np.fmax(left["max"], right["max"]),
+        }
+
+    @classmethod
+    def finalize(cls, state, agg, min_periods, *args):
+        count = state["count"]
+        if agg == "count":
+            return np.where(state["rows"] >= min_periods, count, np.nan)
+        if agg == "sum":
+            return np.where(count >= min_periods, state["sum"], np.nan)
+        has_value = count >= max(min_periods, 1)
+        if agg in ("var", "std"):
+            ddof = args[0] if len(args) else 1
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result = np.where(
+                    has_value & (count > ddof),
+                    np.maximum(state["m2"], 0) / (count - ddof),
+                    np.nan,
+                )
+            return np.sqrt(result) if agg == "std" else result
+        return np.where(has_value, state[agg], np.nan)
+
+
+class EwmMoments(Moments):
+    """
+    Kernels computing exponentially weighted window aggregations.
+
+    Only windows with ``adjust=True`` are supported. The state of a column is the
+    number of rows and observations, the row of the first observation, the total
+    weight of the observations and of their squared weights, their weighted mean,
+    sum and sum of squared deviations from the mean. Carrying the state into the
+    following rows decays the weights.
+    """
+
+    STATS = ["rows", "count", "first", "weight", "weight2", "mean", "m2", "sum"]
+    EMPTY = {
+        "rows": 0,
+        "count": 0,
+        "first": np.nan,
+        "weight": 0,
+        "weight2": 0,
+        "mean": np.nan,
+        "m2": 0,
+        "sum": 0,
+    }
+
+    @classmethod
+    def local(cls, values, alpha, ignore_na):
+        is_valid = ~np.isnan(values)
+        window = pandas.DataFrame(values).ewm(alpha=alpha, ignore_na=ignore_na)
+        # The total weight is the exponentially weighted sum of ones placed at
+        # the observations, the squared weights decay with the squared factor.
+        observations = pandas.DataFrame(np.where(is_valid, 1.0, np.nan))
+        weight = observations.ewm(alpha=alpha, ignore_na=ignore_na).sum()
+        weight = np.nan_to_num(weight.to_numpy())
+        weight2 = observations.ewm(alpha=1 - (1 - alpha) ** 2, ignore_na=ignore_na)
+        rows = np.broadcast_to(
+            np.arange(1, len(values) + 1, dtype=np.float64)[:, None], values.shape
+        )
+        return {
+            "rows": rows,
+            "count": np.cumsum(is_valid, axis=0, dtype=np.float64),
+            "first": np.fmin.accumulate(np.where(is_valid, rows, np.nan), axis=0),
+            "weight": weight,
+            "weight2": np.nan_to_num(weight2.sum().to_numpy()),
+            "mean": window.mean().to_numpy(),
+            "m2": np.nan_to_num(window.var(bias=True).to_numpy() * weight),
+            "sum": np.nan_to_num(window.sum().to_numpy()),
+        }
+
+    @classmethod
+    def merge(cls, left, right, alpha, ignore_na):
+        # The weights decay with every following row, or only with every
+        # following observation if the missing values are ignored.
+        decay = (1 - alpha) ** (right["count"] if ignore_na else right["rows"])
+        weight = left["weight"] * decay
+        total_weight = weight + right["weight"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta = right["mean"] - left["mean"]
+            mean = np.where(
+                right["count"] == 0,
+                left["mean"],
+                np.where(
+                    (left["count"] == 0) | (weight == 0),
+                    right["mean"],
+                    (left["mean"] * weight + right["mean"] * right["weight"])
+                    / total_weight,
+                ),
+            )
+            m2 = (
+                left["m2"] * decay
+                + right["m2"]
+                + np.where(
+                    (weight > 0) & (right["weight"] > 0),
+                    delta ** 2 * weight * right["weight"] / total_weight,
+                    0,
+                )
+            )
+        return {
+            "rows": left["rows"] + right["rows"],
+            "count": left["count"] + right["count"],
+            "first": np.where(
+                left["count"] > 0, left["first"], left["rows"] + right["first"]
+            ),
+            "weight": total_weight,
+            "weight2": left["weight2"] * decay ** 2 + right["weight2"],
+            "mean": mean,
+            "m2": m2,
+            "sum": left["sum"] * decay + right["sum"],
+        }
+
+    @classmethod
+    def finalize(cls, state, agg, min_periods, *args, alpha, ignore_na):
+        count = state["count"]
+        has_value = count >= max(min_periods, 1)
+        if agg in ("var", "std"):
+            bias = args[0] if len(args) else False
+            weight = state["weight"]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if bias:
+                    # The weights of all of the observations decay to zero after
+                    # a missing value if ``alpha`` is 1.
+                    result = np.where(weight > 0, state["m2"] / weight, 0)
+                else:
+                    denominator = weight ** 2 - state["weight2"]
+                    result = np.where(
+                        (count > 1) & (denominator > 0),
+                        state["m2"] * weight / denominator,
+                        np.nan,
+                    )
+                    if not ignore_na:
+                        result = cls._single_observation_var(
+                            result, state, 1 - alpha
+                        )
+            result = np.where(has_value, np.maximum(result, 0), np.nan)
+            return np.sqrt(result) if agg == "std" else result
+        return np.where(has_value, state[agg], np.nan)
+
+    @staticmethod
+    def _single_observation_var(result, state, factor):
+        """
+        Set the unbiased variance of the single observations followed by missing values.
+
+        The variance of a single observation is undefined, however pandas decays
+        the weights with every missing value and gets zero if the rounding makes
+        the total squared weight less than the squared total weight.
+
+        Parameters
+        ----------
+        result : np.ndarray
+            The variance computed from the state.
+        state : dict
+            The state the variance is computed from.
+        factor : float
+            The decay factor of the weights.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        single = state["count"] == 1
+        if not single.any():
+            return result
+        decays = (state["rows"] - state["first"])[single].astype(np.int64)
+        weight = np.multiply.accumulate(np.full(decays.max() + 1, factor))
+        weight2 = np.multiply.accumulate(np.full(decays.max() + 1, factor * factor))
+        weight = np.concatenate([[1.0], weight])[decays]
+        weight2 = np.concatenate([[1.0], weight2])[decays]
+        result = result.copy()
+        result[single] = np.where(weight * weight - weight2 > 0, 0.0, np.nan)
+        return result
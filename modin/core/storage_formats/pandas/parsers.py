@@ -621,6 +621,9 @@ class PandasJSONParser(PandasParser):
             ) as bio:
                 bio.seek(start)
                 to_read = b"" + bio.read(end - start)
+            if not kwargs.get("lines", False):
+                # the chunk holds elements of a top-level array without the brackets
+                to_read = b"[" + to_read + b"]"
             columns = kwargs.pop("columns")
             pandas_df = pandas.read_json(BytesIO(to_read), **kwargs)
         else:
@@ -655,29 +658,89 @@ class ParquetFileToRead(NamedTuple):
     row_group_end: int
 
 
+def _filters_to_expression(filters):
+    """
+    Convert parquet `filters` in disjunctive normal form to a PyArrow expression.
+
+    Parameters
+    ----------
+    filters : list of tuples or list of lists of tuples
+        Filters in the format accepted by ``pyarrow.parquet.read_table``.
+
+    Returns
+    -------
+    pyarrow.dataset.Expression
+    """
+    try:
+        from pyarrow.parquet import filters_to_expression
+    except ImportError:  # pyarrow < 10.0
+        from pyarrow.parquet import _filters_to_expression as filters_to_expression
+
+    return filters_to_expression(filters)
+
+
+def _get_filter_columns(filters):
+    """
+    Get the names of the columns that parquet `filters` refer to.
+
+    Parameters
+    ----------
+    filters : list of tuples or list of lists of tuples
+        Filters in disjunctive normal form.
+
+    Returns
+    -------
+    list
+    """
+    conjunctions = filters if isinstance(filters[0], list) else [filters]
+    return list(
+        OrderedDict.fromkeys(
+            column for conjunction in conjunctions for column, _, _ in conjunction
+        )
+    )
+
+
 @doc(_doc_pandas_parser_class, data_type="PARQUET data")
 class PandasParquetParser(PandasParser):
     @staticmethod
     def _read_row_group_chunk(
-        f, row_group_start, row_group_end, columns, engine
+        f, row_group_start, row_group_end, columns, filters, engine
     ):  # noqa: GL08
         if engine == "pyarrow":
+            from pyarrow.dataset import dataset
             from pyarrow.parquet import ParquetFile
 
-            return (
-                ParquetFile(f)
-                .read_row_groups(
-                    range(row_group_start, row_group_end,),
-                    columns=columns,
-                    use_pandas_metadata=True,
-                )
-                .to_pandas()
+            filter_columns = []
+            if filters is not None and columns is not None:
+                # Columns that are only needed to evaluate the filters
+                filter_columns = [
+                    column
+                    for column in _get_filter_columns(filters)
+                    if column not in columns
+                ]
+            table = ParquetFile(f).read_row_groups(
+                range(row_group_start, row_group_end,),
+                columns=None if columns is None else columns + filter_columns,
+                use_pandas_metadata=True,
             )
+            if filters is not None:
+                table = dataset(table).to_table(filter=_filters_to_expression(filters))
+            if filter_columns:
+                pandas_metadata = table.schema.pandas_metadata or {}
+                index_columns = pandas_metadata.get("index_columns", [])
+                table = table.select(
+                    [
+                        name
+                        for name in table.column_names
+                        if name not in filter_columns or name in index_columns
+                    ]
+                )
+            return table.to_pandas()
         elif engine == "fastparquet":
             from fastparquet import ParquetFile
 
             return ParquetFile(f)[row_group_start:row_group_end].to_pandas(
-                columns=columns
+                columns=columns, filters=filters or []
             )
         else:
             # We shouldn't ever come to this case, so something went wrong
@@ -696,6 +759,7 @@ engine : str
     )
     def parse(files_for_parser, engine, **kwargs):
         columns = kwargs.get("columns", None)
+        filters = kwargs.get("filters", None)
         storage_options = kwargs.pop("storage_options", {}) or {}
         chunks = []
         # `single_worker_read` just passes in a string path
@@ -713,6 +777,7 @@ engine : str
                     file_for_parser.row_group_start,
                     file_for_parser.row_group_end,
                     columns,
+                    filters,
                     engine,
                 )
             chunks.append(chunk)
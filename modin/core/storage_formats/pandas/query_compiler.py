@@ -21,7 +21,7 @@ queries for the ``PandasDataframe``.
 import numpy as np
 import pandas
 import functools
-from pandas.core.common import is_bool_indexer
+from pandas.core.common import is_bool_indexer, get_cython_func
 from pandas.core.indexing import check_bool_indexer
 from pandas.core.indexes.api import ensure_index_from_sequences
 from pandas.core.dtypes.common import (
@@ -30,12 +30,25 @@ from pandas.core.dtypes.common import (
     is_datetime_or_timedelta_dtype,
     is_datetime64_any_dtype,
     is_bool_dtype,
+    is_categorical_dtype,
+    is_integer,
+    is_integer_dtype,
+    is_float,
+    is_object_dtype,
+)
+from pandas.core.dtypes.cast import (
+    find_common_type,
+    maybe_downcast_to_dtype,
+    maybe_promote,
 )
 from pandas.core.base import DataError
+from pandas.core.window.ewm import get_center_of_mass
+from pandas._libs.lib import no_default
 from collections.abc import Iterable
 from typing import List, Hashable
 import warnings
 
+from modin.config import ApproximateReductions, BroadcastJoinThreshold, NPartitions
 from modin.core.storage_formats.base.query_compiler import BaseQueryCompiler
 from modin.error_message import ErrorMessage
 from modin.utils import (
@@ -49,13 +62,25 @@ from modin.core.dataframe.algebra import (
     Fold,
     Map,
     TreeReduce,
+    Window,
+    Scan,
     Reduce,
     Binary,
     GroupByReduce,
     groupby_reduce_functions,
     is_reduce_function,
 )
+from modin.core.dataframe.algebra.default2pandas import ExpandingDefault, EwmDefault
 from modin.core.dataframe.algebra.default2pandas.groupby import GroupBy, GroupByDefault
+from modin.core.dataframe.pandas.dataframe.utils import ShuffleGroupByFunctions
+from modin.core.storage_formats.pandas.moments import ExpandingMoments, EwmMoments
+from modin.core.storage_formats.pandas.sketches import (
+    HyperLogLog,
+    QuantileBand,
+    QuantileSketch,
+    interpolate,
+    quantile_positions,
+)
 from modin._compat.core.pd_common import pd_pivot_table, pd_convert_dtypes
 
 
@@ -219,6 +244,546 @@ def copy_df_for_func(func, display_name: str = None):
     return caller
 
 
+def _get_rolling_window_size(axis, rolling_args):
+    """
+    Get the number of rows every window of a rolling aggregation spans.
+
+    Parameters
+    ----------
+    axis : int or str
+        The axis the windows slide over.
+    rolling_args : list
+        Arguments of ``pandas.DataFrame.rolling``.
+
+    Returns
+    -------
+    int or None
+        The number of rows, None if the windows aren't a fixed number of rows.
+    """
+    window, _, center, _, on, _, closed, *method = rolling_args
+    if (
+        axis not in (0, "index", "rows")
+        or not is_integer(window)
+        or window < 0
+        or center
+        or on is not None
+        or method not in ([], ["single"])
+    ):
+        return None
+    # Left-closed windows also include the row preceding the window.
+    return window + 1 if closed in ("both", "left") else window
+
+
+def _rolling_func(func):
+    """
+    Build query compiler method computing a rolling aggregation with `func`.
+
+    Windows spanning a fixed number of rows are computed for every row partition
+    independently using the trailing rows of the preceding partitions, the other
+    windows are computed over full columns.
+
+    Parameters
+    ----------
+    func : callable(pandas.DataFrame, rolling_args, *args, **kwargs) -> pandas.DataFrame
+        Function computing the rolling aggregation.
+
+    Returns
+    -------
+    callable
+        Function that takes query compiler and executes the rolling aggregation.
+    """
+    fold_caller = Fold.register(func)
+    window_caller = Window.register(func)
+
+    def caller(query_compiler, axis, rolling_args, *args, **kwargs):
+        """Compute the rolling aggregation of the passed query compiler."""
+        window_size = _get_rolling_window_size(axis, rolling_args)
+        if window_size is None:
+            return fold_caller(query_compiler, axis, rolling_args, *args, **kwargs)
+        return window_caller(
+            query_compiler, 0, window_size, rolling_args, *args, **kwargs
+        )
+
+    return caller
+
+
+def _is_scannable_dtype(dtype):
+    """
+    Check whether the cumulative functions over the values of `dtype` can be scanned by partitions.
+
+    Parameters
+    ----------
+    dtype : dtype
+
+    Returns
+    -------
+    bool
+        False if a cumulative function may change the data type of the values, so
+        the results for the partitions can't be combined with each other.
+    """
+    return (
+        is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
+    ) or is_datetime_or_timedelta_dtype(dtype)
+
+
+def _cumulative_func(func):
+    """
+    Build query compiler method computing a cumulative function along an axis.
+
+    Cumulative functions along the rows are computed with a parallel prefix scan,
+    the others are computed over full rows/columns.
+
+    Parameters
+    ----------
+    func : callable(pandas.DataFrame, *args, **kwargs) -> pandas.DataFrame
+        The cumulative function taking `skipna` argument.
+
+    Returns
+    -------
+    callable
+        Function that takes query compiler and executes the cumulative function.
+    """
+    fold_caller = Fold.register(func)
+    scan_caller = Scan.register(func)
+
+    def caller(query_compiler, fold_axis, *args, **kwargs):
+        """Compute the cumulative function of the passed query compiler."""
+        if fold_axis == 0 and all(
+            _is_scannable_dtype(dtype) for dtype in query_compiler.dtypes
+        ):
+            return scan_caller(query_compiler, 0, *args, **kwargs)
+        return fold_caller(query_compiler, fold_axis, *args, **kwargs)
+
+    return caller
+
+
+def _moments_scan(query_compiler, moments, agg, min_periods, *args, **params):
+    """
+    Compute a window aggregation along the rows by carrying the moments of the rows.
+
+    Parameters
+    ----------
+    query_compiler : PandasQueryCompiler
+        The query compiler to compute the aggregation of, must have numeric columns.
+    moments : type
+        The ``modin.core.storage_formats.pandas.moments.Moments`` subclass computing
+        the aggregation.
+    agg : str
+        The name of the aggregation.
+    min_periods : int
+        Minimum number of observations required to have a value.
+    *args : iterable
+        Additional arguments of the aggregation.
+    **params : dict
+        Parameters of the window.
+
+    Returns
+    -------
+    PandasQueryCompiler
+    """
+    frame = query_compiler._modin_frame
+    return query_compiler.__constructor__(
+        frame.scan(
+            0,
+            lambda df: moments.carry(df, **params),
+            lambda offset, carry: moments.combine(offset, carry, **params),
+            lambda df, offset: moments.scan(
+                df, offset, agg, min_periods, *args, **params
+            ),
+            dtypes=pandas.Series(np.dtype(np.float64), index=frame.columns),
+        )
+    )
+
+
+def _can_scan_moments(query_compiler, axis, window_kwargs, args, kwargs, num_args):
+    """
+    Check whether a window aggregation can be computed by carrying the row moments.
+
+    Parameters
+    ----------
+    query_compiler : PandasQueryCompiler
+        The query compiler to compute the aggregation of.
+    axis : int
+        The axis to compute the aggregation along.
+    window_kwargs : dict
+        Arguments of the method creating the window.
+    args : tuple
+        Positional arguments of the aggregation.
+    kwargs : dict
+        Keyword arguments of the aggregation.
+    num_args : int
+        The number of positional arguments supported by the aggregation.
+
+    Returns
+    -------
+    bool
+    """
+    return (
+        axis == 0
+        and len(args) <= num_args
+        and not kwargs
+        and window_kwargs.get("method", "single") == "single"
+        and is_integer(window_kwargs.get("min_periods"))
+        # The precision of the other types is lost when converting them to float.
+        and all(dtype.kind in "iuf" for dtype in query_compiler.dtypes)
+    )
+
+
+def _expanding_func(agg):
+    """
+    Build query compiler method computing an expanding window aggregation.
+
+    The aggregations along the rows are computed for every row partition in parallel
+    continuing the count, sum, sum of squared deviations and extremes of the preceding
+    partitions, the others are computed over full rows/columns.
+
+    Parameters
+    ----------
+    agg : {"count", "sum", "mean", "var", "std", "min", "max"}
+        The name of the aggregation.
+
+    Returns
+    -------
+    callable
+        Function that takes query compiler and computes the aggregation.
+    """
+    fold_caller = Fold.register(
+        lambda df, expanding_kwargs, *args, **kwargs: pandas.DataFrame(
+            getattr(df.expanding(**expanding_kwargs), agg)(*args, **kwargs)
+        )
+    )
+
+    default_caller = ExpandingDefault.register(
+        getattr(pandas.core.window.expanding.Expanding, agg)
+    )
+
+    def caller(query_compiler, fold_axis, expanding_kwargs, *args, **kwargs):
+        """Compute the expanding aggregation of the passed query compiler."""
+        if not all(is_numeric_dtype(dtype) for dtype in query_compiler.dtypes):
+            # pandas drops the non-numeric columns, the shape of the frame can't
+            # be changed by a full-axis function.
+            return default_caller(query_compiler, expanding_kwargs, *args, **kwargs)
+        if not expanding_kwargs.get("center") and _can_scan_moments(
+            query_compiler,
+            fold_axis,
+            expanding_kwargs,
+            args,
+            kwargs,
+            num_args=1 if agg in ("var", "std") else 0,
+        ):
+            return _moments_scan(
+                query_compiler,
+                ExpandingMoments,
+                agg,
+                expanding_kwargs["min_periods"],
+                *args,
+            )
+        return fold_caller(
+            query_compiler, fold_axis, expanding_kwargs, *args, **kwargs
+        )
+
+    return caller
+
+
+def _ewm_func(agg):
+    """
+    Build query compiler method computing an exponentially weighted window aggregation.
+
+    The aggregations along the rows of the adjusted windows are computed for every
+    row partition in parallel continuing the decayed weights, mean and sum of the
+    preceding partitions, the others are computed over full rows/columns.
+
+    Parameters
+    ----------
+    agg : {"mean", "sum", "var", "std"}
+        The name of the aggregation.
+
+    Returns
+    -------
+    callable
+        Function that takes query compiler and computes the aggregation.
+    """
+    fold_caller = Fold.register(
+        lambda df, ewm_kwargs, *args, **kwargs: pandas.DataFrame(
+            getattr(df.ewm(**ewm_kwargs), agg)(*args, **kwargs)
+        )
+    )
+
+    default_caller = EwmDefault.register(
+        getattr(pandas.core.window.ewm.ExponentialMovingWindow, agg)
+    )
+
+    def caller(query_compiler, fold_axis, ewm_kwargs, *args, **kwargs):
+        """Compute the exponentially weighted aggregation of the query compiler."""
+        if not all(is_numeric_dtype(dtype) for dtype in query_compiler.dtypes):
+            # pandas drops the non-numeric columns, the shape of the frame can't
+            # be changed by a full-axis function.
+            return default_caller(query_compiler, ewm_kwargs, *args, **kwargs)
+        if (
+            ewm_kwargs.get("adjust", True)
+            and ewm_kwargs.get("times") is None
+            and _can_scan_moments(
+                query_compiler,
+                fold_axis,
+                ewm_kwargs,
+                args,
+                kwargs,
+                num_args=1 if agg in ("var", "std") else 0,
+            )
+        ):
+            com = get_center_of_mass(
+                ewm_kwargs.get("com"),
+                ewm_kwargs.get("span"),
+                ewm_kwargs.get("halflife"),
+                ewm_kwargs.get("alpha"),
+            )
+            return _moments_scan(
+                query_compiler,
+                EwmMoments,
+                agg,
+                ewm_kwargs["min_periods"],
+                *args,
+                alpha=1 / (1 + com),
+                ignore_na=bool(ewm_kwargs.get("ignore_na", False)),
+            )
+        return fold_caller(query_compiler, fold_axis, ewm_kwargs, *args, **kwargs)
+
+    return caller
+
+
+def _can_sketch(query_compiler):
+    """
+    Check whether the columns can be summarized by the quantile sketches.
+
+    Parameters
+    ----------
+    query_compiler : PandasQueryCompiler
+        The query compiler to summarize.
+
+    Returns
+    -------
+    bool
+    """
+    return (
+        len(query_compiler.columns) > 0
+        and len(query_compiler.index) > 0
+        and all(
+            # The other types either aren't ordered as NumPy arrays or have
+            # their own semantics of the missing values and quantiles.
+            isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+            for dtype in query_compiler.dtypes
+        )
+    )
+
+
+def _reduce_sketches(query_compiler, sketch, merge):
+    """
+    Summarize the columns by sketching every partition and merging the sketches.
+
+    Parameters
+    ----------
+    query_compiler : PandasQueryCompiler
+        The query compiler to summarize.
+    sketch : callable(np.ndarray) -> object
+        Function building the sketch of a column of a partition.
+    merge : callable(object, object) -> object
+        Function merging two sketches of a column.
+
+    Returns
+    -------
+    list
+        The sketches of the columns.
+    """
+
+    def map_func(df):
+        return pandas.Series(
+            [sketch(df.iloc[:, i].to_numpy()) for i in range(len(df.columns))],
+            index=df.columns,
+            dtype=object,
+        )
+
+    def reduce_func(df):
+        return pandas.Series(
+            [functools.reduce(merge, df.iloc[:, i]) for i in range(len(df.columns))],
+            index=df.columns,
+            dtype=object,
+        )
+
+    result = query_compiler._modin_frame.tree_reduce(0, map_func, reduce_func)
+    return list(result.to_pandas().iloc[0])
+
+
+def _quantile_sketches(query_compiler):
+    """
+    Summarize the order statistics of the columns.
+
+    Parameters
+    ----------
+    query_compiler : PandasQueryCompiler
+        The query compiler to summarize, see ``_can_sketch``.
+
+    Returns
+    -------
+    list of QuantileSketch
+        The sketches of the columns, compressed to ``QuantileSketch.SIZE`` values
+        if only the approximate quantiles are needed.
+    """
+    size = QuantileSketch.SIZE if ApproximateReductions.get() else None
+    return _reduce_sketches(
+        query_compiler,
+        QuantileSketch.from_values,
+        lambda left, right: left.merge(right, size),
+    )
+
+
+def _collect_bands(query_compiler, intervals):
+    """
+    Collect the values of the columns lying in the intervals.
+
+    Parameters
+    ----------
+    query_compiler : PandasQueryCompiler
+        The query compiler to collect the values of.
+    intervals : list of lists
+        The intervals of every column, see ``QuantileBand``.
+
+    Returns
+    -------
+    list of QuantileBand
+        The values of the columns.
+    """
+    frame = query_compiler._modin_frame
+    partition_mgr_cls = frame._partition_mgr_cls
+    select = partition_mgr_cls.preprocess_func(
+        lambda df, intervals: [
+            QuantileBand.from_values(df.iloc[:, i].to_numpy(), intervals[i])
+            for i in range(len(df.columns))
+        ]
+    )
+    offsets = np.cumsum([0] + frame.column_widths)
+    blocks = partition_mgr_cls.get_objects_from_partitions(
+        [
+            part.apply(select, intervals[offsets[j] : offsets[j + 1]])
+            for row in frame._partitions
+            for j, part in enumerate(row)
+        ]
+    )
+    # The bands of every column block are merged across the row partitions.
+    num_blocks = frame._partitions.shape[1]
+    return [
+        functools.reduce(
+            QuantileBand.merge, [bands[i] for bands in blocks[j::num_blocks]]
+        )
+        for j in range(num_blocks)
+        for i in range(offsets[j + 1] - offsets[j])
+    ]
+
+
+def _take_sorted(query_compiler, sketches, positions):
+    """
+    Find the values at the positions of the sorted columns.
+
+    The values are estimated from the sketches if ``modin.config.ApproximateReductions``
+    is set. Otherwise, the sketches bound the values, and only the values of the
+    columns within the bounds are collected and sorted.
+
+    Parameters
+    ----------
+    query_compiler : PandasQueryCompiler
+        The query compiler the sketches summarize.
+    sketches : list of QuantileSketch
+        The sketches of the columns.
+    positions : list of np.ndarray
+        The positions of the values in every sorted column, starting from 0.
+
+    Returns
+    -------
+    list of np.ndarray
+        The values of the columns.
+    """
+    if ApproximateReductions.get():
+        values = [
+            [sketch.query(pos + 1) for pos in pos_list]
+            for sketch, pos_list in zip(sketches, positions)
+        ]
+    else:
+        bounds = [
+            [sketch.bounds(pos + 1) for pos in pos_list]
+            for sketch, pos_list in zip(sketches, positions)
+        ]
+        # The values with equal bounds are known without looking at the columns.
+        is_known = [
+            [lower is not None and lower == upper for lower, upper in column]
+            for column in bounds
+        ]
+        intervals = [
+            list(dict.fromkeys(b for b, known in zip(column, known) if not known))
+            for column, known in zip(bounds, is_known)
+        ]
+        if any(intervals):
+            bands = _collect_bands(query_compiler, intervals)
+        else:
+            bands = [None] * len(sketches)
+        values = []
+        for band, pos_list, column, known in zip(bands, positions, bounds, is_known):
+            taken = iter(
+                band.take([pos + 1 for pos, k in zip(pos_list, known) if not k])
+                if band is not None
+                else []
+            )
+            values.append(
+                [lower if k else next(taken) for (lower, _), k in zip(column, known)]
+            )
+    return [
+        np.array(column, dtype=sketch.values.dtype)
+        for column, sketch in zip(values, sketches)
+    ]
+
+
+def _sketch_quantiles(query_compiler, sketches, q, interpolation):
+    """
+    Compute the quantiles of the columns summarized by the sketches as pandas does.
+
+    Parameters
+    ----------
+    query_compiler : PandasQueryCompiler
+        The query compiler the sketches summarize.
+    sketches : list of QuantileSketch
+        The sketches of the columns.
+    q : list-like
+        The quantiles to compute.
+    interpolation : {"linear", "lower", "higher", "midpoint", "nearest"}
+        The interpolation method.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The quantiles of the columns, indexed by `q`.
+    """
+    positions = [
+        quantile_positions(sketch.count, q, interpolation)
+        if sketch.count
+        else (np.array([], dtype=np.int64),) * 2 + (None,)
+        for sketch in sketches
+    ]
+    values = _take_sorted(
+        query_compiler,
+        sketches,
+        [np.concatenate([lower, upper]) for lower, upper, _ in positions],
+    )
+    result = {}
+    for i, (sketch, (lower, _, fraction), taken) in enumerate(
+        zip(sketches, positions, values)
+    ):
+        if sketch.count == 0:
+            result[i] = np.full(len(q), np.nan)
+        else:
+            result[i] = interpolate(taken[: len(lower)], taken[len(lower) :], fraction)
+    result = pandas.DataFrame(result, index=pandas.Float64Index(q))
+    result.columns = query_compiler.columns
+    return result
+
+
 @_inherit_docstrings(BaseQueryCompiler)
 class PandasQueryCompiler(BaseQueryCompiler):
     """
@@ -455,6 +1020,34 @@ class PandasQueryCompiler(BaseQueryCompiler):
         right_index = kwargs.get("right_index", False)
         sort = kwargs.get("sort", False)
 
+        if left_index is False and right_index is False:
+            join_keys = self._get_hash_join_keys(right, on, left_on, right_on, sort)
+            # Small right frames are cheaper to broadcast to every row partition
+            # than to shuffle both frames.
+            if join_keys is not None and (
+                how not in ["left", "inner"]
+                or len(right.index) > BroadcastJoinThreshold.get()
+            ):
+                merge_kwargs = {
+                    key: value
+                    for key, value in kwargs.items()
+                    if key
+                    not in (
+                        "how",
+                        "on",
+                        "left_on",
+                        "right_on",
+                        "left_index",
+                        "right_index",
+                        "sort",
+                    )
+                }
+                return self.__constructor__(
+                    self._modin_frame.hash_join(
+                        right._modin_frame, how, *join_keys, sort=sort, **merge_kwargs
+                    )
+                )
+
         if how in ["left", "inner"] and left_index is False and right_index is False:
             right = right.to_pandas()
 
@@ -497,6 +1090,154 @@ class PandasQueryCompiler(BaseQueryCompiler):
         else:
             return self.default_to_pandas(pandas.DataFrame.merge, right, **kwargs)
 
+    def _get_hash_join_keys(self, right, on, left_on, right_on, sort):
+        """
+        Get the key columns to merge with the right frame by a hash-shuffle join.
+
+        Parameters
+        ----------
+        right : PandasQueryCompiler
+            The right frame of the merge.
+        on : label or list of labels, optional
+            Column labels to merge on in both frames.
+        left_on : label or list of labels, optional
+            Column labels to merge on in the left frame.
+        right_on : label or list of labels, optional
+            Column labels to merge on in the right frame.
+        sort : bool
+            Whether the result should be sorted by the keys.
+
+        Returns
+        -------
+        tuple of two lists or None
+            Key column labels of the left and the right frames, None if the
+            frames can't be merged by a hash-shuffle join.
+        """
+        if on is None and left_on is None and right_on is None:
+            on = list(self.columns.intersection(right.columns))
+            if len(on) == 0:
+                return None
+        if on is not None:
+            if left_on is not None or right_on is not None:
+                return None
+            left_on = right_on = on
+        if left_on is None or right_on is None:
+            return None
+        left_on = list(left_on) if is_list_like(left_on) else [left_on]
+        right_on = list(right_on) if is_list_like(right_on) else [right_on]
+        if len(left_on) != len(right_on) or (sort and left_on != right_on):
+            return None
+        if not self.columns.is_unique or not right.columns.is_unique:
+            return None
+        for left_key, right_key in zip(left_on, right_on):
+            if not (
+                hashable(left_key)
+                and hashable(right_key)
+                and left_key in self.columns
+                and right_key in right.columns
+                and left_key not in self.index.names
+                and right_key not in right.index.names
+            ):
+                return None
+            # Values of different dtypes may be equal but have different hashes.
+            if self.dtypes[left_key] != right.dtypes[right_key]:
+                return None
+        return left_on, right_on
+
+    def merge_asof(self, right, **kwargs):
+        on = kwargs.get("on", None)
+        left_on = kwargs.get("left_on", None)
+        right_on = kwargs.get("right_on", None)
+        by = kwargs.get("by", None)
+        left_by = kwargs.get("left_by", None)
+        right_by = kwargs.get("right_by", None)
+        if on is not None:
+            left_on = right_on = on
+        if by is not None:
+            left_by = right_by = by
+
+        join_keys = by_keys = None
+        if (
+            not kwargs.get("left_index", False)
+            and not kwargs.get("right_index", False)
+            and left_on is not None
+            and right_on is not None
+        ):
+            join_keys = self._get_hash_join_keys(right, None, left_on, right_on, False)
+        if left_by is not None and right_by is not None:
+            by_keys = self._get_hash_join_keys(right, None, left_by, right_by, False)
+        if (
+            join_keys is None
+            or len(join_keys[0]) != 1
+            or (by_keys is None and (left_by is not None or right_by is not None))
+            # There are no partitions to get the key ranges from
+            or len(self.index) == 0
+            or len(right.index) == 0
+        ):
+            return super().merge_asof(right, **kwargs)
+
+        merge_kwargs = {
+            key: value
+            for key, value in kwargs.items()
+            if key
+            not in (
+                "on",
+                "left_on",
+                "right_on",
+                "left_index",
+                "right_index",
+                "by",
+                "left_by",
+                "right_by",
+            )
+        }
+        return self.__constructor__(
+            self._modin_frame.asof_join(
+                right._modin_frame,
+                join_keys[0][0],
+                join_keys[1][0],
+                *(by_keys or (None, None)),
+                **merge_kwargs,
+            )
+        )
+
+    def merge_ordered(self, right, **kwargs):
+        join_keys = None
+        if kwargs.get("left_by", None) is None and kwargs.get("right_by", None) is None:
+            join_keys = self._get_hash_join_keys(
+                right,
+                kwargs.get("on", None),
+                kwargs.get("left_on", None),
+                kwargs.get("right_on", None),
+                False,
+            )
+        if (
+            join_keys is None
+            # Forward filling carries the values of differently named key columns
+            # too, which can't be done with the rows carried from the previous ranges.
+            or (
+                kwargs.get("fill_method", None) is not None
+                and join_keys[0] != join_keys[1]
+            )
+            or len(self.index) == 0
+            or len(right.index) == 0
+        ):
+            return super().merge_ordered(right, **kwargs)
+
+        merge_kwargs = {
+            key: value
+            for key, value in kwargs.items()
+            if key not in ("on", "left_on", "right_on", "left_by", "right_by", "how")
+        }
+        return self.__constructor__(
+            self._modin_frame.ordered_join(
+                right._modin_frame,
+                kwargs.get("how", "outer"),
+                *join_keys,
+                **merge_kwargs,
+            )
+        )
+
     def join(self, right, **kwargs):
         on = kwargs.get("on", None)
         how = kwargs.get("how", "left")
@@ -790,8 +1531,6 @@ class PandasQueryCompiler(BaseQueryCompiler):
     # Reduce operations
     idxmax = Reduce.register(pandas.DataFrame.idxmax)
     idxmin = Reduce.register(pandas.DataFrame.idxmin)
-    median = Reduce.register(pandas.DataFrame.median)
-    nunique = Reduce.register(pandas.DataFrame.nunique)
     skew = Reduce.register(pandas.DataFrame.skew)
     kurt = Reduce.register(pandas.DataFrame.kurt)
     sem = Reduce.register(pandas.DataFrame.sem)
@@ -799,9 +1538,102 @@ class PandasQueryCompiler(BaseQueryCompiler):
     var = Reduce.register(pandas.DataFrame.var)
     sum_min_count = Reduce.register(pandas.DataFrame.sum)
     prod_min_count = Reduce.register(pandas.DataFrame.prod)
-    quantile_for_single_value = Reduce.register(pandas.DataFrame.quantile)
     mad = Reduce.register(pandas.DataFrame.mad)
 
+    def median(self, **kwargs):
+        if kwargs.get("axis", 0) == 0 and _can_sketch(self):
+            skipna = kwargs.get("skipna", True)
+            sketches = _quantile_sketches(self)
+            positions = [
+                np.array([(sketch.count - 1) // 2, sketch.count // 2])
+                if sketch.count > 0 and (skipna or sketch.nan_count == 0)
+                else np.array([], dtype=np.int64)
+                for sketch in sketches
+            ]
+            result = [
+                np.mean(values.astype(np.float64)) if len(values) else np.nan
+                for values in _take_sorted(self, sketches, positions)
+            ]
+            return self.from_pandas(
+                pandas.DataFrame(
+                    [result], index=[MODIN_UNNAMED_SERIES_LABEL], columns=self.columns
+                ),
+                type(self._modin_frame),
+            )
+        return Reduce.register(pandas.DataFrame.median)(self, **kwargs)
+
+    def nunique(self, **kwargs):
+        if kwargs.get("axis", 0) == 0 and ApproximateReductions.get():
+            sketches = _reduce_sketches(
+                self, HyperLogLog.from_values, HyperLogLog.merge
+            )
+            dropna = kwargs.get("dropna", True)
+            return self.from_pandas(
+                pandas.DataFrame(
+                    [[sketch.estimate(dropna) for sketch in sketches]],
+                    index=[MODIN_UNNAMED_SERIES_LABEL],
+                    columns=self.columns,
+                ),
+                type(self._modin_frame),
+            )
+        return Reduce.register(pandas.DataFrame.nunique)(self, **kwargs)
+
+    def _quantiles_by_sketches(
+        self, q, axis=0, numeric_only=True, interpolation="linear"
+    ):
+        """
+        Compute the quantiles of the columns from the sketches of the partitions.
+
+        Parameters
+        ----------
+        q : list-like
+            The quantiles to compute.
+        axis : {0, 1}, default: 0
+            The axis to compute the quantiles along.
+        numeric_only : bool, default: True
+            Whether to only compute the quantiles of the numeric columns.
+        interpolation : str, default: "linear"
+            The interpolation method.
+
+        Returns
+        -------
+        pandas.DataFrame or None
+            The quantiles of the columns indexed by `q`, None if they can't be
+            computed from the sketches.
+        """
+        if axis != 0 or interpolation not in (
+            "linear",
+            "lower",
+            "higher",
+            "midpoint",
+            "nearest",
+        ):
+            return None
+        query_compiler = self
+        if numeric_only and not all(map(is_numeric_dtype, self.dtypes)):
+            query_compiler = self.getitem_column_array(
+                [i for i, dtype in enumerate(self.dtypes) if is_numeric_dtype(dtype)],
+                numeric=True,
+            )
+        if not _can_sketch(query_compiler):
+            return None
+        return _sketch_quantiles(
+            query_compiler, _quantile_sketches(query_compiler), q, interpolation
+        )
+
+    def quantile_for_single_value(self, **kwargs):
+        result = self._quantiles_by_sketches(
+            [kwargs.get("q", 0.5)],
+            axis=kwargs.get("axis", 0),
+            numeric_only=kwargs.get("numeric_only", True),
+            interpolation=kwargs.get("interpolation", "linear"),
+        )
+        if result is None:
+            return Reduce.register(pandas.DataFrame.quantile)(self, **kwargs)
+        # The quantiles are brought to the common type like pandas does
+        result = result.iloc[0].to_frame(MODIN_UNNAMED_SERIES_LABEL).T
+        return self.from_pandas(result, type(self._modin_frame))
+
     def to_datetime(self, *args, **kwargs):
         if len(self.columns) == 1:
             return Map.register(
@@ -1019,75 +1851,75 @@ class PandasQueryCompiler(BaseQueryCompiler):
     def resample_quantile(self, resample_kwargs, q, **kwargs):
         return self._resample_func(resample_kwargs, "quantile", q=q, **kwargs)
 
-    window_mean = Fold.register(
+    window_mean = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).mean(*args, **kwargs)
         )
     )
-    window_sum = Fold.register(
+    window_sum = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).sum(*args, **kwargs)
         )
     )
-    window_var = Fold.register(
+    window_var = _rolling_func(
         lambda df, rolling_args, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).var(ddof=ddof, *args, **kwargs)
         )
     )
-    window_std = Fold.register(
+    window_std = _rolling_func(
         lambda df, rolling_args, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).std(ddof=ddof, *args, **kwargs)
         )
     )
-    rolling_count = Fold.register(
+    rolling_count = _rolling_func(
         lambda df, rolling_args: pandas.DataFrame(df.rolling(*rolling_args).count())
     )
-    rolling_sum = Fold.register(
+    rolling_sum = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).sum(*args, **kwargs)
         )
     )
-    rolling_mean = Fold.register(
+    rolling_mean = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).mean(*args, **kwargs)
         )
     )
-    rolling_median = Fold.register(
+    rolling_median = _rolling_func(
         lambda df, rolling_args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).median(**kwargs)
         )
     )
-    rolling_var = Fold.register(
+    rolling_var = _rolling_func(
         lambda df, rolling_args, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).var(ddof=ddof, *args, **kwargs)
         )
     )
-    rolling_std = Fold.register(
+    rolling_std = _rolling_func(
         lambda df, rolling_args, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).std(ddof=ddof, *args, **kwargs)
         )
     )
-    rolling_min = Fold.register(
+    rolling_min = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).min(*args, **kwargs)
         )
     )
-    rolling_max = Fold.register(
+    rolling_max = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).max(*args, **kwargs)
         )
     )
-    rolling_skew = Fold.register(
+    rolling_skew = _rolling_func(
         lambda df, rolling_args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).skew(**kwargs)
         )
     )
-    rolling_kurt = Fold.register(
+    rolling_kurt = _rolling_func(
         lambda df, rolling_args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).kurt(**kwargs)
         )
     )
-    rolling_apply = Fold.register(
+    rolling_apply = _rolling_func(
         lambda df, rolling_args, func, raw, engine, engine_kwargs, args, kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).apply(
                 func=func,
@@ -1099,7 +1931,7 @@ class PandasQueryCompiler(BaseQueryCompiler):
             )
         )
     )
-    rolling_quantile = Fold.register(
+    rolling_quantile = _rolling_func(
         lambda df, rolling_args, quantile, interpolation, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).quantile(
                 quantile=quantile, interpolation=interpolation, **kwargs
@@ -1149,6 +1981,18 @@ class PandasQueryCompiler(BaseQueryCompiler):
         )
         return self.__constructor__(new_modin_frame)
 
+    expanding_count = _expanding_func("count")
+    expanding_sum = _expanding_func("sum")
+    expanding_mean = _expanding_func("mean")
+    expanding_var = _expanding_func("var")
+    expanding_std = _expanding_func("std")
+    expanding_min = _expanding_func("min")
+    expanding_max = _expanding_func("max")
+    ewm_mean = _ewm_func("mean")
+    ewm_sum = _ewm_func("sum")
+    ewm_var = _ewm_func("var")
+    ewm_std = _ewm_func("std")
+
     def unstack(self, level, fill_value):
         if not isinstance(self.index, pandas.MultiIndex) or (
             isinstance(self.index, pandas.MultiIndex)
@@ -1413,6 +2257,19 @@ class PandasQueryCompiler(BaseQueryCompiler):
         )
         return self.__constructor__(new_modin_frame)
 
+    def duplicated(self, **kwargs):
+        if not self.columns.is_unique:
+            return super().duplicated(**kwargs)
+        # The rows are shuffled by the hash of their values, so all of the copies
+        # of a row get into the same piece, keeping their original order.
+        new_modin_frame = self._modin_frame.hash_shuffle_apply(
+            list(self.columns),
+            lambda df: df.duplicated(**kwargs).to_frame(MODIN_UNNAMED_SERIES_LABEL),
+            [MODIN_UNNAMED_SERIES_LABEL],
+            dtypes=pandas.Series([np.dtype(bool)], index=[MODIN_UNNAMED_SERIES_LABEL]),
+        )
+        return self.__constructor__(new_modin_frame)
+
     def searchsorted(self, **kwargs):
         def searchsorted(df):
             """Apply `searchsorted` function to a single partition."""
@@ -1563,6 +2420,18 @@ class PandasQueryCompiler(BaseQueryCompiler):
                     )
                     break
 
+        percentiles = kwargs.get("percentiles")
+        percentiles = np.unique(
+            [0.25, 0.5, 0.75] if percentiles is None else percentiles
+        )
+        if self.columns.is_unique and len(new_index) == len(percentiles) + 5:
+            query_compiler = self.getitem_column_array(empty_df.columns)
+            if _can_sketch(query_compiler):
+                return self.from_pandas(
+                    query_compiler._describe_by_sketches(new_index, percentiles),
+                    type(self._modin_frame),
+                )
+
         def describe_builder(df, internal_indices=[]):
             """Apply `describe` function to the subset of columns in a single partition."""
             # The index of the resulting dataframe is the same amongst all partitions
@@ -1584,6 +2453,39 @@ class PandasQueryCompiler(BaseQueryCompiler):
             )
         )
 
+    def _describe_by_sketches(self, new_index, percentiles):
+        """
+        Describe the numeric columns from the sketches of the partitions.
+
+        Parameters
+        ----------
+        new_index : pandas.Index
+            The labels of the statistics.
+        percentiles : np.ndarray
+            The sorted percentiles to compute.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        sketches = _quantile_sketches(self)
+        quantiles = _sketch_quantiles(self, sketches, percentiles, "linear")
+        stats = np.full((4, len(sketches)), np.nan)
+        maximums = np.full((1, len(sketches)), np.nan)
+        for i, sketch in enumerate(sketches):
+            stats[0, i] = sketch.count
+            if sketch.count > 0:
+                stats[1, i] = sketch.mean
+                stats[3, i] = sketch.values[0]
+                maximums[0, i] = sketch.values[-1]
+            if sketch.count > 1:
+                stats[2, i] = np.sqrt(sketch.m2 / (sketch.count - 1))
+        return pandas.DataFrame(
+            np.concatenate([stats, quantiles.to_numpy(dtype=np.float64), maximums]),
+            index=new_index,
+            columns=self.columns,
+        )
+
     # END Column/Row partitions reduce operations over select indices
 
     # Map across rows/columns
@@ -1591,11 +2493,27 @@ class PandasQueryCompiler(BaseQueryCompiler):
     # that is being operated on. This means that we have to put all of that
     # data in the same place.
 
-    cummax = Fold.register(pandas.DataFrame.cummax)
-    cummin = Fold.register(pandas.DataFrame.cummin)
-    cumsum = Fold.register(pandas.DataFrame.cumsum)
-    cumprod = Fold.register(pandas.DataFrame.cumprod)
-    diff = Fold.register(pandas.DataFrame.diff)
+    cummax = _cumulative_func(pandas.DataFrame.cummax)
+    cummin = _cumulative_func(pandas.DataFrame.cummin)
+    cumsum = _cumulative_func(pandas.DataFrame.cumsum)
+    cumprod = _cumulative_func(pandas.DataFrame.cumprod)
+
+    def diff(self, fold_axis, **kwargs):
+        periods = kwargs.get("periods", 1)
+        if fold_axis == 0 and is_integer(periods) and periods >= 0:
+            # Every row only depends on the `periods` preceding rows.
+            return Window.register(pandas.DataFrame.diff)(
+                self, 0, periods + 1, **kwargs
+            )
+        return Fold.register(pandas.DataFrame.diff)(self, fold_axis, **kwargs)
+
+    def shift(self, periods=1, axis=0, fill_value=no_default):
+        if axis == 0 and is_integer(periods) and periods >= 0:
+            # Every row only depends on the `periods` preceding rows.
+            return Window.register(pandas.DataFrame.shift)(
+                self, 0, periods + 1, periods=periods, fill_value=fill_value
+            )
+        return super().shift(periods=periods, axis=axis, fill_value=fill_value)
 
     def clip(self, lower, upper, **kwargs):
         if isinstance(lower, BaseQueryCompiler):
@@ -1773,12 +2691,22 @@ class PandasQueryCompiler(BaseQueryCompiler):
                 df, n=n, columns=columns, keep=keep
             )
 
-        if columns is None:
-            new_columns = [MODIN_UNNAMED_SERIES_LABEL]
-        else:
-            new_columns = self.columns
+        def candidates_func(df):
+            """Pick the candidate rows of a single partition keeping their original order."""
+            labeled_by_position = df.copy(deep=False)
+            labeled_by_position.index = pandas.RangeIndex(len(df))
+            return df.iloc[np.sort(map_func(labeled_by_position).index)]
 
-        new_modin_frame = self._modin_frame.apply_full_axis(
+        new_columns = self.columns
+
+        # Every row partition holds at most `n` rows (or all the ties with keep="all")
+        # of the result, so the candidates are picked in parallel first and only
+        # those are gathered into a single partition to pick the final rows.
+        # The candidates keep the original row order so ties are resolved as pandas does.
+        candidates = self._modin_frame.apply_full_axis(
+            axis=1, func=candidates_func, new_columns=new_columns
+        )
+        new_modin_frame = candidates.apply_full_axis(
             axis=0, func=map_func, new_columns=new_columns
         )
         return self.__constructor__(new_modin_frame)
@@ -1932,6 +2860,15 @@ class PandasQueryCompiler(BaseQueryCompiler):
         numeric_only = kwargs.get("numeric_only", True)
         assert isinstance(q, (pandas.Series, np.ndarray, pandas.Index, list))
 
+        result = self._quantiles_by_sketches(
+            q,
+            axis=axis,
+            numeric_only=numeric_only,
+            interpolation=kwargs.get("interpolation", "linear"),
+        )
+        if result is not None:
+            return self.from_pandas(result, type(self._modin_frame))
+
         if numeric_only:
             new_columns = self._modin_frame.numeric_columns()
         else:
@@ -2012,21 +2949,26 @@ class PandasQueryCompiler(BaseQueryCompiler):
         ascending = kwargs.pop("ascending", True)
         if ascending is None:
             ascending = False
+        if axis == 0:
+            # Rows are range-partitioned by their labels and sorted in parallel.
+            ignore_index = kwargs.pop("ignore_index", False)
+            kwargs.pop("inplace")
+            new_modin_frame = self._modin_frame.sort_by(
+                0, None, ascending=ascending, **kwargs
+            )
+            result = self.__constructor__(new_modin_frame)
+            if ignore_index:
+                result = result.reset_index(drop=True)
+            return result
         kwargs["ascending"] = ascending
-        if axis:
-            new_columns = pandas.Series(self.columns).sort_values(**kwargs)
-            new_index = self.index
-        else:
-            new_index = pandas.Series(self.index).sort_values(**kwargs)
-            new_columns = self.columns
+        new_columns = pandas.Series(self.columns).sort_values(**kwargs)
         new_modin_frame = self._modin_frame.apply_full_axis(
-            axis,
+            1,
             lambda df: df.sort_index(
-                axis=axis, level=level, sort_remaining=sort_remaining, **kwargs
+                axis=1, level=level, sort_remaining=sort_remaining, **kwargs
             ),
-            new_index,
+            self.index,
             new_columns,
-            dtypes="copy" if axis == 0 else None,
         )
         return self.__constructor__(new_modin_frame)
 
@@ -2128,12 +3070,159 @@ class PandasQueryCompiler(BaseQueryCompiler):
         result.index = new_index
         return result
 
+    def _melt_row_partitions(
+        self, melt_func, num_pieces, new_index, new_columns, dtypes, row_lengths
+    ):
+        """
+        Melt every row partition into pieces of rows and stack the pieces.
+
+        Parameters
+        ----------
+        melt_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            Function melting a row partition into `num_pieces` pieces.
+        num_pieces : int
+            The number of pieces every row partition is melted into.
+        new_index : pandas.Index, optional
+            Index of the result if known.
+        new_columns : pandas.Index
+            Columns of the result.
+        dtypes : pandas.Series
+            Dtypes of the result.
+        row_lengths : list of ints, optional
+            Lengths of the pieces in the order they are stacked in, if known.
+
+        Returns
+        -------
+        PandasQueryCompiler
+            The first pieces of all of the row partitions followed by
+            the second pieces of all of them and so on.
+        """
+        frame = self._modin_frame
+        partition_mgr_cls = frame._partition_mgr_cls
+        new_partitions = partition_mgr_cls.split_row_partitions(
+            frame._partitions, melt_func, num_pieces
+        ).reshape(-1, 1)
+        if row_lengths is not None:
+            for part, length in zip(new_partitions[:, 0], row_lengths):
+                part._length_cache = length
+        # Melting many columns makes a lot of small pieces
+        new_partitions, new_lengths = partition_mgr_cls.rebalance_partitions(
+            new_partitions
+        )
+        if new_lengths is not None:
+            row_lengths = new_lengths
+        return self.__constructor__(
+            frame.__constructor__(
+                new_partitions,
+                new_index,
+                new_columns,
+                row_lengths,
+                [len(new_columns)],
+                dtypes,
+            )
+        )
+
+    def lreshape(self, groups, dropna=True, label=None):
+        if label is not None or len(self.index) == 0:
+            return super().lreshape(groups, dropna=dropna, label=label)
+        if not isinstance(groups, dict):
+            groups = list(groups)
+        keys = list(groups) if isinstance(groups, dict) else [key for key, _ in groups]
+        # The labels and the types of the result only depend on the columns,
+        # so a single row is enough to get them
+        sample = pandas.lreshape(
+            self.getitem_row_array([0]).to_pandas(), groups, dropna=False
+        )
+        num_pieces = len(sample)
+
+        def melt_func(df):
+            # pandas stacks every group of the columns below the previous group
+            result = pandas.lreshape(df, groups, dropna=False)
+            pieces = [
+                result.iloc[k * len(df) : (k + 1) * len(df)] for k in range(num_pieces)
+            ]
+            if dropna:
+                pieces = [piece[piece[keys].notna().all(axis=1)] for piece in pieces]
+            return pieces
+
+        if dropna:
+            new_index = row_lengths = None
+        else:
+            new_index = pandas.RangeIndex(len(self.index) * num_pieces)
+            row_lengths = self._modin_frame.row_lengths * num_pieces
+        result = self._melt_row_partitions(
+            melt_func,
+            num_pieces,
+            new_index,
+            sample.columns,
+            sample.dtypes,
+            row_lengths,
+        )
+        if dropna:
+            return result.reset_index(drop=True)
+        # this assigment needs to propagate correct indices into partitions
+        result.index = new_index
+        return result
+
+    def wide_to_long(self, stubnames, i, j, sep="", suffix=r"\d+"):
+        if len(self.index) == 0:
+            return super().wide_to_long(stubnames, i, j, sep=sep, suffix=suffix)
+        # The labels and the types of the result only depend on the columns,
+        # so a single row is enough to get them
+        sample = pandas.wide_to_long(
+            self.getitem_row_array([0]).to_pandas(),
+            stubnames,
+            i,
+            j,
+            sep=sep,
+            suffix=suffix,
+        )
+        i = list(i) if is_list_like(i) else [i]
+        ids = self.getitem_column_array(i).to_pandas()
+        if ids.duplicated().any():
+            raise ValueError("the id variables need to uniquely identify each row")
+        suffixes = sample.index.get_level_values(-1)
+        num_suffixes = len(suffixes)
+
+        if len(i) == 1:
+            # pandas puts the rows of every suffix below the rows of the previous one
+            index_arrays = [np.tile(ids.iloc[:, 0].to_numpy(), num_suffixes)]
+            index_arrays.append(suffixes.repeat(len(ids)))
+            num_pieces = num_suffixes
+            row_lengths = self._modin_frame.row_lengths * num_suffixes
+        else:
+            # pandas puts the rows of every suffix of an id together
+            index_arrays = [ids[col].to_numpy().repeat(num_suffixes) for col in ids]
+            index_arrays.append(np.tile(suffixes, len(ids)))
+            num_pieces = 1
+            row_lengths = [
+                length * num_suffixes for length in self._modin_frame.row_lengths
+            ]
+        new_index = pandas.MultiIndex.from_arrays(index_arrays, names=i + [j])
+
+        def melt_func(df):
+            result = pandas.wide_to_long(df, stubnames, i, j, sep=sep, suffix=suffix)
+            # The order of the id columns depends on the hashes of their labels
+            result = result[sample.columns]
+            step = len(result) // num_pieces
+            return [result.iloc[k * step : (k + 1) * step] for k in range(num_pieces)]
+
+        return self._melt_row_partitions(
+            melt_func,
+            num_pieces,
+            new_index,
+            sample.columns,
+            sample.dtypes,
+            row_lengths,
+        )
+
     # END Map across rows/columns
 
     # __getitem__ methods
     __getitem_bool = Binary.register(
         # r is usually a list, but when r.size == 1, the array is squeezed to a scalar
-        lambda df, r: df[r] if r.size > 1 else df[[r]],
+        # and when the partition is empty, the squeezed array may lose its dtype
+        lambda df, r: df[r] if r.size > 1 else df[[r]] if r.size == 1 else df.iloc[:0],
         join_type="left",
         labels="drop",
     )
@@ -2714,6 +3803,147 @@ class PandasQueryCompiler(BaseQueryCompiler):
             drop=drop,
         )
 
+    def _get_groupby_scan_keys(self, by, axis, groupby_kwargs, drop):
+        """
+        Get the labels of the key columns if the groups can be scanned by row partitions.
+
+        Parameters
+        ----------
+        by : PandasQueryCompiler, column or index label, Grouper or list of such
+            Object that determine groups.
+        axis : {0, 1}
+            Axis to group along.
+        groupby_kwargs : dict
+            GroupBy parameters in the format of ``modin.pandas.DataFrame.groupby`` signature.
+        drop : bool
+            If `by` is a QueryCompiler indicates whether or not by-data came
+            from the `self`.
+
+        Returns
+        -------
+        list of labels or None
+            The labels of the columns of `self` the rows are grouped by, None if the
+            rows are grouped by anything else.
+        """
+        if axis != 0 or groupby_kwargs.get("level") is not None:
+            return None
+        if isinstance(by, type(self)):
+            by = list(by.columns) if drop else None
+        elif not isinstance(by, list):
+            by = [by]
+        if (
+            not by
+            or not self.columns.is_unique
+            or not all(hashable(key) and key in self.columns for key in by)
+        ):
+            return None
+        if groupby_kwargs.get("dropna", True) and not all(
+            is_integer_dtype(dtype) or is_bool_dtype(dtype)
+            for dtype in self.dtypes[by]
+        ):
+            # pandas handles the rows with the dropped missing keys inconsistently
+            # (e.g. numbers them as a single group), so these are computed as a whole.
+            if (
+                self.getitem_column_array(by)
+                .isna()
+                .any(axis=0)
+                .any(axis=1)
+                .to_pandas()
+                .squeeze()
+            ):
+                return None
+        return by
+
+    def _groupby_scan(self, keys, dropna, carry_fn, scan_fn, new_columns):
+        """
+        Compute cumulative function of the groups with a prefix scan over the row partitions.
+
+        Parameters
+        ----------
+        keys : list of labels
+            Labels of the columns to group by.
+        dropna : bool
+            Whether the rows with missing keys are dropped from the groups.
+        carry_fn : callable(pandas.core.groupby.DataFrameGroupBy) -> pandas.DataFrame
+            Function computing the totals of the groups of a row partition.
+        scan_fn : callable(pandas.core.groupby.DataFrameGroupBy) -> pandas.DataFrame
+            Function computing the cumulative function of the groups of a row partition.
+        new_columns : list of labels
+            The column labels of the result.
+
+        Returns
+        -------
+        PandasQueryCompiler
+        """
+
+        def group_totals(df):
+            return carry_fn(df.groupby(keys, dropna=dropna))
+
+        def combine_totals(offset, carry):
+            # Grouping by the index levels would drop the missing keys regardless of `dropna`.
+            return (
+                pandas.concat([offset, carry], copy=False)
+                .reset_index()
+                .groupby(keys, dropna=dropna)
+                .sum()
+            )
+
+        def scan_groups(df, offset):
+            result = scan_fn(df.groupby(keys, dropna=dropna))
+            if offset is None:
+                return result
+            # Add the totals of the groups accumulated over the preceding partitions,
+            # merging (unlike reindexing) matches the missing keys with each other.
+            totals = df[keys].merge(offset.reset_index(), how="left", on=keys)
+            totals = totals[offset.columns].fillna(0).astype(offset.dtypes)
+            return result + totals.to_numpy()
+
+        return self.__constructor__(
+            self._modin_frame.scan(
+                0, group_totals, combine_totals, scan_groups, new_columns=new_columns,
+            )
+        )
+
+    def groupby_cumsum(
+        self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False,
+    ):
+        keys = self._get_groupby_scan_keys(by, axis, groupby_kwargs, drop)
+        if keys is not None:
+            values = [col for col in self.columns if col not in keys]
+            if (
+                len(values) != 0
+                and len(agg_args) == 0
+                and agg_kwargs.get("axis", 0) == 0
+                and set(agg_kwargs.keys()).issubset({"axis"})
+                and all(dtype.kind in "iuf" for dtype in self.dtypes[values])
+            ):
+                return self._groupby_scan(
+                    keys,
+                    groupby_kwargs.get("dropna", True),
+                    lambda grp: grp[values].sum(),
+                    lambda grp: grp[values].cumsum(),
+                    values,
+                )
+        return super().groupby_cumsum(
+            by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=drop
+        )
+
+    def groupby_cumcount(
+        self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False,
+    ):
+        keys = self._get_groupby_scan_keys(by, axis, groupby_kwargs, drop)
+        if keys is not None and agg_kwargs.get("ascending", True):
+            return self.getitem_column_array(keys)._groupby_scan(
+                keys,
+                groupby_kwargs.get("dropna", True),
+                lambda grp: grp.size().to_frame(MODIN_UNNAMED_SERIES_LABEL),
+                lambda grp: grp.cumcount().to_frame(MODIN_UNNAMED_SERIES_LABEL),
+                [MODIN_UNNAMED_SERIES_LABEL],
+            )
+        return super().groupby_cumcount(
+            by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=drop
+        )
+
     def groupby_agg(
         self,
         by,
@@ -2993,11 +4223,6 @@ class PandasQueryCompiler(BaseQueryCompiler):
         observed,
         sort,
     ):
-        ErrorMessage.missmatch_with_pandas(
-            operation="pivot_table",
-            message="Order of columns could be different from pandas",
-        )
-
         from pandas.core.reshape.pivot import _convert_by
 
         def __convert_by(by):
@@ -3006,8 +4231,69 @@ class PandasQueryCompiler(BaseQueryCompiler):
                 return list(by)
             return _convert_by(by)
 
+        drop_values_level = values is not None and not is_list_like(values)
         index, columns, values = map(__convert_by, [index, columns, values])
 
+        agg_name = get_cython_func(aggfunc) if callable(aggfunc) else aggfunc
+        keys = index + columns
+        if (
+            isinstance(agg_name, str)
+            and agg_name in ("count", "max", "mean", "min", "prod", "sum")
+            and dropna
+            and sort
+            and len(index) > 0
+            and len(self.index) > 0
+            and not isinstance(self.columns, pandas.MultiIndex)
+            and self.columns.is_unique
+            and all(
+                hashable(key) and key is not None and key in self.columns
+                for key in keys + values
+            )
+            and len(set(keys)) == len(keys)
+            and len(set(keys).intersection(values)) == 0
+            and (fill_value is None or is_integer(fill_value) or is_float(fill_value))
+            and (not margins or isinstance(margins_name, str))
+        ):
+            reduce_values = values or [col for col in self.columns if col not in keys]
+            value_dtypes = self.dtypes[reduce_values]
+            float_values = [
+                col for col, dtype in value_dtypes.items() if dtype.kind == "f"
+            ]
+            if (
+                len(reduce_values) > 0
+                and all(dtype.kind in "iuf" for dtype in value_dtypes)
+                and not any(is_categorical_dtype(dtype) for dtype in self.dtypes[keys])
+                # The margins are aggregated over the rows having all of the values,
+                # which aren't told apart by the reduce
+                and not (
+                    margins
+                    and len(float_values) > 0
+                    and self.getitem_column_array(float_values)
+                    .isna()
+                    .any(axis=0)
+                    .any(axis=1)
+                    .to_pandas()
+                    .squeeze()
+                )
+            ):
+                result = self._pivot_table_reduce(
+                    index,
+                    columns,
+                    reduce_values,
+                    agg_name,
+                    fill_value,
+                    margins,
+                    margins_name,
+                    drop_values_level,
+                )
+                if result is not None:
+                    return result
+
+        ErrorMessage.missmatch_with_pandas(
+            operation="pivot_table",
+            message="Order of columns could be different from pandas",
+        )
+
         unique_keys = np.unique(index + columns)
         unique_values = np.unique(values)
 
@@ -3078,43 +4364,511 @@ class PandasQueryCompiler(BaseQueryCompiler):
 
         return result
 
+    def _pivot_table_reduce(
+        self,
+        index,
+        columns,
+        values,
+        agg_name,
+        fill_value,
+        margins,
+        margins_name,
+        drop_values_level,
+    ):
+        """
+        Build a pivot table with a groupby tree reduce over the key columns.
+
+        The values are aggregated by the `index` and `columns` keys with
+        ``GroupByReduce``. All of the groups of an `index` key are kept in the same
+        row partition, so the `columns` keys are unstacked by every row partition
+        on its own. The driver only collects a summary of every row partition to
+        agree on the labels of the result and the types of its columns. The margins
+        are aggregated out of the partial results of the same reduce.
+
+        Parameters
+        ----------
+        index : list of labels
+            Labels of the key columns to make the index of the result.
+        columns : list of labels
+            Labels of the key columns to make the columns of the result.
+        values : list of labels
+            Labels of the numeric columns to aggregate.
+        agg_name : {"count", "max", "mean", "min", "prod", "sum"}
+            Name of the aggregation.
+        fill_value : int or float, optional
+            Value to replace the missing values of the result with.
+        margins : bool
+            Whether to add the subtotals and the grand total. There must be
+            no missing values in `values` to aggregate the margins this way.
+        margins_name : str
+            Label of the margins.
+        drop_values_level : bool
+            Whether to drop the level of the `values` labels from the columns
+            of the result, like pandas does if a single value label is passed.
+
+        Returns
+        -------
+        PandasQueryCompiler or None
+            The pivot table, None if none of the rows has all of the keys.
+        """
+        keys = index + columns
+        index_levels = list(range(len(index)))
+        columns_levels = list(range(len(index), len(keys)))
+        value_dtypes = self.dtypes[values]
+        int_values = [col for col in values if is_integer_dtype(value_dtypes[col])]
+        # `mean` is reduced as the sums and the counts of the values
+        reduce_name = (
+            "sum" if agg_name == "mean" else groupby_reduce_functions[agg_name][1]
+        )
+        if agg_name == "mean":
+            groupby_reduce = GroupByReduce.register(
+                lambda grp: pandas.concat(
+                    {"sum": grp.sum(), "count": grp.count()}, axis=1, copy=False
+                ),
+                lambda grp: grp.sum(),
+            )
+        else:
+            groupby_reduce = GroupByReduce.register(agg_name)
+        partials = groupby_reduce(
+            query_compiler=self.getitem_column_array(keys + values),
+            by=self.getitem_column_array(keys),
+            axis=0,
+            groupby_kwargs={"as_index": True, "sort": True},
+            agg_args=[],
+            agg_kwargs={},
+            drop=True,
+        )._modin_frame
+
+        def finalize(df):
+            # The partials carry the aggregated key columns along with the values
+            if agg_name == "mean":
+                return df["sum"][values] / df["count"][values]
+            return df[values]
+
+        def group_by_columns(df):
+            if len(columns) > 0:
+                return df.groupby(level=columns_levels)
+            # All of the rows make a single group without the `columns` keys
+            return df.groupby(np.zeros(len(df), dtype=int))
+
+        def is_integral(df):
+            # The values ``fillna(downcast="infer")`` of pandas would turn into integers
+            with np.errstate(invalid="ignore"):
+                values = df.to_numpy(dtype="float64")
+                return pandas.DataFrame(
+                    np.isclose(np.round(values).astype("int64"), values, rtol=0),
+                    index=df.index,
+                    columns=df.columns,
+                )
+
+        def summarize(df):
+            agged = finalize(df).dropna(how="all")
+            summary = {
+                "dtypes": finalize(df).dtypes if len(df) > 0 else None,
+                "size": group_by_columns(agged).size(),
+                "notna": group_by_columns(agged.notna()).any(),
+                "index": agged.index.droplevel(columns_levels).unique()
+                if len(columns) > 0
+                else agged.index,
+            }
+            if agg_name == "mean":
+                # pandas turns the means of the integers back into integers if it can
+                summary["downcast"] = {
+                    col: maybe_downcast_to_dtype(agged[col], value_dtypes[col]).dtype
+                    == value_dtypes[col]
+                    for col in int_values
+                }
+            if fill_value is not None:
+                summary["integral"] = group_by_columns(
+                    is_integral(agged.fillna(fill_value))
+                ).all()
+            if margins:
+                summary["margins"] = getattr(group_by_columns(df), reduce_name)()
+                summary["conflict"] = any(
+                    margins_name in agged.index.get_level_values(level)
+                    for level in index_levels
+                )
+            return summary
+
+        partition_mgr_cls = partials._partition_mgr_cls
+        summarize = partition_mgr_cls.preprocess_func(summarize)
+
+        def collect_summaries(partials):
+            summaries = partition_mgr_cls.get_objects_from_partitions(
+                [
+                    row_part.apply(summarize, num_splits=1)[0]
+                    for row_part in partition_mgr_cls.row_partitions(
+                        partials._partitions
+                    )
+                ]
+            )
+            summaries = [summary for summary in summaries if len(summary["size"]) > 0]
+            if len(summaries) == 0:
+                return summaries, None
+            return summaries, summaries[0]["index"].append(
+                [summary["index"] for summary in summaries[1:]]
+            )
+
+        summaries, new_index = collect_summaries(partials)
+        if len(summaries) == 0:
+            return None
+        if new_index.has_duplicates:
+            # The reduce split the groups of some `index` keys between the row
+            # partitions, range-partition the partials by the keys to join them
+            new_partitions = partition_mgr_cls.shuffle_partitions(
+                partials._partitions,
+                [0],
+                ShuffleGroupByFunctions(NPartitions.get()),
+                lambda df: df,
+            )
+            partials = partials.__constructor__(
+                new_partitions,
+                columns=partials.columns,
+                column_widths=[len(partials.columns)],
+                dtypes=partials._dtypes,
+            )
+            summaries, new_index = collect_summaries(partials)
+
+        def combine(name):
+            objs = pandas.concat([summary[name] for summary in summaries])
+            return objs.groupby(level=list(range(objs.index.nlevels)))
+
+        group_sizes = combine("size").sum()
+        notna = combine("notna").any()[values]
+        n_rows = len(new_index)
+        agg_dtypes = summaries[0]["dtypes"].copy()
+        raw_dtypes = agg_dtypes.copy()
+        if agg_name == "mean":
+            for col in int_values:
+                if all(summary["downcast"][col] for summary in summaries):
+                    agg_dtypes[col] = value_dtypes[col]
+
+        # The columns of the unstacked table, every value label is
+        # combined with every combination of the `columns` keys
+        column_keys = group_sizes.index
+        positions = np.tile(np.arange(len(column_keys)), len(values))
+        if len(columns) > 0:
+            column_keys = column_keys.take(positions)
+            body = pandas.MultiIndex.from_arrays(
+                [pandas.Index(values).repeat(len(group_sizes))]
+                + [column_keys.get_level_values(i) for i in range(len(columns))],
+                names=[None] + columns,
+            )
+        else:
+            body = pandas.Index(values)
+        body_dtypes = pandas.Series(
+            agg_dtypes[values].repeat(len(group_sizes)).to_numpy(), index=body
+        )
+        has_missing = group_sizes.to_numpy()[positions] < n_rows
+        if has_missing.any():
+            body_dtypes = body_dtypes.map(lambda dtype: maybe_promote(dtype, np.nan)[0])
+        if fill_value is None or pandas.isna(fill_value):
+            keep = notna.to_numpy().T.ravel()
+        else:
+            keep = np.ones(len(body), dtype=bool)
+        if fill_value is not None:
+            integral = combine("integral").all()[values].to_numpy().T.ravel() & (
+                ~has_missing | is_integral(pandas.DataFrame([fill_value])).iloc[0, 0]
+            )
+            is_float_dtype = body_dtypes.map(lambda dtype: dtype.kind == "f")
+            body_dtypes[is_float_dtype.to_numpy() & integral] = np.dtype("int64")
+        table = (
+            pandas.DataFrame(columns=body[keep])
+            .astype(body_dtypes[keep])
+            .sort_index(axis=1)
+        )
+        body = table.columns
+
+        if margins:
+            # The rest mirrors how pandas adds the margins to the table
+            msg = f'Conflicting name "{margins_name}" in margins'
+            if any(summary["conflict"] for summary in summaries):
+                raise ValueError(msg)
+            for level in table.columns.names[1:]:
+                if margins_name in table.columns.get_level_values(level):
+                    raise ValueError(msg)
+
+            margin_keys = table.columns
+            if len(columns) > 0:
+                pieces = []
+                margin_keys = []
+                for key, piece in table.groupby(level=0, axis=1):
+                    all_key = (key, margins_name) + ("",) * (len(columns) - 1)
+                    piece = piece.copy()
+                    piece[all_key] = pandas.Series(dtype=raw_dtypes[key])
+                    pieces.append(piece)
+                    margin_keys.append(all_key)
+                table = pandas.concat(pieces, axis=1)
+
+            row_partials = getattr(combine("margins"), reduce_name)()
+            grand_margin = {
+                label: getattr(row_partials[label], reduce_name)()
+                for label in row_partials.columns
+            }
+            if agg_name == "mean":
+                grand_margin = {
+                    col: grand_margin["sum", col] / grand_margin["count", col]
+                    for col in values
+                }
+            if len(columns) > 0:
+                row_margin = finalize(row_partials).stack()
+                row_margin.index = row_margin.index.reorder_levels(
+                    [len(columns)] + list(range(len(columns)))
+                )
+            else:
+                row_margin = pandas.Series(np.nan, index=table.columns)
+            row_margin = row_margin.reindex(table.columns, fill_value=fill_value)
+            for key in margin_keys:
+                row_margin[key] = grand_margin[key if isinstance(key, str) else key[0]]
+            margin_row = pandas.DataFrame(
+                row_margin,
+                columns=[
+                    margins_name
+                    if len(index) == 1
+                    else (margins_name,) + ("",) * (len(index) - 1)
+                ],
+            ).T
+            for dtype in set(table.dtypes):
+                cols = table.select_dtypes([dtype]).columns
+                margin_row[cols] = margin_row[cols].apply(
+                    maybe_downcast_to_dtype, args=(dtype,)
+                )
+            new_dtypes = pandas.Series(
+                [
+                    find_common_type([dtype, margin_dtype])
+                    for dtype, margin_dtype in zip(table.dtypes, margin_row.dtypes)
+                ],
+                index=table.columns,
+            )
+            margin_row = margin_row.astype(new_dtypes)
+        else:
+            new_dtypes = table.dtypes
+
+        new_columns = table.columns
+        if drop_values_level and new_columns.nlevels > 1:
+            new_columns = new_columns.droplevel(0)
+        downcast_dtypes = {
+            col: agg_dtypes[col] for col in values if agg_dtypes[col] != raw_dtypes[col]
+        }
+
+        def pivot(df):
+            agged = finalize(df).dropna(how="all").astype(downcast_dtypes)
+            if len(columns) == 0:
+                result = agged
+            elif len(agged) > 0:
+                result = agged.unstack(columns_levels)
+            else:
+                result = pandas.DataFrame(index=agged.index.droplevel(columns_levels))
+            result = result.reindex(columns=body)
+            if fill_value is not None:
+                result = result.fillna(fill_value)
+            if margins and len(columns) > 0:
+                margin = getattr(df.groupby(level=index_levels), reduce_name)()
+                margin = finalize(margin)
+                margin.columns = pandas.MultiIndex.from_tuples(
+                    [
+                        (col, margins_name) + ("",) * (len(columns) - 1)
+                        for col in margin.columns
+                    ]
+                )
+                result = pandas.concat(
+                    [result, margin.reindex(result.index)], axis=1, copy=False
+                )
+            result = result.reindex(columns=new_dtypes.index).astype(new_dtypes)
+            result.columns = new_columns
+            return result
+
+        result = self.__constructor__(
+            partials.apply_full_axis(
+                1, pivot, new_index=new_index, new_columns=new_columns
+            )
+        )
+        if margins:
+            margin_row.columns = new_columns
+            result = result.concat(
+                0, [self.from_pandas(margin_row, type(self._modin_frame))]
+            )
+            result.index = result.index.set_names(index)
+        return result
+
     # Get_dummies
     def get_dummies(self, columns, **kwargs):
         # `columns` as None does not mean all columns, by default it means only
-        # non-numeric columns.
+        # the object and categorical columns, as in pandas.
         if columns is None:
-            columns = [c for c in self.columns if not is_numeric_dtype(self.dtypes[c])]
-            # If we aren't computing any dummies, there is no need for any
-            # remote compute.
-            if len(columns) == 0:
-                return self.copy()
+            columns = [
+                c
+                for c, dtype in self.dtypes.items()
+                if is_object_dtype(dtype) or is_categorical_dtype(dtype)
+            ]
         elif not is_list_like(columns):
             columns = [columns]
-
-        # In some cases, we are mapping across all of the data. It is more
-        # efficient if we are mapping over all of the data to do it this way
-        # than it would be to reuse the code for specific columns.
-        if len(columns) == len(self.columns):
-            new_modin_frame = self._modin_frame.apply_full_axis(
-                0, lambda df: pandas.get_dummies(df, **kwargs), new_index=self.index
-            )
-            untouched_frame = None
         else:
+            columns = list(columns)
+        # If we aren't computing any dummies, there is no need for any
+        # remote compute.
+        if len(columns) == 0:
+            return self.copy()
+
+        if self.columns.is_unique and pandas.Index(columns).is_unique:
+            prefix = kwargs.pop("prefix", None)
+            prefix_sep = kwargs.pop("prefix_sep", "_")
+            labeling = {
+                col: labels
+                for col, labels in zip(
+                    columns,
+                    zip(
+                        self._get_dummies_labels(prefix, "prefix", columns),
+                        self._get_dummies_labels(prefix_sep, "prefix_sep", columns),
+                    ),
+                )
+            }
+            new_modin_frame = self._encode_dummies(columns, labeling, **kwargs)
+        else:
+            # The blocks are encoded by the labels of their columns, so
+            # duplicated labels require the whole columns
             new_modin_frame = self._modin_frame.take_2d_labels_or_positional(
                 col_labels=columns
             ).apply_full_axis(
                 0, lambda df: pandas.get_dummies(df, **kwargs), new_index=self.index
             )
-            untouched_frame = self.drop(columns=columns)
         # If we mapped over all the data we are done. If not, we need to
         # prepend the `new_modin_frame` with the raw data from the columns that were
         # not selected.
         if len(columns) != len(self.columns):
+            untouched_frame = self.drop(columns=columns)
             new_modin_frame = untouched_frame._modin_frame.concat(
                 1, [new_modin_frame], how="left", sort=False
             )
         return self.__constructor__(new_modin_frame)
 
+    @staticmethod
+    def _get_dummies_labels(value, name, columns):
+        """
+        Get the value of a labeling parameter of ``pandas.get_dummies`` for every encoded column.
+
+        Parameters
+        ----------
+        value : str, list, dict or None
+            The value of the `prefix` or `prefix_sep` parameter.
+        name : str
+            The name of the parameter.
+        columns : list of labels
+            Labels of the encoded columns.
+
+        Returns
+        -------
+        list
+        """
+        if isinstance(value, str):
+            return [value] * len(columns)
+        if isinstance(value, dict):
+            return [value[col] for col in columns]
+        if value is None:
+            return list(columns)
+        if len(value) != len(columns):
+            raise ValueError(
+                f"Length of '{name}' ({len(value)}) did not match the length "
+                + f"of the columns being encoded ({len(columns)})."
+            )
+        return list(value)
+
+    def _encode_dummies(self, columns, labeling, **kwargs):
+        """
+        Convert the specified columns to dummy variables block by block.
+
+        The categories of every column are collected with a tree reduce first, so
+        all of the blocks produce the same dummy columns and are encoded in parallel.
+
+        Parameters
+        ----------
+        columns : list of labels
+            Unique labels of the columns to encode.
+        labeling : dict
+            Mapping of the encoded columns to the ``(prefix, prefix_sep)``
+            to label their dummies with.
+        **kwargs : dict
+            Other parameters to pass to ``pandas.get_dummies``.
+
+        Returns
+        -------
+        PandasDataframe
+            A new frame with the dummy columns only.
+        """
+        frame = self._modin_frame.take_2d_labels_or_positional(col_labels=columns)
+        dtypes = frame.dtypes
+        # Categorical columns are encoded with all of their categories, so
+        # only the values of the others have to be collected.
+        categories = {
+            col: dtype.categories
+            for col, dtype in dtypes.items()
+            if is_categorical_dtype(dtype)
+        }
+        to_collect = [col for col in frame.columns if col not in categories]
+
+        def unique_values(df):
+            values = np.empty(len(df.columns), dtype=object)
+            for i in range(len(df.columns)):
+                values[i] = pandas.Index(df.iloc[:, i].dropna().unique())
+            return pandas.Series(values, index=df.columns)
+
+        def union_values(df):
+            values = np.empty(len(df.columns), dtype=object)
+            for i in range(len(df.columns)):
+                partial_values = df.iloc[:, i].tolist()
+                values[i] = partial_values[0].append(partial_values[1:]).unique()
+            return pandas.Series(values, index=df.columns)
+
+        if len(to_collect) > 0:
+            collected = (
+                frame.take_2d_labels_or_positional(col_labels=to_collect)
+                .tree_reduce(0, unique_values, union_values)
+                .to_pandas()
+            )
+            for col in to_collect:
+                # The categories are ordered as pandas orders them
+                categories[col] = pandas.Categorical(collected[col].iloc[0]).categories
+
+        def encode(values, col):
+            prefix, prefix_sep = labeling[col]
+            return pandas.get_dummies(
+                pandas.Series(
+                    pandas.Categorical(values, categories=categories[col]),
+                    index=values.index,
+                ),
+                prefix=prefix,
+                prefix_sep=prefix_sep,
+                **kwargs,
+            )
+
+        empty_dummies = {
+            col: encode(pandas.Series([], dtype=dtypes[col]), col)
+            for col in frame.columns
+        }
+        new_columns = pandas.Index([]).append(
+            [empty_dummies[col].columns for col in frame.columns]
+        )
+        new_dtypes = pandas.concat(
+            [empty_dummies[col].dtypes for col in frame.columns]
+        )
+        col_offsets = np.cumsum([0] + frame.column_widths)
+        new_widths = [
+            sum(len(empty_dummies[col].columns) for col in frame.columns[start:stop])
+            for start, stop in zip(col_offsets[:-1], col_offsets[1:])
+        ]
+
+        def encode_block(df):
+            return pandas.concat(
+                [encode(df[col], col) for col in df.columns], axis=1, copy=False
+            )
+
+        return frame.map(
+            encode_block,
+            dtypes=new_dtypes,
+            new_columns=new_columns,
+            column_widths=new_widths,
+        )
+
     # END Get_dummies
 
     # Indexing
@@ -3169,8 +4923,54 @@ class PandasQueryCompiler(BaseQueryCompiler):
         kwargs["ignore_index"] = False
         if not is_list_like(columns):
             columns = [columns]
-        # Currently, sort_values will just reindex based on the sorted values.
-        # TODO create a more efficient way to sort
+        for col in columns:
+            if col not in self.columns and col not in self.index.names:
+                raise KeyError(col)
+        # Rows can't be range-partitioned by a categorical or an ambiguous key,
+        # so the keys are gathered on the driver in these cases.
+        sort_on_driver = len(columns) == 0 or (
+            columns[0] in self.columns
+            and (
+                not self.columns.is_unique
+                or is_categorical_dtype(self.dtypes[columns[0]])
+            )
+        )
+        if not sort_on_driver:
+            new_modin_frame = self._modin_frame.sort_by(
+                0, columns, ascending=ascending, **kwargs
+            )
+            result = self.__constructor__(new_modin_frame)
+            if ignore_index:
+                result = result.reset_index(drop=True)
+            return result
+        return self._sort_rows_by_column_values_on_driver(
+            columns, ascending=ascending, ignore_index=ignore_index, **kwargs
+        )
+
+    def _sort_rows_by_column_values_on_driver(
+        self, columns, ascending=True, ignore_index=False, **kwargs
+    ):
+        """
+        Sort rows by the values of the passed columns by gathering the sort keys on the driver.
+
+        This is used when the keys can't be range-partitioned, for example,
+        when the first sort key is categorical.
+
+        Parameters
+        ----------
+        columns : list of labels
+            Column labels to sort by.
+        ascending : bool or list of bools, default: True
+            Whether to sort in ascending or descending order.
+        ignore_index : bool, default: False
+            Whether to reset the index of the result.
+        **kwargs : dict
+            Keyword arguments to pass to ``pandas.DataFrame.sort_values``.
+
+        Returns
+        -------
+        PandasQueryCompiler
+        """
         ErrorMessage.default_to_pandas("sort_values")
         broadcast_value_dict = {
             col: self.getitem_column_array([col]).to_pandas().squeeze(axis=1)
@@ -0,0 +1,484 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""
+Module houses mergeable sketches summarizing the columns of partitions.
+
+A sketch summarizes a column of a single partition in a bounded amount of memory
+and the sketches of the partitions are merged by a tree reduce, so the quantiles
+and the number of unique values of a column are computed without gathering the
+column into a single partition.
+"""
+
+import numpy as np
+import pandas
+
+
+class QuantileSketch:
+    """
+    Mergeable summary of the order statistics of a column.
+
+    The sketch holds the values of the column at evenly spaced ranks along with
+    bounds of their ranks. The ranks are exact in the sketch of a single partition,
+    merging the sketches only keeps their bounds: for every value `v` of the sketch
+    `rmin` is not greater than the number of the values not greater than `v`,
+    and `rmax` is not less than the number of the values less than `v` plus one.
+    The value of the column at any rank is thus known to lie between the values of
+    the sketch which are certainly not ranked after and before it.
+
+    The sketch also holds the number, mean and sum of squared deviations from the
+    mean of the values, and the number of the missing values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The sorted values of the sketch.
+    rmin : np.ndarray
+        The lower bounds of the ranks of `values`.
+    rmax : np.ndarray
+        The upper bounds of the ranks of `values`.
+    count : int
+        The number of the values of the column.
+    nan_count : int
+        The number of the missing values of the column.
+    mean : float
+        The mean of the values of the column.
+    m2 : float
+        The sum of squared deviations from the mean of the values of the column.
+    """
+
+    # The number of values kept from a partition.
+    SIZE = 1024
+
+    def __init__(self, values, rmin, rmax, count, nan_count, mean, m2):
+        self.values = values
+        self.rmin = rmin
+        self.rmax = rmax
+        self.count = count
+        self.nan_count = nan_count
+        self.mean = mean
+        self.m2 = m2
+
+    @classmethod
+    def from_values(cls, values, size=None):
+        """
+        Build the sketch of a column of a partition.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The values of the column, may contain missing values.
+        size : int, optional
+            The number of values to keep, ``QuantileSketch.SIZE`` by default.
+
+        Returns
+        -------
+        QuantileSketch
+        """
+        size = cls.SIZE if size is None else size
+        is_na = pandas.isna(values)
+        nan_count = int(is_na.sum())
+        if nan_count:
+            values = values[~is_na]
+        count = len(values)
+        if count == 0:
+            mean, m2 = np.nan, 0.0
+        else:
+            deviation = values.astype(np.float64)
+            mean = deviation.mean()
+            deviation -= mean
+            m2 = float(np.dot(deviation, deviation))
+        if count <= size:
+            ranks = np.arange(count)
+            values = np.sort(values)
+        else:
+            # Only the kept ranks have to be in place, the rest is left unsorted.
+            ranks = np.unique(np.linspace(0, count - 1, size).round().astype(np.int64))
+            values = np.partition(values, ranks)[ranks]
+        ranks = ranks + 1
+        return cls(values, ranks, ranks.copy(), count, nan_count, mean, m2)
+
+    def merge(self, other, size=None):
+        """
+        Merge the sketch with the sketch of another partition of the column.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            The sketch to merge with.
+        size : int, optional
+            The number of values to keep, all of the values of both sketches are
+            kept by default.
+
+        Returns
+        -------
+        QuantileSketch
+        """
+        count = self.count + other.count
+        if self.count == 0 or other.count == 0:
+            mean = other.mean if self.count == 0 else self.mean
+            m2 = self.m2 + other.m2
+        else:
+            delta = other.mean - self.mean
+            mean = self.mean + delta * other.count / count
+            m2 = self.m2 + other.m2 + delta ** 2 * self.count * other.count / count
+        left_rmin, left_rmax = self._bounds_in(other)
+        right_rmin, right_rmax = other._bounds_in(self)
+        values = np.concatenate([self.values, other.values])
+        order = np.argsort(values, kind="stable")
+        result = type(self)(
+            values[order],
+            np.concatenate([left_rmin, right_rmin])[order],
+            np.concatenate([left_rmax, right_rmax])[order],
+            count,
+            self.nan_count + other.nan_count,
+            mean,
+            m2,
+        )
+        if size is not None and len(result.values) > size:
+            # Dropping values doesn't invalidate the bounds of the rest of them,
+            # the extremes are always kept.
+            keep = np.unique(
+                np.linspace(0, len(result.values) - 1, size).round().astype(np.int64)
+            )
+            result.values = result.values[keep]
+            result.rmin = result.rmin[keep]
+            result.rmax = result.rmax[keep]
+        return result
+
+    def _bounds_in(self, other):
+        """
+        Compute the bounds of the ranks of the values among the values of both sketches.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            The sketch of the other values.
+
+        Returns
+        -------
+        rmin : np.ndarray
+        rmax : np.ndarray
+        """
+        if len(other.values) == 0:
+            return self.rmin, self.rmax
+        # Any value of `other` not greater than a value bounds the number of the
+        # values not greater than it from below, and any value not less than
+        # it bounds the number of values less than it from above.
+        preceding = np.searchsorted(other.values, self.values, side="right") - 1
+        rmin_below = np.maximum.accumulate(other.rmin)
+        rmin = self.rmin + np.where(
+            preceding >= 0, rmin_below[np.maximum(preceding, 0)], 0
+        )
+        following = np.searchsorted(other.values, self.values, side="left")
+        rmax_above = np.minimum.accumulate(other.rmax[::-1])[::-1]
+        rmax = self.rmax + np.where(
+            following < len(other.values),
+            rmax_above[np.minimum(following, len(other.values) - 1)] - 1,
+            other.count,
+        )
+        return rmin, rmax
+
+    def bounds(self, rank):
+        """
+        Get the bounds of the value at the rank.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the value, starting from 1.
+
+        Returns
+        -------
+        lower : scalar or None
+            The value not greater than the value at `rank`, None if unknown.
+        upper : scalar or None
+            The value not less than the value at `rank`, None if unknown.
+        """
+        below = self.values[self.rmax <= rank]
+        above = self.values[self.rmin >= rank]
+        return (
+            below[-1] if len(below) else None,
+            above[0] if len(above) else None,
+        )
+
+    def query(self, rank):
+        """
+        Estimate the value at the rank.
+
+        Parameters
+        ----------
+        rank : int
+            The rank of the value, starting from 1.
+
+        Returns
+        -------
+        scalar
+            The value of the sketch with the closest bounds of the rank.
+        """
+        error = np.maximum(rank - self.rmin, self.rmax - rank)
+        return self.values[np.argmin(error)]
+
+
+class QuantileBand:
+    """
+    Values of a column within the bounds of some of its ranks.
+
+    Parameters
+    ----------
+    intervals : list of tuples
+        The pairs of lower and upper bounds of the values, None if unbounded.
+    below : np.ndarray
+        The numbers of the values less than the lower bounds.
+    bands : list of np.ndarray
+        The values between the bounds.
+    """
+
+    def __init__(self, intervals, below, bands):
+        self.intervals = intervals
+        self.below = below
+        self.bands = bands
+
+    @classmethod
+    def from_values(cls, values, intervals):
+        """
+        Select the values of a column of a partition within the intervals.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The values of the column, may contain missing values.
+        intervals : list of tuples
+            The pairs of lower and upper bounds of the values, None if unbounded.
+
+        Returns
+        -------
+        QuantileBand
+        """
+        values = values[~pandas.isna(values)]
+        below, bands = [], []
+        for lower, upper in intervals:
+            mask = np.ones(len(values), dtype=bool)
+            if lower is None:
+                below.append(0)
+            else:
+                below.append(int((values < lower).sum()))
+                mask &= values >= lower
+            if upper is not None:
+                mask &= values <= upper
+            bands.append(values[mask])
+        return cls(intervals, np.array(below, dtype=np.int64), bands)
+
+    def merge(self, other):
+        """
+        Merge the band with the band of another partition of the column.
+
+        Parameters
+        ----------
+        other : QuantileBand
+            The band to merge with.
+
+        Returns
+        -------
+        QuantileBand
+        """
+        return type(self)(
+            self.intervals,
+            self.below + other.below,
+            [
+                np.concatenate([left, right])
+                for left, right in zip(self.bands, other.bands)
+            ],
+        )
+
+    def take(self, ranks):
+        """
+        Get the values at the ranks.
+
+        Parameters
+        ----------
+        ranks : list of int
+            The ranks of the values, starting from 1, each lying in an interval.
+
+        Returns
+        -------
+        list
+        """
+        bands = [None] * len(self.bands)
+        result = []
+        for rank in ranks:
+            for i in range(len(self.intervals)):
+                if self.below[i] < rank <= self.below[i] + len(self.bands[i]):
+                    break
+            else:
+                raise ValueError(f"Rank {rank} lies outside of the bands")
+            if bands[i] is None:
+                bands[i] = np.sort(self.bands[i])
+            result.append(bands[i][rank - 1 - self.below[i]])
+        return result
+
+
+class HyperLogLog:
+    """
+    Mergeable estimate of the number of unique values of a column.
+
+    The values are hashed into ``2 ** PRECISION`` registers, each holding the
+    maximum number of leading zeros of the hashes falling into it.
+
+    Parameters
+    ----------
+    registers : np.ndarray
+        The registers of the sketch.
+    has_na : bool
+        Whether the column has missing values.
+    """
+
+    PRECISION = 14
+
+    def __init__(self, registers, has_na):
+        self.registers = registers
+        self.has_na = has_na
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        Build the sketch of a column of a partition.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The values of the column, may contain missing values.
+
+        Returns
+        -------
+        HyperLogLog
+        """
+        is_na = pandas.isna(values)
+        hashes = pandas.util.hash_array(np.asarray(values[~is_na]))
+        bucket = (hashes >> np.uint64(64 - cls.PRECISION)).astype(np.int64)
+        remainder = hashes << np.uint64(cls.PRECISION)
+        # Count the leading zeros of the remaining bits by halving the bits tested.
+        zeros = np.zeros(len(hashes), dtype=np.uint8)
+        for shift in (32, 16, 8, 4, 2, 1):
+            is_zero = (remainder >> np.uint64(64 - shift)) == 0
+            zeros[is_zero] += shift
+            remainder = np.where(is_zero, remainder << np.uint64(shift), remainder)
+        rank = np.minimum(zeros + 1, 64 - cls.PRECISION + 1).astype(np.uint8)
+        registers = np.zeros(2 ** cls.PRECISION, dtype=np.uint8)
+        np.maximum.at(registers, bucket, rank)
+        return cls(registers, bool(is_na.any()))
+
+    def merge(self, other):
+        """
+        Merge the sketch with the sketch of another partition of the column.
+
+        Parameters
+        ----------
+        other : HyperLogLog
+            The sketch to merge with.
+
+        Returns
+        -------
+        HyperLogLog
+        """
+        return type(self)(
+            np.maximum(self.registers, other.registers), self.has_na or other.has_na
+        )
+
+    def estimate(self, dropna=True):
+        """
+        Estimate the number of unique values.
+
+        Parameters
+        ----------
+        dropna : bool, default: True
+            Whether to not count the missing values.
+
+        Returns
+        -------
+        int
+        """
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size ** 2 / np.sum(np.exp2(-self.registers.astype(float)))
+        empty = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * size and empty:
+            # Linear counting is more accurate for the small cardinalities.
+            estimate = size * np.log(size / empty)
+        return int(round(estimate)) + int(not dropna and self.has_na)
+
+
+def quantile_positions(count, q, interpolation):
+    """
+    Get the positions of the values needed to compute the quantiles as NumPy does.
+
+    Parameters
+    ----------
+    count : int
+        The number of the values.
+    q : np.ndarray
+        The quantiles.
+    interpolation : {"linear", "lower", "higher", "midpoint", "nearest"}
+        The interpolation method.
+
+    Returns
+    -------
+    lower : np.ndarray
+        The positions, starting from 0, of the values below the quantiles.
+    upper : np.ndarray
+        The positions of the values above the quantiles.
+    fraction : np.ndarray or None
+        The weights of the upper values, None if the quantiles are the lower values.
+    """
+    # pandas passes the percentiles, which NumPy divides back.
+    q = np.true_divide(np.asarray(q, dtype=np.float64) * 100.0, 100)
+    index = (count - 1) * q
+    if interpolation in ("lower", "higher", "nearest"):
+        rounding = {"lower": np.floor, "higher": np.ceil, "nearest": np.around}
+        lower = rounding[interpolation](index).astype(np.int64)
+        return lower, lower, None
+    if interpolation == "midpoint":
+        index = 0.5 * (np.floor(index) + np.ceil(index))
+    lower = np.floor(index).astype(np.int64)
+    upper = np.minimum(lower + 1, count - 1)
+    above = index >= count - 1
+    lower[above] = count - 1
+    fraction = index - np.floor(index)
+    if interpolation == "midpoint":
+        fraction = np.where(index % 1 == 0, 0.0, 0.5)
+    return lower, upper, fraction
+
+
+def interpolate(lower, upper, fraction):
+    """
+    Interpolate between the values as NumPy does.
+
+    Parameters
+    ----------
+    lower : np.ndarray
+        The values below the quantiles.
+    upper : np.ndarray
+        The values above the quantiles.
+    fraction : np.ndarray or None
+        The weights of the upper values, None to take the lower values.
+
+    Returns
+    -------
+    np.ndarray
+    """
+    if fraction is None:
+        return lower
+    diff = np.subtract(upper, lower)
+    return np.where(
+        fraction >= 0.5, upper - diff * (1 - fraction), lower + diff * fraction
+    )
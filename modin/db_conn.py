@@ -23,8 +23,12 @@ make a db connection. It can make and provide a connection whenever the Modin
 driver or a worker wants one.
 """
 
+import datetime
 from typing import Any, Sequence, Dict, Optional
 
+import numpy as np
+import pandas
+
 _PSYCOPG_LIB_NAME = "psycopg2"
 _SQLALCHEMY_LIB_NAME = "sqlalchemy"
 
@@ -178,3 +182,78 @@ class ModinDatabaseConnection:
             if self._dialect_is_microsoft_sql()
             else f"SELECT * FROM ({query}) AS _ LIMIT {limit} OFFSET {offset}"
         )
+
+    def min_max_query(self, query: str, column: str) -> str:
+        """
+        Get a query that gives the minimum and the maximum of `column` in `query`.
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to check.
+        column : str
+            The column to get the bounds of.
+
+        Returns
+        -------
+        str
+        """
+        return f"SELECT MIN({column}), MAX({column}) FROM ({query}) AS _"
+
+    def key_range_query(
+        self, query: str, column: str, lower: Any = None, upper: Any = None
+    ) -> str:
+        """
+        Get a query that selects the rows of `query` with `column` in a range.
+
+        The range is half-open: ``lower <= column < upper``. A missing bound
+        leaves that side of the range open, and the range without a lower
+        bound also selects the rows where `column` is NULL, so that the
+        ranges produced for consecutive bounds cover every row exactly once.
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to get a partition.
+        column : str
+            The column to filter on.
+        lower : Any, optional
+            The inclusive lower bound of the range.
+        upper : Any, optional
+            The exclusive upper bound of the range.
+
+        Returns
+        -------
+        str
+        """
+        predicates = []
+        if lower is not None:
+            predicates.append(f"{column} >= {_sql_literal(lower)}")
+        if upper is not None:
+            predicates.append(f"{column} < {_sql_literal(upper)}")
+            if lower is None:
+                predicates = [f"({predicates[0]} OR {column} IS NULL)"]
+        where = f" WHERE {' AND '.join(predicates)}" if predicates else ""
+        return f"SELECT * FROM ({query}) AS _{where}"
+
+
+def _sql_literal(value: Any) -> str:
+    """
+    Render a partition bound as an SQL literal.
+
+    Parameters
+    ----------
+    value : Any
+        A number, a date or a datetime.
+
+    Returns
+    -------
+    str
+    """
+    if isinstance(value, (datetime.date, np.datetime64)):
+        value = pandas.Timestamp(value)
+    if isinstance(value, pandas.Timestamp):
+        return f"'{value.isoformat(sep=' ')}'"
+    if isinstance(value, (int, np.integer)):
+        return str(int(value))
+    return repr(float(value))
@@ -81,6 +81,7 @@ def unwrap_partitions(api_layer_object, axis=None, get_ip=False):
         if actual_engine in (
             "PandasOnRayDataframePartition",
             "PandasOnDaskDataframePartition",
+            "PandasOnThreadsDataframePartition",
         ):
             return _unwrap_partitions()
         raise ValueError(
@@ -83,11 +83,15 @@ def read_sql(
         If specified, return an iterator where `chunksize` is the
         number of rows to include in each chunk.
     partition_column : str, optional
-        Column used to share the data between the workers (MUST be a INTEGER column).
+        Column used to share the data between the workers. With Ray engine it
+        MUST be an INTEGER column and both bounds are required, with Dask engine
+        it can be a numeric or datetime column.
     lower_bound : int, optional
-        The minimum value to be requested from the partition_column.
+        The minimum value to be requested from the partition_column. The
+        minimum of the column is used if not specified (Dask only).
     upper_bound : int, optional
-        The maximum value to be requested from the partition_column.
+        The maximum value to be requested from the partition_column. The
+        maximum of the column is used if not specified (Dask only).
     max_sessions : int, optional
         The maximum number of simultaneous connections allowed to use.
 
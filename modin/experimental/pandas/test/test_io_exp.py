@@ -65,6 +65,41 @@ def test_from_sql_distributed(make_sql_connection):  # noqa: F811
         df_equals(modin_df_from_table, pandas_df)
 
 
+@pytest.mark.skipif(
+    Engine.get() != "Dask", reason="Key ranges are read by the Dask SQL dispatcher"
+)
+@pytest.mark.parametrize("partition_column", ["int_key", "float_key", "date_key"])
+@pytest.mark.parametrize("bounds", [(None, None), "explicit"])
+def test_from_sql_key_ranges(make_sql_connection, partition_column, bounds):
+    pandas_df = pandas.DataFrame(
+        {
+            "int_key": [0, 1, 2, 3, 5, 8, 13, 21, 34, 55],
+            "float_key": [-1.5, 0.0, 0.25, np.nan, 1.0, 2.5, 4.0, 4.5, np.nan, 7.0],
+            "date_key": pandas.date_range("2020-01-01", periods=10, freq="3D"),
+            "value": np.arange(10),
+        }
+    )
+    if bounds == "explicit":
+        # the rows out of the bounds are read by the outermost ranges
+        bounds = tuple(pandas_df[partition_column].iloc[[2, -3]])
+    with ensure_clean_dir() as dirname:
+        conn = make_sql_connection(os.path.join(dirname, "test_key_ranges.db"))
+        pandas_df.to_sql("test_key_ranges", conn, index=False)
+        query = f"select * from test_key_ranges order by {partition_column}"
+
+        pandas_df = pandas.read_sql(query, conn)
+        modin_df = pd.read_sql(
+            query,
+            conn,
+            partition_column=partition_column,
+            lower_bound=bounds[0],
+            upper_bound=bounds[1],
+            max_sessions=4,
+        )
+        df_equals(modin_df, pandas_df)
+        assert modin_df._query_compiler._modin_frame._row_lengths_cache is not None
+
+
 @pytest.mark.skipif(
     Engine.get() == "Dask", reason="Dask does not have experimental API",
 )
@@ -14,5 +14,6 @@
 """Module holds model selection specific functionality."""
 
 from .train_test_split import train_test_split
+from .k_fold import k_fold_split
 
-__all__ = ["train_test_split"]
+__all__ = ["train_test_split", "k_fold_split"]
@@ -0,0 +1,99 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Module holds `k_fold_split` function."""
+
+import numpy as np
+
+from .utils import allocate, draw_group_labels, get_seed, get_stratify_frame
+
+
+def k_fold_split(df, n_splits=5, shuffle=False, random_state=None, stratify=None):
+    """
+    Generate the row positions splitting input data into k folds.
+
+    Every fold is used once as the test data while the rest of the folds
+    form the train data.
+
+    Parameters
+    ----------
+    df : modin.pandas.DataFrame / modin.pandas.Series
+        Data to split.
+    n_splits : int, default: 5
+        Number of folds, at least 2.
+    shuffle : bool, default: False
+        Whether to randomly draw the rows of the folds. If False, the folds are
+        consecutive blocks of rows.
+    random_state : int, numpy.random.RandomState, optional
+        Controls the shuffling, pass an int for reproducible output.
+    stratify : modin.pandas.Series, optional
+        If specified, the proportion of every class of `stratify` is preserved
+        in each fold. Requires `shuffle`.
+
+    Yields
+    ------
+    tuple
+        A pair of NumPy arrays with the positions of the train and test rows,
+        ready to be passed to ``iloc``.
+
+    Notes
+    -----
+    The fold of every row is drawn once, partition by partition, the same way
+    as ``train_test_split`` draws its splits. Only the fold labels are
+    transferred to the driver, the data itself is not copied.
+    """
+    n_samples = len(df)
+    if not isinstance(n_splits, (int, np.integer)) or n_splits < 2:
+        raise ValueError(
+            "k-fold cross-validation requires at least one train/test split by "
+            + f"setting n_splits=2 or more, got n_splits={n_splits}."
+        )
+    if n_splits > n_samples:
+        raise ValueError(
+            f"Cannot have number of splits n_splits={n_splits} greater than "
+            + f"the number of samples: n_samples={n_samples}."
+        )
+
+    if not shuffle:
+        if stratify is not None:
+            raise ValueError(
+                "Stratified k-fold split is not implemented for shuffle=False"
+            )
+        fold_sizes = np.full(n_splits, n_samples // n_splits)
+        fold_sizes[: n_samples % n_splits] += 1
+        fold_labels = np.repeat(np.arange(n_splits), fold_sizes)
+    else:
+        frame = df._query_compiler._modin_frame
+        stratify_frame = (
+            None if stratify is None else get_stratify_frame(stratify, n_samples)
+        )
+
+        def allocate_groups(class_counts, rng):
+            ones = np.ones(n_splits, dtype=np.int64)
+            return np.stack([allocate(count, ones, rng) for count in class_counts])
+
+        labels, _ = draw_group_labels(
+            frame, allocate_groups, get_seed(random_state), stratify=stratify_frame
+        )
+        fold_labels = np.concatenate(
+            [
+                part.iloc[:, 0].to_numpy()
+                for part in frame._partition_mgr_cls.get_objects_from_partitions(
+                    labels[:, 0]
+                )
+            ]
+        )
+
+    for fold in range(n_splits):
+        test_mask = fold_labels == fold
+        yield np.flatnonzero(~test_mask), np.flatnonzero(test_mask)
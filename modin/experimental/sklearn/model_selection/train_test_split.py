@@ -11,11 +11,31 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
-"""Module holds `train_test_splt` function."""
+"""Module holds `train_test_split` function."""
 
+import math
 
-# FIXME: Change `**options`-->`train_size=0.75`
-def train_test_split(df, **options):
+import numpy as np
+
+from .utils import (
+    allocate,
+    align_row_partitions,
+    draw_group_labels,
+    get_seed,
+    get_stratify_frame,
+    take_groups,
+)
+
+
+def train_test_split(
+    df,
+    *arrays,
+    test_size=None,
+    train_size=None,
+    random_state=None,
+    shuffle=False,
+    stratify=None,
+):
     """
     Split input data to train and test data.
 
@@ -23,16 +43,166 @@ def train_test_split(df, **options):
     ----------
     df : modin.pandas.DataFrame / modin.pandas.Series
         Data to split.
-    **options : dict
-        Keyword arguments. If `train_size` key isn't provided
-        `train_size` will be 0.75.
+    *arrays : modin.pandas.DataFrame / modin.pandas.Series
+        More data of the same length as `df` to split the same way.
+    test_size : float or int, optional
+        Proportion or absolute number of the rows to put into the test data.
+        If not specified, the complement of `train_size` is used.
+    train_size : float or int, optional
+        Proportion or absolute number of the rows to put into the train data.
+        If not specified, the complement of `test_size` is used. If both sizes
+        are not specified, `train_size` is 0.75.
+    random_state : int, numpy.random.RandomState, optional
+        Controls the shuffling, pass an int for reproducible output.
+    shuffle : bool, default: False
+        Whether to randomly draw the rows of the splits. If False, the train data
+        holds the first rows and the test data holds the rows following them.
+    stratify : modin.pandas.Series, optional
+        If specified, the data is split so that the proportion of every class
+        of `stratify` is the same in the train and test data. Requires `shuffle`.
 
     Returns
     -------
     tuple
-        A pair of modin.pandas.DataFrame / modin.pandas.Series.
+        The train and test pair of every passed DataFrame or Series.
+
+    Notes
+    -----
+    Shuffled splits are drawn partition by partition: every row partition
+    randomly draws its rows into the splits, so the data is never moved
+    to a single worker. The rows keep their original order within the splits.
     """
-    train_size = options.get("train_size", 0.75)
-    train = df.iloc[: int(len(df) * train_size)]
-    test = df.iloc[len(train) :]
-    return train, test
+    arrays = (df,) + arrays
+    n_samples = len(df)
+    if any(len(array) != n_samples for array in arrays):
+        raise ValueError(
+            "Found input variables with inconsistent numbers of samples: "
+            + f"{[len(array) for array in arrays]}"
+        )
+    n_train, n_test = _get_split_sizes(n_samples, test_size, train_size)
+
+    if not shuffle:
+        if stratify is not None:
+            raise ValueError(
+                "Stratified train/test split is not implemented for shuffle=False"
+            )
+        return tuple(
+            split
+            for array in arrays
+            for split in (array.iloc[:n_train], array.iloc[n_train : n_train + n_test])
+        )
+
+    frames = [array._query_compiler._modin_frame for array in arrays]
+    for frame in frames:
+        # The partitions must hold the actual labels as the index of the splits
+        # is computed from them
+        frame._propagate_index_objs(axis=0)
+    row_lengths = frames[0].row_lengths
+    frames = [align_row_partitions(frame, row_lengths) for frame in frames]
+
+    if stratify is None:
+        stratify_frame = None
+    else:
+        stratify_frame = get_stratify_frame(stratify, n_samples)
+
+    def allocate_groups(class_counts, rng):
+        if stratify is None:
+            return np.array([[n_train, n_test]])
+        n_classes = len(class_counts)
+        if class_counts.min() < 2:
+            raise ValueError(
+                "The least populated class in y has only 1 member, which is too few. "
+                + "The minimum number of groups for any class cannot be less than 2."
+            )
+        if n_train < n_classes:
+            raise ValueError(
+                f"The train_size = {n_train} should be greater or equal to the "
+                + f"number of classes = {n_classes}"
+            )
+        if n_test < n_classes:
+            raise ValueError(
+                f"The test_size = {n_test} should be greater or equal to the "
+                + f"number of classes = {n_classes}"
+            )
+        class_test = allocate(n_test, class_counts, rng)
+        class_train = allocate(n_train, class_counts - class_test, rng)
+        return np.stack([class_train, class_test], axis=1)
+
+    labels, group_lengths = draw_group_labels(
+        frames[0], allocate_groups, get_seed(random_state), stratify=stratify_frame
+    )
+    return tuple(
+        type(array)(
+            query_compiler=array._query_compiler.__constructor__(
+                take_groups(frame, labels, [group], group_lengths[:, group])
+            )
+        )
+        for array, frame in zip(arrays, frames)
+        for group in (0, 1)
+    )
+
+
+def _get_split_sizes(n_samples, test_size, train_size):
+    """
+    Compute the number of rows in the train and test data.
+
+    Parameters
+    ----------
+    n_samples : int
+        Number of rows to split.
+    test_size : float, int or None
+        Proportion or absolute number of the test rows.
+    train_size : float, int or None
+        Proportion or absolute number of the train rows.
+
+    Returns
+    -------
+    tuple
+        A pair of the train and test sizes.
+    """
+    if test_size is None and train_size is None:
+        train_size = 0.75
+    for name, size in (("test_size", test_size), ("train_size", train_size)):
+        if size is None:
+            continue
+        if isinstance(size, float) and not 0 < size < 1:
+            raise ValueError(
+                f"{name}={size} should be a float in the (0, 1) range "
+                + "or an integer"
+            )
+        if not isinstance(size, float) and not 0 < size < n_samples:
+            raise ValueError(
+                f"{name}={size} should be either positive and smaller than the "
+                + f"number of samples {n_samples} or a float in the (0, 1) range"
+            )
+    n_test = None
+    if test_size is not None:
+        n_test = (
+            math.ceil(test_size * n_samples)
+            if isinstance(test_size, float)
+            else test_size
+        )
+    n_train = None
+    if train_size is not None:
+        n_train = (
+            math.floor(train_size * n_samples)
+            if isinstance(train_size, float)
+            else train_size
+        )
+    if n_train is None:
+        n_train = n_samples - n_test
+    elif n_test is None:
+        n_test = n_samples - n_train
+    if n_train + n_test > n_samples:
+        raise ValueError(
+            f"The sum of train_size and test_size = {n_train + n_test}, should be "
+            + f"smaller than the number of samples {n_samples}. Reduce test_size "
+            + "and/or train_size."
+        )
+    if n_train == 0:
+        raise ValueError(
+            f"With n_samples={n_samples}, test_size={test_size} and "
+            + f"train_size={train_size}, the resulting train set will be empty."
+        )
+    return n_train, n_test
+
@@ -0,0 +1,298 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""
+Module holds utilities drawing random row groups of Modin frames partition by partition.
+
+Every row partition draws its own random labels with a generator seeded by the
+split seed and the partition number, so the labels are reproducible and never
+leave the workers. The driver only decides how many rows of every class each
+partition contributes to each group (the quotas).
+"""
+
+import numpy as np
+import pandas
+
+
+def get_seed(random_state):
+    """
+    Get an integer seed out of `random_state`.
+
+    Parameters
+    ----------
+    random_state : int, numpy.random.RandomState or None
+        Object controlling the randomness. If None, the seed is drawn from
+        the global NumPy random state.
+
+    Returns
+    -------
+    int
+    """
+    if random_state is None:
+        random_state = np.random.mtrand._rand
+    if isinstance(random_state, np.random.RandomState):
+        return int(random_state.randint(np.iinfo(np.int32).max))
+    if isinstance(random_state, (int, np.integer)):
+        return int(random_state)
+    raise ValueError(
+        f"{random_state!r} cannot be used to seed a numpy.random.RandomState instance"
+    )
+
+
+def get_stratify_frame(stratify, n_samples):
+    """
+    Get the single-column frame holding the classes to stratify by.
+
+    Parameters
+    ----------
+    stratify : modin.pandas.Series, modin.pandas.DataFrame or array-like
+        Classes of the rows.
+    n_samples : int
+        Number of rows to split.
+
+    Returns
+    -------
+    PandasDataframe
+    """
+    from modin.pandas import Series
+    from modin.pandas.base import BasePandasDataset
+
+    if not isinstance(stratify, BasePandasDataset):
+        stratify = Series(np.asarray(stratify))
+    if len(stratify) != n_samples:
+        raise ValueError(
+            "Found input variables with inconsistent numbers of samples: "
+            + f"[{n_samples}, {len(stratify)}]"
+        )
+    frame = stratify._query_compiler._modin_frame
+    if len(frame.columns) != 1:
+        raise ValueError("`stratify` must hold a single column")
+    return frame
+
+
+def allocate(total, capacity, rng):
+    """
+    Distribute `total` items across bins proportionally to their `capacity`.
+
+    Every bin gets the integer part of its share, the rest of the items is
+    given to randomly chosen bins with the probability proportional to the
+    fractional part of their share. No bin ever gets more than its capacity.
+
+    Parameters
+    ----------
+    total : int
+        Number of items to distribute, must not exceed the total capacity.
+    capacity : np.ndarray
+        1D array with the capacity of every bin.
+    rng : numpy.random.Generator
+        Generator breaking the ties.
+
+    Returns
+    -------
+    np.ndarray
+        1D array with the number of items of every bin.
+    """
+    capacity = np.asarray(capacity, dtype=np.int64)
+    capacity_sum = capacity.sum()
+    if total == 0 or capacity_sum == 0:
+        return np.zeros(len(capacity), dtype=np.int64)
+    result, remainders = np.divmod(total * capacity, capacity_sum)
+    n_left = int(total - result.sum())
+    if n_left > 0:
+        extra = rng.choice(
+            len(capacity),
+            size=n_left,
+            replace=False,
+            p=remainders / remainders.sum(),
+        )
+        result[extra] += 1
+    return result
+
+
+def draw_labels(codes, quotas, seed):
+    """
+    Randomly assign the rows of a partition to groups.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Class number of every row.
+    quotas : np.ndarray
+        2D array of shape (n_classes, n_groups) with the number of rows of every
+        class to assign to each group.
+    seed : list of ints
+        Seed of the random generator.
+
+    Returns
+    -------
+    np.ndarray
+        Group number of every row. Rows that are not assigned to any group
+        get the number of groups as their label.
+    """
+    rng = np.random.default_rng(seed)
+    n_rows = len(codes)
+    # Order rows by class and randomly inside a class to get the rank of every row
+    # in its class, the first ``quotas[cls, 0]`` ranks go to the first group and so on
+    order = np.lexsort((rng.random(n_rows), codes))
+    sorted_codes = codes[order]
+    class_starts = np.searchsorted(sorted_codes, np.arange(quotas.shape[0]))
+    ranks = np.empty(n_rows, dtype=np.int64)
+    ranks[order] = np.arange(n_rows) - class_starts[sorted_codes]
+    bounds = np.cumsum(quotas, axis=1)[codes]
+    labels = (ranks[:, None] >= bounds).sum(axis=1)
+    return labels.astype(np.min_scalar_type(quotas.shape[1]))
+
+
+def align_row_partitions(frame, row_lengths):
+    """
+    Repartition `frame` along the rows to have given row lengths.
+
+    Parameters
+    ----------
+    frame : PandasDataframe
+        Frame to repartition.
+    row_lengths : list of ints
+        Target lengths of the row partitions.
+
+    Returns
+    -------
+    PandasDataframe
+    """
+    if list(frame.row_lengths) == list(row_lengths):
+        return frame
+    partitions = frame._partition_mgr_cls.map_axis_partitions(
+        0,
+        frame._partitions,
+        lambda df: df,
+        keep_partitioning=False,
+        lengths=row_lengths,
+    )
+    return frame.__constructor__(
+        partitions,
+        frame.index,
+        frame.columns,
+        row_lengths,
+        None,
+        dtypes=frame._dtypes,
+    )
+
+
+def draw_group_labels(frame, allocate_groups, seed, stratify=None):
+    """
+    Randomly assign the rows of `frame` to groups, partition by partition.
+
+    Parameters
+    ----------
+    frame : PandasDataframe
+        Frame to draw the groups of. Its row partitioning defines the partitioning
+        of the labels.
+    allocate_groups : callable(np.ndarray, numpy.random.Generator) -> np.ndarray
+        Function taking the number of rows of every class and returning a 2D array
+        of shape (n_classes, n_groups) with the number of rows of every class
+        in each group.
+    seed : int
+        Seed of the split.
+    stratify : PandasDataframe, optional
+        Single-column frame holding the class of every row. If not specified,
+        all the rows belong to the same class.
+
+    Returns
+    -------
+    tuple
+        A pair of a column of partitions holding the group labels and a 2D array
+        of shape (n_row_partitions, n_groups) with the size of every group
+        in each row partition.
+    """
+    partition_mgr_cls = frame._partition_mgr_cls
+    row_lengths = frame.row_lengths
+    rng = np.random.default_rng(seed)
+
+    if stratify is None:
+        source = frame._partitions[:, :1]
+        classes = None
+        capacity = np.array(row_lengths, dtype=np.int64)[:, None]
+    else:
+        stratify = align_row_partitions(stratify, row_lengths)
+        source = stratify._partitions
+        counts = partition_mgr_cls.get_objects_from_partitions(
+            [
+                part.apply(
+                    lambda df: df.iloc[:, 0].value_counts(sort=False, dropna=False)
+                )
+                for part in source[:, 0]
+            ]
+        )
+        counts = pandas.concat(counts, axis=1).fillna(0)
+        classes = counts.index
+        capacity = counts.to_numpy(dtype=np.int64).T
+
+    group_sizes = allocate_groups(capacity.sum(axis=0), rng)
+    n_classes, n_groups = group_sizes.shape
+    quotas = np.zeros((len(row_lengths), n_classes, n_groups), dtype=np.int64)
+    remaining = capacity.copy()
+    for group in range(n_groups):
+        for cls in range(n_classes):
+            quotas[:, cls, group] = allocate(
+                group_sizes[cls, group], remaining[:, cls], rng
+            )
+        remaining -= quotas[:, :, group]
+
+    def labels_func(df, partition_idx):
+        if classes is None:
+            codes = np.zeros(len(df), dtype=np.intp)
+        else:
+            codes = classes.get_indexer(df.iloc[:, 0])
+        return pandas.DataFrame(
+            draw_labels(codes, quotas[partition_idx], [seed, partition_idx])
+        )
+
+    labels = partition_mgr_cls.map_axis_partitions(
+        1, source, labels_func, keep_partitioning=True, enumerate_partitions=True
+    )
+    return labels, quotas.sum(axis=1)
+
+
+def take_groups(frame, labels, groups, row_lengths):
+    """
+    Take the rows of `frame` assigned to any of `groups`.
+
+    Parameters
+    ----------
+    frame : PandasDataframe
+        Frame to take the rows from.
+    labels : np.ndarray
+        Column of partitions holding the group labels of the rows.
+    groups : list of ints
+        Groups to take.
+    row_lengths : list of ints
+        Number of the rows to take from every row partition.
+
+    Returns
+    -------
+    PandasDataframe
+    """
+
+    def take(df, labels):
+        return df.iloc[np.isin(labels.iloc[:, 0].to_numpy(), groups)]
+
+    partitions = frame._partition_mgr_cls.broadcast_apply(
+        0, take, frame._partitions, labels, other_name="labels"
+    )
+    return frame.__constructor__(
+        partitions,
+        None,
+        frame.columns,
+        list(row_lengths),
+        frame.column_widths,
+        dtypes=frame._dtypes,
+    )
@@ -0,0 +1,120 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+import numpy as np
+import pandas
+import pytest
+
+import modin.pandas as pd
+from modin.config import NPartitions
+from modin.experimental.sklearn.model_selection import k_fold_split, train_test_split
+from modin.pandas.test.utils import df_equals
+
+NPartitions.put(4)
+
+
+@pytest.fixture
+def data():
+    n_rows = 1000
+    pandas_df = pandas.DataFrame(
+        {
+            "a": np.arange(n_rows),
+            "b": np.arange(n_rows) * 0.5,
+            "label": np.random.default_rng(0).choice(["x", "y", "z"], n_rows),
+        },
+        index=[f"row_{i}" for i in range(n_rows)],
+    )
+    return pd.DataFrame(pandas_df), pandas_df
+
+
+def test_train_test_split_default(data):
+    modin_df, pandas_df = data
+    train, test = train_test_split(modin_df)
+    df_equals(train, pandas_df.iloc[:750])
+    df_equals(test, pandas_df.iloc[750:])
+
+
+@pytest.mark.parametrize(
+    "test_size, train_size", [(0.3, None), (None, 0.6), (100, 500)]
+)
+def test_train_test_split_shuffle(data, test_size, train_size):
+    modin_df, pandas_df = data
+    X_train, X_test, y_train, y_test = train_test_split(
+        modin_df[["a", "b"]],
+        modin_df["label"],
+        test_size=test_size,
+        train_size=train_size,
+        shuffle=True,
+        random_state=42,
+    )
+    n_test = {0.3: 300, 100: 100, None: 400}[test_size]
+    n_train = {None: 700, 0.6: 600, 500: 500}[train_size]
+    assert X_test.shape == (n_test, 2) and len(y_test) == n_test
+    assert X_train.shape == (n_train, 2) and len(y_train) == n_train
+    assert not set(X_train.index) & set(X_test.index)
+    df_equals(X_test, pandas_df.loc[X_test.index, ["a", "b"]])
+    df_equals(y_train, pandas_df.loc[y_train.index, "label"])
+    df_equals(y_test.index, X_test.index)
+
+    X_train_again, X_test_again = train_test_split(
+        modin_df[["a", "b"]],
+        test_size=test_size,
+        train_size=train_size,
+        shuffle=True,
+        random_state=42,
+    )
+    df_equals(X_train_again, X_train)
+    df_equals(X_test_again, X_test)
+
+
+def test_train_test_split_stratify(data):
+    modin_df, pandas_df = data
+    train, test = train_test_split(
+        modin_df,
+        test_size=0.2,
+        shuffle=True,
+        random_state=0,
+        stratify=modin_df["label"],
+    )
+    assert len(test) == 200 and len(train) == 800
+    class_shares = pandas_df["label"].value_counts(normalize=True)
+    for split in (train, test):
+        split_shares = split["label"]._to_pandas().value_counts(normalize=True)
+        assert (split_shares - class_shares).abs().max() < 0.01
+
+    with pytest.raises(ValueError, match="shuffle=False"):
+        train_test_split(modin_df, stratify=modin_df["label"])
+
+
+@pytest.mark.parametrize(
+    "shuffle, stratify", [(False, False), (True, False), (True, True)]
+)
+def test_k_fold_split(data, shuffle, stratify):
+    modin_df, pandas_df = data
+    folds = list(
+        k_fold_split(
+            modin_df,
+            n_splits=3,
+            shuffle=shuffle,
+            random_state=0,
+            stratify=modin_df["label"] if stratify else None,
+        )
+    )
+    assert len(folds) == 3
+    test_positions = np.sort(np.concatenate([test for _, test in folds]))
+    np.testing.assert_array_equal(test_positions, np.arange(len(pandas_df)))
+    for train, test in folds:
+        assert len(test) in (333, 334)
+        assert len(np.intersect1d(train, test)) == 0
+        assert len(train) + len(test) == len(pandas_df)
+    df_equals(modin_df.iloc[folds[0][1]], pandas_df.iloc[folds[0][1]])
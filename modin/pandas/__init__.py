@@ -159,6 +159,11 @@ def _update_engine(publisher: Parameter):
             from modin.core.execution.dask.common import initialize_dask
 
             initialize_dask()
+    elif publisher.get() == "Threads":
+        if _is_first_update.get("Threads", True):
+            from modin.core.execution.threads.common import initialize_threads
+
+            initialize_threads()
     elif publisher.get() == "Cloudray":
         from modin.experimental.cloud import get_connection
 
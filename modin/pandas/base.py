@@ -1335,13 +1335,27 @@ class BasePandasDataset(BasePandasDatasetCompat):
 
     @_inherit_docstrings(pandas.DataFrame.ewm, apilink="pandas.DataFrame.ewm")
     def _ewm(self, **kwargs):
-        return self._default_to_pandas("ewm", **kwargs)
+        if kwargs.get("times") is not None:
+            return self._default_to_pandas("ewm", **kwargs)
+        from .window import ExponentialMovingWindow
+
+        # Validate the arguments as pandas does on the window creation.
+        pandas.DataFrame().ewm(**kwargs)
+        return ExponentialMovingWindow(
+            self, kwargs, axis=self._get_axis_number(kwargs.get("axis", 0))
+        )
 
     @_inherit_docstrings(
         pandas.DataFrame.expanding, apilink="pandas.DataFrame.expanding"
     )
     def _expanding(self, **kwargs):
-        return self._default_to_pandas("expanding", **kwargs)
+        from .window import Expanding
+
+        # Validate the arguments as pandas does on the window creation.
+        pandas.DataFrame().expanding(**kwargs)
+        return Expanding(
+            self, kwargs, axis=self._get_axis_number(kwargs.get("axis", 0))
+        )
 
     def ffill(
         self, axis=None, inplace=False, limit=None, downcast=None
@@ -2491,6 +2505,19 @@ class BasePandasDataset(BasePandasDatasetCompat):
             # Check obvious case first
             return self.copy()
 
+        axis = self._get_axis_number(axis)
+        if freq is None and axis == 0 and 0 < periods < len(self.index):
+            return self.__constructor__(
+                query_compiler=self._query_compiler.shift(
+                    periods=periods, axis=axis, fill_value=fill_value
+                )
+            )
+        if fill_value is no_default:
+            fill_value = {
+                name: pandas.NaT if is_datetime_or_timedelta_dtype(dtype) else pandas.NA
+                for name, dtype in dict(self.dtypes).items()
+            }
+
         empty_frame = False
         if axis == "index" or axis == 0:
             if abs(periods) >= len(self.index):
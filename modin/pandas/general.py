@@ -17,13 +17,17 @@ import pandas
 import numpy as np
 
 from typing import Hashable, Iterable, Mapping, Union
-from pandas.core.dtypes.common import is_list_like
+from pandas.core.dtypes.common import (
+    is_categorical_dtype,
+    is_list_like,
+    is_nested_list_like,
+)
 
 from modin.error_message import ErrorMessage
 from .base import BasePandasDataset
 from .dataframe import DataFrame
 from .series import Series
-from modin.utils import to_pandas
+from modin.utils import to_pandas, try_cast_to_pandas
 from modin.core.storage_formats.base.query_compiler import BaseQueryCompiler
 from modin.utils import _inherit_docstrings
 from modin.logging import enable_logging
@@ -127,13 +131,11 @@ def merge_ordered(
         raise ValueError(
             "can not merge DataFrame with instance of type {}".format(type(right))
         )
-    ErrorMessage.default_to_pandas("`merge_ordered`")
-    if isinstance(right, DataFrame):
-        right = to_pandas(right)
+    if not isinstance(right, DataFrame):
+        right = DataFrame(right)
     return DataFrame(
-        pandas.merge_ordered(
-            to_pandas(left),
-            right,
+        query_compiler=left._query_compiler.merge_ordered(
+            right._query_compiler,
             on=on,
             left_on=left_on,
             right_on=right_on,
@@ -171,7 +173,6 @@ def merge_asof(
         raise ValueError(
             "can not merge DataFrame with instance of type {}".format(type(right))
         )
-    ErrorMessage.default_to_pandas("`merge_asof`")
 
     # As of Pandas 1.2 these should raise an error; before that it did
     # something likely random:
@@ -182,6 +183,34 @@ def merge_asof(
     ):
         raise ValueError("Can't combine left/right_index with left/right_on or on.")
 
+    if on is not None and (left_on is not None or right_on is not None):
+        raise ValueError("If 'on' is set, 'left_on' and 'right_on' can't be set.")
+    if by is not None and (left_by is not None or right_by is not None):
+        raise ValueError("Can't have both 'by' and 'left_by' or 'right_by'")
+
+    if not left_index and not right_index:
+        if on is None and (left_on is None or right_on is None):
+            raise ValueError("Need some sort of 'on' spec")
+        if not isinstance(right, DataFrame):
+            right = DataFrame(right)
+        return DataFrame(
+            query_compiler=left._query_compiler.merge_asof(
+                right._query_compiler,
+                on=on,
+                left_on=left_on,
+                right_on=right_on,
+                by=by,
+                left_by=left_by,
+                right_by=right_by,
+                suffixes=suffixes,
+                tolerance=tolerance,
+                allow_exact_matches=allow_exact_matches,
+                direction=direction,
+            )
+        )
+
+    ErrorMessage.default_to_pandas("`merge_asof`")
+
     # Pandas fallbacks for tricky cases:
     if (
         # No idea how this works or why it does what it does; and in fact
@@ -225,8 +254,6 @@ def merge_asof(
     right_column = None
 
     if on is not None:
-        if left_on is not None or right_on is not None:
-            raise ValueError("If 'on' is set, 'left_on' and 'right_on' can't be set.")
         left_on = on
         right_on = on
 
@@ -249,8 +276,6 @@ def merge_asof(
     assert right_column is not None
 
     if by is not None:
-        if left_by is not None or right_by is not None:
-            raise ValueError("Can't have both 'by' and 'left_by' or 'right_by'")
         left_by = right_by = by
 
     # List of columns case should have been handled by direct Pandas fallback
@@ -583,16 +608,22 @@ def get_dummies(
     """
     Convert categorical variable into dummy/indicator variables.
     """
-    if sparse:
-        raise NotImplementedError(
-            "SparseDataFrame is not implemented. "
-            + "To contribute to Modin, please visit "
-            + "github.com/modin-project/modin."
+    if isinstance(data, Series):
+        # pandas encodes a Series regardless of its dtype and labels the dummies
+        # with the passed prefix only, which is what encoding the only column of
+        # the frame with that prefix does.
+        new_manager = data._query_compiler.get_dummies(
+            data._query_compiler.columns,
+            prefix=[prefix],
+            prefix_sep=prefix_sep,
+            dummy_na=dummy_na,
+            sparse=sparse,
+            drop_first=drop_first,
+            dtype=dtype,
         )
+        return DataFrame(query_compiler=new_manager)
     if not isinstance(data, DataFrame):
         ErrorMessage.default_to_pandas("`get_dummies` on non-DataFrame")
-        if isinstance(data, Series):
-            data = data._to_pandas()
         return DataFrame(
             pandas.get_dummies(
                 data,
@@ -611,6 +642,7 @@ def get_dummies(
             prefix=prefix,
             prefix_sep=prefix_sep,
             dummy_na=dummy_na,
+            sparse=sparse,
             drop_first=drop_first,
             dtype=dtype,
         )
@@ -658,11 +690,69 @@ def crosstab(
     """
     Compute a simple cross tabulation of two (or more) factors.
     """
+    if values is None and aggfunc is not None:
+        raise ValueError("aggfunc cannot be used without values.")
+    if values is not None and aggfunc is None:
+        raise ValueError("values cannot be used without an aggfunc.")
+
+    index_arrays = index if is_nested_list_like(index) else [index]
+    columns_arrays = columns if is_nested_list_like(columns) else [columns]
+    arrays = [*index_arrays, *columns_arrays]
+    row_names = _get_crosstab_names(index_arrays, rownames, "row")
+    col_names = _get_crosstab_names(columns_arrays, colnames, "col")
+    names = row_names + col_names
+    if (
+        not (margins and (normalize is not False or not dropna))
+        and len(set(names)) == len(names)
+        and "__dummy__" not in names
+        and not any(
+            isinstance(arr, (pandas.Series, pandas.DataFrame, DataFrame))
+            or is_categorical_dtype(getattr(arr, "dtype", None))
+            for arr in arrays + [values]
+        )
+    ):
+        # The counts are the sizes of the groups of the keys, the keys of the
+        # columns are unstacked by the distributed ``pivot_table``
+        common_idx = None
+        modin_series = [arr for arr in arrays if isinstance(arr, Series)]
+        if len(modin_series) > 0:
+            common_idx = modin_series[0].index
+            for obj in modin_series[1:]:
+                if not obj.index.equals(common_idx):
+                    common_idx = common_idx.intersection(obj.index)
+
+        def to_series(arr, name):
+            if not isinstance(arr, Series):
+                arr = Series(arr, index=common_idx)
+            elif not arr.index.equals(common_idx):
+                arr = arr.reindex(common_idx)
+            return arr.rename(name)
+
+        df = concat(
+            [to_series(arr, name) for arr, name in zip(arrays, names)], axis=1
+        )
+        if isinstance(values, Series) and not values.index.equals(df.index):
+            values = values.reindex(df.index)
+        df["__dummy__"] = 0 if values is None else values
+        table = df.pivot_table(
+            "__dummy__",
+            index=row_names,
+            columns=col_names,
+            margins=margins,
+            margins_name=margins_name,
+            dropna=dropna,
+            aggfunc="count" if values is None else aggfunc,
+            fill_value=0 if values is None else None,
+        )
+        if normalize is not False:
+            table = _normalize_crosstab(table, normalize)
+        return table
+
     ErrorMessage.default_to_pandas("`crosstab`")
     pandas_crosstab = pandas.crosstab(
-        index,
-        columns,
-        values,
+        try_cast_to_pandas(index),
+        try_cast_to_pandas(columns),
+        try_cast_to_pandas(values),
         rownames,
         colnames,
         aggfunc,
@@ -674,6 +764,66 @@ def crosstab(
     return DataFrame(pandas_crosstab)
 
 
+def _get_crosstab_names(arrays, names, prefix):
+    """
+    Get the labels of the factors of ``crosstab``.
+
+    Parameters
+    ----------
+    arrays : list
+        Factors of the rows or of the columns.
+    names : sequence of labels, optional
+        Labels passed by the user.
+    prefix : {"row", "col"}
+        Prefix of the default labels.
+
+    Returns
+    -------
+    list
+    """
+    if names is None:
+        return [
+            arr.name
+            if isinstance(arr, (Series, pandas.Series)) and arr.name is not None
+            else f"{prefix}_{i}"
+            for i, arr in enumerate(arrays)
+        ]
+    if len(names) != len(arrays):
+        raise AssertionError("arrays and names must have the same length")
+    return list(names)
+
+
+def _normalize_crosstab(table, normalize):
+    """
+    Normalize the counts of ``crosstab`` without the margins.
+
+    Parameters
+    ----------
+    table : DataFrame
+        Cross tabulation to normalize.
+    normalize : bool, {"all", "index", "columns"} or {0, 1}
+        Which sums to divide the counts by.
+
+    Returns
+    -------
+    DataFrame
+    """
+    if not isinstance(normalize, (bool, str)):
+        try:
+            normalize = {0: "index", 1: "columns"}[normalize]
+        except KeyError as err:
+            raise ValueError("Not a valid normalize argument") from err
+    if normalize is True or normalize == "all":
+        table = table / table.sum(axis=1).sum(axis=0)
+    elif normalize == "columns":
+        table = table / table.sum()
+    elif normalize == "index":
+        table = table.div(table.sum(axis=1), axis=0)
+    else:
+        raise ValueError("Not a valid normalize argument")
+    return table.fillna(0)
+
+
 # Adding docstring since pandas docs don't have web section for this function.
 @enable_logging
 def lreshape(data: DataFrame, groups, dropna=True, label=None):
@@ -702,9 +852,10 @@ def lreshape(data: DataFrame, groups, dropna=True, label=None):
     """
     if not isinstance(data, DataFrame):
         raise ValueError("can not lreshape with instance of type {}".format(type(data)))
-    ErrorMessage.default_to_pandas("`lreshape`")
     return DataFrame(
-        pandas.lreshape(to_pandas(data), groups, dropna=dropna, label=label)
+        query_compiler=data._query_compiler.lreshape(
+            groups, dropna=dropna, label=label
+        )
     )
 
 
@@ -720,9 +871,10 @@ def wide_to_long(
         raise ValueError(
             "can not wide_to_long with instance of type {}".format(type(df))
         )
-    ErrorMessage.default_to_pandas("`wide_to_long`")
     return DataFrame(
-        pandas.wide_to_long(to_pandas(df), stubnames, i, j, sep=sep, suffix=suffix)
+        query_compiler=df._query_compiler.wide_to_long(
+            stubnames, i, j, sep=sep, suffix=suffix
+        )
     )
 
 
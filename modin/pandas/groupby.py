@@ -805,7 +805,16 @@ class DataFrameGroupBy(DataFrameGroupByCompat):
         return com.pipe(self, func, *args, **kwargs)
 
     def cumcount(self, ascending=True):
-        result = self._default_to_pandas(lambda df: df.cumcount(ascending=ascending))
+        result = Series(
+            query_compiler=self._query_compiler.groupby_cumcount(
+                by=self._by,
+                axis=self._axis,
+                groupby_kwargs=self._kwargs,
+                agg_args=[],
+                agg_kwargs=dict(ascending=ascending),
+                drop=self._drop,
+            )
+        )
         # pandas does not name the index on cumcount
         result._query_compiler.set_index_name(None)
         return result
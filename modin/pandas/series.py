@@ -949,7 +949,9 @@ class Series(SeriesCompat, BasePandasDataset):
         """
         Indicate duplicate Series values.
         """
-        return self.to_frame().duplicated(keep=keep)
+        result = self.to_frame().duplicated(keep=keep)
+        result.name = self.name
+        return result
 
     def eq(self, other, level=None, fill_value=None, axis=0):  # noqa: PR01, RT01, D200
         """
@@ -1302,7 +1304,7 @@ class Series(SeriesCompat, BasePandasDataset):
         """
         Return the largest `n` elements.
         """
-        return self._default_to_pandas(pandas.Series.nlargest, n=n, keep=keep)
+        return Series(query_compiler=self._query_compiler.nlargest(n=n, keep=keep))
 
     def nsmallest(self, n=5, keep="first"):  # noqa: PR01, RT01, D200
         """
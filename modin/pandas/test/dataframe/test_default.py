@@ -64,9 +64,7 @@ pytestmark = pytest.mark.filterwarnings(default_to_pandas_ignore_string)
     "op, make_args",
     [
         ("align", lambda df: {"other": df}),
-        ("expanding", None),
         ("corrwith", lambda df: {"other": df}),
-        ("ewm", lambda df: {"com": 0.5}),
         ("from_dict", lambda df: {"data": None}),
         ("from_records", lambda df: {"data": to_pandas(df)}),
         ("hist", lambda df: {"column": "int_col"}),
@@ -604,6 +602,34 @@ def test_pivot_table_dropna(data):
     )
 
 
+@pytest.mark.parametrize("aggfunc", ["mean", "sum", "count", "max", np.sum])
+@pytest.mark.parametrize("fill_value", [None, 0, 0.5])
+@pytest.mark.parametrize("margins", [False, True])
+@pytest.mark.parametrize("columns", [None, "c", ["b", "c"]])
+def test_pivot_table_reduce(aggfunc, fill_value, margins, columns):
+    random_state = np.random.RandomState(seed=42)
+    data = {
+        "a": random_state.randint(0, 20, 256),
+        "b": random_state.choice(["x", "y", "z"], 256),
+        "c": random_state.randint(0, 4, 256),
+        "v": random_state.randint(0, 10, 256),
+        "w": random_state.rand(256).round(2),
+    }
+    if not margins:
+        data["w"][random_state.rand(256) < 0.2] = np.nan
+    eval_general(
+        *create_test_dfs(data),
+        lambda df: df.pivot_table(
+            index="a",
+            columns=columns,
+            values=["v", "w"],
+            aggfunc=aggfunc,
+            fill_value=fill_value,
+            margins=margins,
+        ),
+    )
+
+
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 def test_plot(request, data):
     modin_df = pd.DataFrame(data)
@@ -38,7 +38,7 @@ from modin.pandas.test.utils import (
     extra_test_parameters,
     default_to_pandas_ignore_string,
 )
-from modin.config import NPartitions
+from modin.config import NPartitions, BroadcastJoinThreshold
 from modin.test.test_utils import warns_that_defaulting_to_pandas
 
 NPartitions.put(4)
@@ -322,6 +322,37 @@ def test_merge(test_data, test_data2):
         modin_df.merge("Non-valid type")
 
 
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("on", ["key1", ["key1", "key2"]])
+@pytest.mark.parametrize("sort", [False, True])
+def test_merge_hash_join(how, on, sort):
+    left = {
+        "key1": [1.0, np.nan, 3.0] * 30 + list(range(10)),
+        "key2": ["a", None, "b", "a", "c"] * 20,
+        "value": np.arange(100),
+    }
+    right = {
+        "key1": [np.nan, 3.0, 5.0, 7.0] * 10 + list(range(20, 25)),
+        "key2": ["b", "a", "c", "d", None] * 9,
+        "value": np.arange(45),
+    }
+    old_threshold = BroadcastJoinThreshold.get()
+    # Make the right frame big enough to not be broadcast.
+    BroadcastJoinThreshold.put(0)
+    try:
+        eval_general(
+            *create_test_dfs(left),
+            lambda df: df.merge(
+                (pd if isinstance(df, pd.DataFrame) else pandas).DataFrame(right),
+                how=how,
+                on=on,
+                sort=sort,
+            ),
+        )
+    finally:
+        BroadcastJoinThreshold.put(old_threshold)
+
+
 @pytest.mark.parametrize("axis", [0, 1])
 @pytest.mark.parametrize(
     "ascending", bool_arg_values, ids=arg_keys("ascending", bool_arg_keys)
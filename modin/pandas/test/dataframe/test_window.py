@@ -40,7 +40,7 @@ from modin.pandas.test.utils import (
     create_test_dfs,
     test_data_diff_dtype,
 )
-from modin.config import NPartitions
+from modin.config import NPartitions, ApproximateReductions
 from modin.test.test_utils import warns_that_defaulting_to_pandas
 
 NPartitions.put(4)
@@ -77,6 +77,20 @@ def test_cummin_cummax_int_and_float(axis, method):
     eval_general(*create_test_dfs(data), lambda df: getattr(df, method)(axis=axis))
 
 
+@pytest.mark.parametrize("skipna", [True, False])
+@pytest.mark.parametrize("method", ["cumprod", "cummin", "cummax", "cumsum"])
+def test_cumulative_across_partitions(skipna, method):
+    # The missing values span whole row partitions to check how the partition
+    # carries are combined.
+    data = {
+        "int": np.arange(1000) % 7 + 1,
+        "nan_head": [np.nan] * 600 + [1.001] * 400,
+        "nan_tail": [0.999] * 400 + [np.nan] * 600,
+        "nan_middle": [1.0] * 300 + [np.nan] * 400 + [2.0] * 300,
+    }
+    eval_general(*create_test_dfs(data), lambda df: getattr(df, method)(skipna=skipna))
+
+
 @pytest.mark.parametrize("axis", [0, 1])
 @pytest.mark.parametrize(
     "periods", int_arg_values, ids=arg_keys("periods", int_arg_keys)
@@ -120,6 +134,22 @@ def test_duplicated(data, keep):
     df_equals(modin_result, pandas_result)
 
 
+@pytest.mark.parametrize("keep", ["last", "first", False])
+def test_duplicated_across_partitions(keep):
+    # The copies of every row are spread over all of the row partitions.
+    data = {
+        "int": np.arange(1000) % 7,
+        "str": np.array(["a", "b", None])[np.arange(1000) % 3],
+        "float": np.array([0.5, np.nan])[np.arange(1000) % 2],
+    }
+    modin_df, pandas_df = create_test_dfs(data, index=np.arange(1000)[::-1])
+    df_equals(modin_df.duplicated(keep=keep), pandas_df.duplicated(keep=keep))
+    df_equals(
+        modin_df.drop_duplicates(subset=["str", "float"], keep=keep),
+        pandas_df.drop_duplicates(subset=["str", "float"], keep=keep),
+    )
+
+
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 def test_ffill(data):
     modin_df = pd.DataFrame(data)
@@ -643,6 +673,57 @@ def test_quantile(request, data, q):
             modin_df.T.quantile(q)
 
 
+def _sketched_data():
+    # Long enough for the partitions to be summarized by a part of their values.
+    state = np.random.RandomState(seed=42)
+    size = 2 ** 14
+    return {
+        "float": state.normal(size=size),
+        "int": state.randint(-100, 100, size),
+        "nan": np.where(state.rand(size) < 0.3, np.nan, state.rand(size)),
+        "few": state.randint(0, 3, size).astype(np.float32),
+        "all_nan": np.full(size, np.nan),
+    }
+
+
+@pytest.mark.parametrize(
+    "interpolation", ["linear", "lower", "higher", "midpoint", "nearest"]
+)
+def test_quantile_sketches(interpolation):
+    modin_df, pandas_df = create_test_dfs(_sketched_data())
+    for q in [0.37, [0, 0.01, 0.5, 0.75, 1]]:
+        df_equals(
+            modin_df.quantile(q, interpolation=interpolation),
+            pandas_df.quantile(q, interpolation=interpolation),
+        )
+    for skipna in [True, False]:
+        df_equals(modin_df.median(skipna=skipna), pandas_df.median(skipna=skipna))
+    df_equals(
+        modin_df.describe(percentiles=[0.01, 0.99]),
+        pandas_df.describe(percentiles=[0.01, 0.99]),
+    )
+
+
+def test_approximate_reductions():
+    data = _sketched_data()
+    del data["all_nan"]
+    data["str"] = np.array(["a", "b", None, "c"])[data["int"] % 4]
+    modin_df, pandas_df = create_test_dfs(data)
+    ApproximateReductions.put(True)
+    try:
+        modin_result = modin_df.quantile([0.1, 0.5, 0.9])._to_pandas()
+        modin_median = modin_df.median()._to_pandas()
+        modin_nunique = modin_df.nunique(dropna=False)._to_pandas()
+    finally:
+        ApproximateReductions.put(False)
+    pandas_result = pandas_df.quantile([0.1, 0.5, 0.9])
+    spread = pandas_df.max(numeric_only=True) - pandas_df.min(numeric_only=True)
+    assert ((modin_result - pandas_result).abs() <= 0.01 * spread).all(axis=None)
+    assert ((modin_median - pandas_df.median()).abs() <= 0.01 * spread).all()
+    pandas_nunique = pandas_df.nunique(dropna=False)
+    assert ((modin_nunique - pandas_nunique).abs() <= 0.02 * pandas_nunique).all()
+
+
 @pytest.mark.parametrize("axis", ["rows", "columns"])
 @pytest.mark.parametrize(
     "na_option", ["keep", "top", "bottom"], ids=["keep", "top", "bottom"]
@@ -33,6 +33,12 @@ elif engine == "Dask":
         + "pandas_on_dask.partitioning.partition_manager."
         + "PandasOnDaskDataframePartitionManager.wait_partitions"
     )
+elif engine == "Threads":
+    wait_method = (
+        "modin.core.execution.threads.implementations."
+        + "pandas_on_threads.partitioning.partition_manager."
+        + "PandasOnThreadsDataframePartitionManager.wait_partitions"
+    )
 else:
     wait_method = (
         "modin.core.dataframe.pandas.partitioning."
@@ -11,7 +11,6 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
-import contextlib
 import pandas
 import pytest
 import modin.pandas as pd
@@ -30,12 +29,6 @@ from .utils import (
 )
 
 
-@contextlib.contextmanager
-def _nullcontext():
-    """Replacement for contextlib.nullcontext missing in older Python."""
-    yield
-
-
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 def test_isna(data):
     pandas_df = pandas.DataFrame(data)
@@ -117,8 +110,7 @@ def test_merge():
 
     join_types = ["outer", "inner"]
     for how in join_types:
-        with warns_that_defaulting_to_pandas() if how == "outer" else _nullcontext():
-            modin_result = pd.merge(modin_df, modin_df2, how=how)
+        modin_result = pd.merge(modin_df, modin_df2, how=how)
         pandas_result = pandas.merge(pandas_df, pandas_df2, how=how)
         df_equals(modin_result, pandas_result)
 
@@ -143,28 +135,18 @@ def test_merge():
         df_equals(modin_result, pandas_result)
 
         # left_on and right_on col1
-        if how == "outer":
-            warning_catcher = warns_that_defaulting_to_pandas()
-        else:
-            warning_catcher = _nullcontext()
-        with warning_catcher:
-            modin_result = pd.merge(
-                modin_df, modin_df2, how=how, left_on="col1", right_on="col1"
-            )
+        modin_result = pd.merge(
+            modin_df, modin_df2, how=how, left_on="col1", right_on="col1"
+        )
         pandas_result = pandas.merge(
             pandas_df, pandas_df2, how=how, left_on="col1", right_on="col1"
         )
         df_equals(modin_result, pandas_result)
 
         # left_on and right_on col2
-        if how == "outer":
-            warning_catcher = warns_that_defaulting_to_pandas()
-        else:
-            warning_catcher = _nullcontext()
-        with warning_catcher:
-            modin_result = pd.merge(
-                modin_df, modin_df2, how=how, left_on="col2", right_on="col2"
-            )
+        modin_result = pd.merge(
+            modin_df, modin_df2, how=how, left_on="col2", right_on="col2"
+        )
         pandas_result = pandas.merge(
             pandas_df, pandas_df2, how=how, left_on="col2", right_on="col2"
         )
@@ -208,6 +190,37 @@ def test_merge_ordered():
         pd.merge_ordered(data_a, data_b, fill_method="ffill", left_by="group")
 
 
+@pytest.mark.parametrize("how", ["outer", "left", "right", "inner"])
+@pytest.mark.parametrize("fill_method", [None, "ffill"])
+@pytest.mark.parametrize("on", ["key", ["key", "key2"]])
+def test_merge_ordered_distributed(how, fill_method, on):
+    random_state = np.random.RandomState(42)
+    pandas_left = pandas.DataFrame(
+        {
+            "key": random_state.randint(0, 60, 300).astype(float),
+            "key2": random_state.randint(0, 3, 300),
+            "lvalue": random_state.randint(0, 9, 300),
+        }
+    )
+    pandas_left.loc[::17, "key"] = np.nan
+    pandas_right = pandas.DataFrame(
+        {
+            "key": random_state.randint(30, 90, 200).astype(float),
+            "key2": random_state.randint(0, 3, 200),
+            "rvalue": random_state.randint(0, 9, 200),
+        }
+    )
+    modin_left, modin_right = pd.DataFrame(pandas_left), pd.DataFrame(pandas_right)
+    df_equals(
+        pd.merge_ordered(
+            modin_left, modin_right, on=on, how=how, fill_method=fill_method
+        ),
+        pandas.merge_ordered(
+            pandas_left, pandas_right, on=on, how=how, fill_method=fill_method
+        ),
+    )
+
+
 @pytest.mark.parametrize("right_index", [None, [0] * 5], ids=["default", "non_unique"])
 def test_merge_asof(right_index):
     left = pd.DataFrame({"a": [1, 5, 10], "left_val": ["a", "b", "c"]})
@@ -215,21 +228,16 @@ def test_merge_asof(right_index):
         {"a": [1, 2, 3, 6, 7], "right_val": [1, 2, 3, 6, 7]}, index=right_index
     )
 
-    with warns_that_defaulting_to_pandas():
-        df = pd.merge_asof(left, right, on="a")
-        assert isinstance(df, pd.DataFrame)
-
-    with warns_that_defaulting_to_pandas():
-        df = pd.merge_asof(left, right, on="a", allow_exact_matches=False)
-        assert isinstance(df, pd.DataFrame)
-
-    with warns_that_defaulting_to_pandas():
-        df = pd.merge_asof(left, right, on="a", direction="forward")
-        assert isinstance(df, pd.DataFrame)
-
-    with warns_that_defaulting_to_pandas():
-        df = pd.merge_asof(left, right, on="a", direction="nearest")
-        assert isinstance(df, pd.DataFrame)
+    for kwargs in [
+        {},
+        {"allow_exact_matches": False},
+        {"direction": "forward"},
+        {"direction": "nearest"},
+    ]:
+        df_equals(
+            pd.merge_asof(left, right, on="a", **kwargs),
+            pandas.merge_asof(to_pandas(left), to_pandas(right), on="a", **kwargs),
+        )
 
     left = pd.DataFrame({"left_val": ["a", "b", "c"]}, index=[1, 5, 10])
     right = pd.DataFrame({"right_val": [1, 2, 3, 6, 7]}, index=[1, 2, 3, 6, 7])
@@ -247,6 +255,39 @@ def test_merge_asof(right_index):
         )
 
 
+@pytest.mark.parametrize("direction", ["backward", "forward", "nearest"])
+@pytest.mark.parametrize("by", [None, "ticker"])
+@pytest.mark.parametrize("tolerance", [None, 3])
+def test_merge_asof_distributed(direction, by, tolerance):
+    random_state = np.random.RandomState(42)
+    pandas_left = pandas.DataFrame(
+        {
+            "time": np.sort(random_state.randint(0, 200, 300)),
+            "ticker": random_state.choice(list("abc"), 300),
+            "lvalue": random_state.rand(300),
+        }
+    )
+    pandas_right = pandas.DataFrame(
+        {
+            "time": np.sort(random_state.randint(0, 200, 250)),
+            "ticker": random_state.choice(list("abcd"), 250),
+            "rvalue": random_state.randint(0, 9, 250),
+        }
+    )
+    modin_left, modin_right = pd.DataFrame(pandas_left), pd.DataFrame(pandas_right)
+    kwargs = {"on": "time", "by": by, "tolerance": tolerance, "direction": direction}
+    df_equals(
+        pd.merge_asof(modin_left, modin_right, **kwargs),
+        pandas.merge_asof(pandas_left, pandas_right, **kwargs),
+    )
+
+    unsorted_left = pandas_left.iloc[::-1]
+    with pytest.raises(ValueError, match="left keys must be sorted"):
+        pandas.merge_asof(unsorted_left, pandas_right, **kwargs)
+    with pytest.raises(ValueError, match="left keys must be sorted"):
+        pd.merge_asof(pd.DataFrame(unsorted_left), modin_right, **kwargs)
+
+
 def test_merge_asof_on_variations():
     """on=,left_on=,right_on=,right_index=,left_index= options match Pandas."""
     left = {"a": [1, 5, 10], "left_val": ["a", "b", "c"]}
@@ -269,7 +310,12 @@ def test_merge_asof_on_variations():
         {"left_index": True, "right_index": True},
     ]:
         pandas_merged = pandas.merge_asof(pandas_left, pandas_right, **on_arguments)
-        with warns_that_defaulting_to_pandas():
+        if on_arguments.get("left_index", False) or on_arguments.get(
+            "right_index", False
+        ):
+            with warns_that_defaulting_to_pandas():
+                modin_merged = pd.merge_asof(modin_left, modin_right, **on_arguments)
+        else:
             modin_merged = pd.merge_asof(modin_left, modin_right, **on_arguments)
         df_equals(pandas_merged, modin_merged)
 
@@ -416,10 +462,9 @@ def test_merge_asof_merge_options():
     pandas_quotes, pandas_trades = to_pandas(modin_quotes), to_pandas(modin_trades)
 
     # left_by + right_by
-    with warns_that_defaulting_to_pandas():
-        modin_result = pd.merge_asof(
-            modin_quotes, modin_trades, on="time", left_by="ticker", right_by="ticker2",
-        )
+    modin_result = pd.merge_asof(
+        modin_quotes, modin_trades, on="time", left_by="ticker", right_by="ticker2",
+    )
     df_equals(
         pandas.merge_asof(
             pandas_quotes,
@@ -434,24 +479,22 @@ def test_merge_asof_merge_options():
     # Just by:
     pandas_trades["ticker"] = pandas_trades["ticker2"]
     modin_trades["ticker"] = modin_trades["ticker2"]
-    with warns_that_defaulting_to_pandas():
-        modin_result = pd.merge_asof(
-            modin_quotes, modin_trades, on="time", by="ticker",
-        )
+    modin_result = pd.merge_asof(
+        modin_quotes, modin_trades, on="time", by="ticker",
+    )
     df_equals(
         pandas.merge_asof(pandas_quotes, pandas_trades, on="time", by="ticker",),
         modin_result,
     )
 
     # Tolerance
-    with warns_that_defaulting_to_pandas():
-        modin_result = pd.merge_asof(
-            modin_quotes,
-            modin_trades,
-            on="time",
-            by="ticker",
-            tolerance=pd.Timedelta("2ms"),
-        )
+    modin_result = pd.merge_asof(
+        modin_quotes,
+        modin_trades,
+        on="time",
+        by="ticker",
+        tolerance=pd.Timedelta("2ms"),
+    )
     df_equals(
         pandas.merge_asof(
             pandas_quotes,
@@ -464,10 +507,9 @@ def test_merge_asof_merge_options():
     )
 
     # Direction
-    with warns_that_defaulting_to_pandas():
-        modin_result = pd.merge_asof(
-            modin_quotes, modin_trades, on="time", by="ticker", direction="forward",
-        )
+    modin_result = pd.merge_asof(
+        modin_quotes, modin_trades, on="time", by="ticker", direction="forward",
+    )
     df_equals(
         pandas.merge_asof(
             pandas_quotes, pandas_trades, on="time", by="ticker", direction="forward",
@@ -476,15 +518,14 @@ def test_merge_asof_merge_options():
     )
 
     # Allow exact matches
-    with warns_that_defaulting_to_pandas():
-        modin_result = pd.merge_asof(
-            modin_quotes,
-            modin_trades,
-            on="time",
-            by="ticker",
-            tolerance=pd.Timedelta("10ms"),
-            allow_exact_matches=False,
-        )
+    modin_result = pd.merge_asof(
+        modin_quotes,
+        modin_trades,
+        on="time",
+        by="ticker",
+        tolerance=pd.Timedelta("10ms"),
+        allow_exact_matches=False,
+    )
     df_equals(
         pandas.merge_asof(
             pandas_quotes,
@@ -615,10 +656,9 @@ def test_unique():
 def test_value_counts(normalize, bins, dropna):
     # We sort indices for Modin and pandas result because of issue #1650
     values = np.array([3, 1, 2, 3, 4, np.nan])
-    with warns_that_defaulting_to_pandas():
-        modin_result = sort_index_for_equal_values(
-            pd.value_counts(values, normalize=normalize, ascending=False), False
-        )
+    modin_result = sort_index_for_equal_values(
+        pd.value_counts(values, normalize=normalize, ascending=False), False
+    )
     pandas_result = sort_index_for_equal_values(
         pandas.value_counts(values, normalize=normalize, ascending=False), False
     )
@@ -633,10 +673,9 @@ def test_value_counts(normalize, bins, dropna):
     )
     df_equals(modin_result, pandas_result)
 
-    with warns_that_defaulting_to_pandas():
-        modin_result = sort_index_for_equal_values(
-            pd.value_counts(values, dropna=dropna, ascending=True), True
-        )
+    modin_result = sort_index_for_equal_values(
+        pd.value_counts(values, dropna=dropna, ascending=True), True
+    )
     pandas_result = sort_index_for_equal_values(
         pandas.value_counts(values, dropna=dropna, ascending=True), True
     )
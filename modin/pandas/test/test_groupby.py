@@ -44,7 +44,7 @@ from .utils import (
     value_equals,
     default_to_pandas_ignore_string,
 )
-from modin.config import NPartitions
+from modin.config import NPartitions, GroupByShuffleThreshold
 
 NPartitions.put(4)
 
@@ -1446,6 +1446,27 @@ def test_groupby_with_kwarg_dropna(groupby_kwargs, dropna):
         df_equals(md_grp._default_to_pandas(lambda df: df.sum()), pd_grp.sum())
 
 
+@pytest.mark.parametrize("by", ["key", ["key", "str_key"], ["key", "nan_key"]])
+@pytest.mark.parametrize("dropna", [True, False])
+def test_cumcount_cumsum_across_partitions(by, dropna):
+    data = {
+        "key": np.arange(1000) % 5,
+        "str_key": np.array(["a", "b", "c"])[np.arange(1000) % 3],
+        "nan_key": [np.nan] * 600 + [1.0] * 400,
+        "int_value": np.arange(1000),
+        "float_value": [np.nan] * 400 + [0.5] * 600,
+    }
+    modin_df, pandas_df = create_test_dfs(data)
+    modin_groupby = modin_df.groupby(by=by, dropna=dropna)
+    pandas_groupby = pandas_df.groupby(by=by, dropna=dropna)
+    eval_general(modin_groupby, pandas_groupby, lambda df: df.cumcount())
+    eval_general(modin_groupby, pandas_groupby, lambda df: df.cumcount(ascending=False))
+    if dropna and "nan_key" in by:
+        # pandas returns arbitrary values for the rows with the dropped missing keys
+        return
+    eval_general(modin_groupby, pandas_groupby, lambda df: df.cumsum())
+
+
 @pytest.mark.parametrize("groupby_axis", [0, 1])
 @pytest.mark.parametrize("shift_axis", [0, 1])
 def test_shift_freq(groupby_axis, shift_axis):
@@ -2100,8 +2121,8 @@ def test_groupby_with_virtual_partitions():
     big_pandas_df = pandas.concat([pandas_df for _ in range(5)])
 
     # Check that the constructed Modin DataFrame has virtual partitions when
-    # using Ray or Dask, and doesn't when using another execution engines.
-    if Engine.get() in ["Ray", "Dask"]:
+    # using Ray, Dask or Threads, and doesn't when using another execution engines.
+    if Engine.get() in ["Ray", "Dask", "Threads"]:
         assert issubclass(
             type(big_modin_df._query_compiler._modin_frame._partitions[0][0]),
             PandasDataframeAxisPartition,
@@ -2158,3 +2179,31 @@ def test_groupby_with_frozenlist():
     pandas_df = pandas_df.set_index(["a", "b"])
     modin_df = from_pandas(pandas_df)
     eval_general(modin_df, pandas_df, lambda df: df.groupby(df.index.names).count())
+
+
+@pytest.mark.parametrize("by", ["key", ["key", "key2"], ["key2", "key"]])
+@pytest.mark.parametrize("as_index", [True, False])
+def test_groupby_reduce_shuffle(by, as_index):
+    rng = np.random.RandomState(42)
+    num_rows = 2**10
+    data = {
+        "key": rng.randint(0, num_rows, num_rows),
+        "key2": rng.choice(["a", "b", None], num_rows),
+        "value": rng.rand(num_rows),
+        "value2": rng.randint(0, 10, num_rows),
+    }
+    old_threshold = GroupByShuffleThreshold.get()
+    # Shuffle the partial results no matter how many groups there are.
+    GroupByShuffleThreshold.put(0)
+    try:
+        md_df, pd_df = create_test_dfs(data)
+        md_grp = md_df.groupby(by, as_index=as_index)
+        pd_grp = pd_df.groupby(by, as_index=as_index)
+        eval_general(md_grp, pd_grp, lambda grp: grp.sum())
+        eval_general(md_grp, pd_grp, lambda grp: grp.count())
+        eval_general(md_grp, pd_grp, lambda grp: grp.size())
+        eval_general(
+            md_grp, pd_grp, lambda grp: grp.agg({"value": "max", "value2": "sum"})
+        )
+    finally:
+        GroupByShuffleThreshold.put(old_threshold)
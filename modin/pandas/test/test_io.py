@@ -1113,6 +1113,30 @@ class TestCsv:
             mode=mode,
         )
 
+    @pytest.mark.skipif(
+        StorageFormat.get() == "Hdk",
+        reason="to_csv is not implemented with HDK storage format yet - issue #3082",
+    )
+    @pytest.mark.parametrize("compression", ["gzip", "bz2"])
+    @pytest.mark.parametrize("mode", ["w", "a"])
+    def test_to_csv_compression(self, compression, mode):
+        pandas_df = generate_dataframe()
+        modin_df = pd.DataFrame(pandas_df)
+
+        with ensure_clean_dir() as dirname:
+            modin_path = get_unique_filename(extension="csv", data_dir=dirname)
+            pandas_path = get_unique_filename(extension="csv", data_dir=dirname)
+            for _ in range(2 if mode == "a" else 1):
+                modin_df.to_csv(modin_path, mode=mode, compression=compression)
+                pandas_df.to_csv(pandas_path, mode=mode, compression=compression)
+
+            # the parallel writer compresses every row partition as a separate
+            # member, so only the decompressed contents are compared
+            df_equals(
+                pandas.read_csv(modin_path, compression=compression),
+                pandas.read_csv(pandas_path, compression=compression),
+            )
+
     @pytest.mark.skipif(
         StorageFormat.get() == "Hdk",
         reason="to_csv is not implemented with HDK storage format yet - issue #3082",
@@ -1330,6 +1354,33 @@ class TestParquet:
                 columns=columns,
             )
 
+    @pytest.mark.parametrize("columns", [None, ["col2"]])
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            [("col1", ">=", 1500), ("col1", "<", 1800)],
+            [[("col1", "<", 10)], [("col1", "in", {2500, 3000})]],
+            [("col1", ">", 10 ** 6)],
+        ],
+    )
+    @pytest.mark.parametrize("engine", ["pyarrow", "fastparquet"])
+    @pytest.mark.xfail(
+        condition="config.getoption('--simulate-cloud').lower() != 'off'",
+        reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
+    )
+    def test_read_parquet_filters(self, make_parquet_file, columns, filters, engine):
+        with ensure_clean(".parquet") as unique_filename:
+            make_parquet_file(filename=unique_filename, nrows=4000, row_group_size=100)
+
+            eval_io(
+                fn_name="read_parquet",
+                # read_parquet kwargs
+                engine=engine,
+                path=unique_filename,
+                columns=columns,
+                filters=filters,
+            )
+
     @pytest.mark.xfail(
         condition="config.getoption('--simulate-cloud').lower() != 'off'",
         reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
@@ -1590,6 +1641,23 @@ class TestParquet:
             extension="parquet",
         )
 
+    @pytest.mark.parametrize("partition_cols", [None, ["col1"], ["col1", "col2"]])
+    def test_to_parquet_partition_cols(self, partition_cols):
+        data = {
+            "col1": np.arange(256) % 3,
+            "col2": np.random.choice(["a", "b c"], 256),
+            "col3": np.random.rand(256),
+        }
+        modin_df, pandas_df = create_test_dfs(data)
+        parquet_eval_to_file(
+            modin_obj=modin_df,
+            pandas_obj=pandas_df,
+            fn="to_parquet",
+            extension="parquet",
+            partition_cols=partition_cols,
+            row_group_size=50,
+        )
+
     @pytest.mark.xfail(
         condition="config.getoption('--simulate-cloud').lower() != 'off'",
         reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
@@ -1616,6 +1684,28 @@ class TestJson:
             lines=lines,
         )
 
+    @pytest.mark.parametrize("orient", [None, "records", "values"])
+    def test_read_json_array(self, orient):
+        data = pandas.DataFrame(
+            {
+                "int": np.arange(NROWS),
+                "float": np.arange(NROWS) / 3,
+                # structural characters and escaped quotes inside strings
+                "str": ['a "quoted" [string], {with} \\ brackets', "plain"]
+                * (NROWS // 2),
+            }
+        )
+        with ensure_clean(".json") as unique_filename:
+            data.to_json(
+                unique_filename, orient="values" if orient == "values" else "records"
+            )
+            eval_io(
+                fn_name="read_json",
+                # read_json kwargs
+                path_or_buf=unique_filename,
+                orient=orient,
+            )
+
     @pytest.mark.skipif(
         condition=PandasCompatVersion.CURRENT == PandasCompatVersion.PY36,
         reason="older pandas read_json does not support storage_options",
@@ -2485,6 +2575,24 @@ def test_from_arrow():
     df_equals(modin_df, pandas_df)
 
 
+@pytest.mark.parametrize("dtype", ["int64", "float32", "mixed"])
+def test_from_pandas_blocks(dtype):
+    pandas_df = pandas.DataFrame(
+        np.arange(256 * 70).reshape(256, 70),
+        index=pandas.RangeIndex(256, 0, -1),
+        columns=[f"col{i}" for i in range(70)],
+    )
+    if dtype == "mixed":
+        pandas_df["col3"] = pandas_df["col3"].astype(str)
+    else:
+        pandas_df = pandas_df.astype(dtype)
+    modin_df = pd.DataFrame(pandas_df)
+    df_equals(modin_df, pandas_df)
+    # Partitions must not be affected by later changes of the source frame
+    pandas_df.iloc[0, 0] = -1
+    assert modin_df.iloc[0, 0] != -1
+
+
 @pytest.mark.xfail(
     condition="config.getoption('--simulate-cloud').lower() != 'off'",
     reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
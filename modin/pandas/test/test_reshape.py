@@ -21,10 +21,6 @@ from .utils import df_equals, test_data_values
 
 
 def test_get_dummies():
-    s = pd.Series(list("abca"))
-    with warns_that_defaulting_to_pandas():
-        pd.get_dummies(s)
-
     s1 = ["a", "b", np.nan]
     with warns_that_defaulting_to_pandas():
         pd.get_dummies(s1)
@@ -50,20 +46,28 @@ def test_get_dummies():
     assert modin_result._to_pandas().columns.equals(pandas_result.columns)
     assert modin_result.shape == pandas_result.shape
 
-    with pytest.raises(NotImplementedError):
-        pd.get_dummies(modin_df, prefix=["col1", "col2"], sparse=True)
+    modin_result = pd.get_dummies(modin_df, prefix=["col1", "col2"], sparse=True)
+    pandas_result = pandas.get_dummies(pandas_df, prefix=["col1", "col2"], sparse=True)
+    df_equals(modin_result, pandas_result)
+    assert modin_result.dtypes.equals(pandas_result.dtypes)
 
-    with warns_that_defaulting_to_pandas():
-        pd.get_dummies(pd.Series(list("abcaa")))
+    with pytest.raises(ValueError, match="Length of 'prefix'"):
+        pd.get_dummies(modin_df, prefix=["col1"])
 
     with warns_that_defaulting_to_pandas():
-        pd.get_dummies(pd.Series(list("abcaa")), drop_first=True)
+        pd.get_dummies(1)
 
-    with warns_that_defaulting_to_pandas():
-        pd.get_dummies(pd.Series(list("abc")), dtype=float)
 
-    with warns_that_defaulting_to_pandas():
-        pd.get_dummies(1)
+@pytest.mark.parametrize("dtype", ["object", "int64", "category"])
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"prefix": "p"}, {"dummy_na": True, "drop_first": True}, {"dtype": float}],
+)
+def test_get_dummies_series(dtype, kwargs):
+    values = ["c", "a", None, "b", "a"] * 20 if dtype != "int64" else [3, 1, 2] * 30
+    modin_result = pd.get_dummies(pd.Series(values, dtype=dtype), **kwargs)
+    pandas_result = pandas.get_dummies(pandas.Series(values, dtype=dtype), **kwargs)
+    df_equals(modin_result, pandas_result)
 
 
 def test_melt():
@@ -98,9 +102,9 @@ def test_crosstab():
         dtype=object,
     )
 
-    with warns_that_defaulting_to_pandas():
-        df = pd.crosstab(a, [b, c], rownames=["a"], colnames=["b", "c"])
-        assert isinstance(df, pd.DataFrame)
+    df = pd.crosstab(a, [b, c], rownames=["a"], colnames=["b", "c"])
+    assert isinstance(df, pd.DataFrame)
+    df_equals(df, pandas.crosstab(a, [b, c], rownames=["a"], colnames=["b", "c"]))
 
     foo = pd.Categorical(["a", "b"], categories=["a", "b", "c"])
     bar = pd.Categorical(["d", "e"], categories=["d", "e", "f"])
@@ -114,6 +118,37 @@ def test_crosstab():
         assert isinstance(df, pd.DataFrame)
 
 
+@pytest.mark.parametrize("margins", [False, True])
+@pytest.mark.parametrize("normalize", [False, True, "index", "columns"])
+@pytest.mark.parametrize("values", [False, True])
+def test_crosstab_series(margins, normalize, values):
+    random_state = np.random.RandomState(seed=42)
+    data = {
+        "a": random_state.randint(0, 10, 256),
+        "b": random_state.choice(["x", "y", "z"], 256),
+        "c": random_state.randint(0, 3, 256),
+        "v": random_state.rand(256),
+    }
+    modin_df, pandas_df = pd.DataFrame(data), pandas.DataFrame(data)
+
+    def crosstab(lib, df):
+        return lib.crosstab(
+            df["a"],
+            [df["b"], df["c"].iloc[10:]],
+            values=df["v"] if values else None,
+            aggfunc="mean" if values else None,
+            margins=margins,
+            normalize=normalize,
+        )
+
+    if margins and normalize:
+        with warns_that_defaulting_to_pandas():
+            modin_result = crosstab(pd, modin_df)
+    else:
+        modin_result = crosstab(pd, modin_df)
+    df_equals(modin_result, crosstab(pandas, pandas_df))
+
+
 def test_lreshape():
     data = pd.DataFrame(
         {
@@ -125,9 +160,8 @@ def test_lreshape():
         }
     )
 
-    with warns_that_defaulting_to_pandas():
-        df = pd.lreshape(data, {"year": ["year1", "year2"], "hr": ["hr1", "hr2"]})
-        assert isinstance(df, pd.DataFrame)
+    df = pd.lreshape(data, {"year": ["year1", "year2"], "hr": ["hr1", "hr2"]})
+    assert isinstance(df, pd.DataFrame)
 
     with pytest.raises(ValueError):
         pd.lreshape(data.to_numpy(), {"year": ["year1", "year2"], "hr": ["hr1", "hr2"]})
@@ -144,9 +178,36 @@ def test_wide_to_long():
         }
     )
 
-    with warns_that_defaulting_to_pandas():
-        df = pd.wide_to_long(data, ["hr", "year"], "team", "index")
-        assert isinstance(df, pd.DataFrame)
+    df = pd.wide_to_long(data, ["hr", "year"], "team", "index")
+    assert isinstance(df, pd.DataFrame)
 
     with pytest.raises(ValueError):
         pd.wide_to_long(data.to_numpy(), ["hr", "year"], "team", "index")
+
+
+@pytest.mark.parametrize("dropna", [True, False])
+def test_lreshape_partitions(dropna):
+    random_state = np.random.RandomState(seed=42)
+    data = {f"x{i}": random_state.rand(256) for i in range(3)}
+    data.update({f"y{i}": random_state.randint(0, 10, 256) for i in range(3)})
+    data["x1"][random_state.rand(256) < 0.2] = np.nan
+    data["id"] = np.arange(256)
+    groups = {"x": ["x0", "x1", "x2"], "y": ["y0", "y1", "y2"]}
+    df_equals(
+        pd.lreshape(pd.DataFrame(data), groups, dropna=dropna),
+        pandas.lreshape(pandas.DataFrame(data), groups, dropna=dropna),
+    )
+
+
+@pytest.mark.parametrize("i", ["id", ["id", "key"]])
+def test_wide_to_long_partitions(i):
+    random_state = np.random.RandomState(seed=42)
+    data = {f"A{year}": random_state.rand(256) for year in (1970, 1980, 1990)}
+    data.update({f"B{year}": random_state.randint(0, 9, 256) for year in (1970, 2000)})
+    data["X"] = random_state.rand(256)
+    data["id"] = random_state.permutation(256)
+    data["key"] = random_state.randint(0, 3, 256)
+    df_equals(
+        pd.wide_to_long(pd.DataFrame(data), ["A", "B"], i, "year"),
+        pandas.wide_to_long(pandas.DataFrame(data), ["A", "B"], i, "year"),
+    )
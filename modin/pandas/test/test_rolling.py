@@ -242,3 +242,77 @@ def test_issue_3512():
     pandas_ans = pandas_df[0:33].rolling(window=21).mean()
 
     df_equals(modin_ans, pandas_ans)
+
+
+@pytest.mark.parametrize("window", [1, 3, 100, 300])
+@pytest.mark.parametrize("closed", [None, "both", "left", "neither"])
+@pytest.mark.parametrize("method", ["sum", "mean", "std", "min", "max", "count"])
+def test_window_across_partitions(window, closed, method):
+    # Windows that span several row partitions need the rows of the preceding ones.
+    data = np.random.RandomState(42).rand(256, 4)
+    data[::7, 1] = np.nan
+    modin_df, pandas_df = create_test_dfs(data)
+    df_equals(
+        getattr(modin_df.rolling(window, min_periods=1, closed=closed), method)(),
+        getattr(pandas_df.rolling(window, min_periods=1, closed=closed), method)(),
+    )
+
+
+@pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
+@pytest.mark.parametrize("min_periods", [1, 5])
+@pytest.mark.parametrize("axis", [0, 1])
+def test_expanding(data, min_periods, axis):
+    modin_df, pandas_df = pd.DataFrame(data), pandas.DataFrame(data)
+    modin_expanded = modin_df.expanding(min_periods=min_periods, axis=axis)
+    pandas_expanded = pandas_df.expanding(min_periods=min_periods, axis=axis)
+    df_equals(modin_expanded.count(), pandas_expanded.count())
+    df_equals(modin_expanded.sum(), pandas_expanded.sum())
+    df_equals(modin_expanded.mean(), pandas_expanded.mean())
+    df_equals(modin_expanded.var(ddof=0), pandas_expanded.var(ddof=0))
+    df_equals(modin_expanded.std(), pandas_expanded.std())
+    df_equals(modin_expanded.min(), pandas_expanded.min())
+    df_equals(modin_expanded.max(), pandas_expanded.max())
+    df_equals(modin_expanded.median(), pandas_expanded.median())
+    df_equals(modin_expanded.aggregate(np.sum), pandas_expanded.aggregate(np.sum))
+
+
+@pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
+@pytest.mark.parametrize(
+    "ewm_kwargs",
+    [
+        {"com": 0.5},
+        {"span": 10, "min_periods": 3},
+        {"halflife": 6, "ignore_na": True},
+        {"alpha": 0.3, "adjust": False},
+        {"com": 1, "axis": 1},
+    ],
+)
+def test_ewm(data, ewm_kwargs):
+    modin_df, pandas_df = pd.DataFrame(data), pandas.DataFrame(data)
+    modin_ewm, pandas_ewm = modin_df.ewm(**ewm_kwargs), pandas_df.ewm(**ewm_kwargs)
+    df_equals(modin_ewm.mean(), pandas_ewm.mean())
+    df_equals(modin_ewm.var(), pandas_ewm.var())
+    df_equals(modin_ewm.std(bias=True), pandas_ewm.std(bias=True))
+    if ewm_kwargs.get("adjust", True):
+        df_equals(modin_ewm.sum(), pandas_ewm.sum())
+
+
+@pytest.mark.parametrize("ignore_na", [False, True])
+@pytest.mark.parametrize("method", ["sum", "mean", "var", "std", "min", "max"])
+def test_expanding_ewm_across_partitions(ignore_na, method):
+    # The states of the preceding row partitions are carried into the next ones,
+    # the missing values span whole partitions to check how they are combined.
+    data = np.random.RandomState(42).normal(1000, 5, size=(256, 4))
+    data[::7, 1] = np.nan
+    data[:100, 2] = np.nan
+    data[60:200, 3] = np.nan
+    modin_df, pandas_df = create_test_dfs(data)
+    df_equals(
+        getattr(modin_df.expanding(min_periods=3), method)(),
+        getattr(pandas_df.expanding(min_periods=3), method)(),
+    )
+    if method not in ("min", "max"):
+        df_equals(
+            getattr(modin_df.ewm(span=20, ignore_na=ignore_na), method)(),
+            getattr(pandas_df.ewm(span=20, ignore_na=ignore_na), method)(),
+        )
@@ -1766,16 +1766,14 @@ def test_equals():
 
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 def test_ewm(data):
-    modin_series, _ = create_test_series(data)  # noqa: F841
-    with warns_that_defaulting_to_pandas():
-        modin_series.ewm(halflife=6)
+    modin_series, pandas_series = create_test_series(data)
+    df_equals(modin_series.ewm(halflife=6).mean(), pandas_series.ewm(halflife=6).mean())
 
 
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 def test_expanding(data):
-    modin_series, _ = create_test_series(data)  # noqa: F841
-    with warns_that_defaulting_to_pandas():
-        modin_series.expanding()
+    modin_series, pandas_series = create_test_series(data)
+    df_equals(modin_series.expanding().sum(), pandas_series.expanding().sum())
 
 
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
@@ -3101,8 +3099,10 @@ def test_sort_values(data, ascending, na_position):
     # Since we use `DataFrame.sort_values` even for Series, the index can be different
     # between `pandas.Series.sort_values`. For this reason, we check that the values are
     # identical instead of the index as well.
+    # The default sorting algorithm is not stable and the rows are sorted per range
+    # partition, so the order of the labels of equal values may differ from pandas too.
     if ascending:
-        df_equals(modin_result, pandas_result)
+        df_equals_with_non_stable_indices(modin_result, pandas_result)
     else:
         np.testing.assert_equal(modin_result.values, pandas_result.values)
 
@@ -3116,11 +3116,21 @@ def test_sort_values(data, ascending, na_position):
     )
     # See above about `ascending=False`
     if ascending:
-        df_equals(modin_series_cp, pandas_series_cp)
+        df_equals_with_non_stable_indices(modin_series_cp, pandas_series_cp)
     else:
         np.testing.assert_equal(modin_series_cp.values, pandas_series_cp.values)
 
 
+@pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
+@pytest.mark.parametrize("ascending", [True, False], ids=["True", "False"])
+def test_sort_values_stable(data, ascending):
+    # A stable sort keeps the original order of equal values across range partitions.
+    eval_general(
+        *create_test_series(data),
+        lambda ser: ser.sort_values(ascending=ascending, kind="stable"),
+    )
+
+
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 def test_squeeze(data):
     modin_series, pandas_series = create_test_series(data)
@@ -11,12 +11,15 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
-"""Implement Window and Rolling public API."""
+"""Implement Window, Rolling, Expanding and ExponentialMovingWindow public API."""
 
 from typing import Optional
 import pandas.core.window.rolling
+import pandas.core.window.expanding
+import pandas.core.window.ewm
 from pandas.core.dtypes.common import is_list_like
 
+from modin.logging import ClassLogger
 from modin.utils import _inherit_docstrings
 from modin._compat.pandas_api.classes import WindowCompat, RollingCompat
 
@@ -217,3 +220,199 @@ class Rolling(RollingCompat):
                 self.axis, self.rolling_args, quantile, interpolation, **kwargs
             )
         )
+
+
+@_inherit_docstrings(
+    pandas.core.window.expanding.Expanding,
+    excluded=[pandas.core.window.expanding.Expanding.__init__],
+)
+class Expanding(ClassLogger):
+    def __init__(self, dataframe, expanding_kwargs, axis):
+        self._dataframe = dataframe
+        self._query_compiler = dataframe._query_compiler
+        self.expanding_kwargs = expanding_kwargs
+        self.axis = axis
+
+    def _default_to_pandas(self, op, *args, **kwargs):
+        """
+        Apply the specified function to the expanding window in pandas.
+
+        Parameters
+        ----------
+        op : str
+            Name of the ``pandas.core.window.expanding.Expanding`` method to apply.
+        *args : iterable
+            Positional arguments to pass to `op`.
+        **kwargs : dict
+            Keyword arguments to pass to `op`.
+
+        Returns
+        -------
+        object
+            Result of the function.
+        """
+        expanding_kwargs = self.expanding_kwargs
+
+        def expanding_op(df, *args, **kwargs):
+            return getattr(df.expanding(**expanding_kwargs), op)(*args, **kwargs)
+
+        expanding_op.__name__ = f"expanding.{op}"
+        return self._dataframe._default_to_pandas(expanding_op, *args, **kwargs)
+
+    def count(self):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.expanding_count(
+                self.axis, self.expanding_kwargs
+            )
+        )
+
+    def sum(self, *args, **kwargs):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.expanding_sum(
+                self.axis, self.expanding_kwargs, *args, **kwargs
+            )
+        )
+
+    def mean(self, *args, **kwargs):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.expanding_mean(
+                self.axis, self.expanding_kwargs, *args, **kwargs
+            )
+        )
+
+    def var(self, ddof=1, *args, **kwargs):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.expanding_var(
+                self.axis, self.expanding_kwargs, ddof, *args, **kwargs
+            )
+        )
+
+    def std(self, ddof=1, *args, **kwargs):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.expanding_std(
+                self.axis, self.expanding_kwargs, ddof, *args, **kwargs
+            )
+        )
+
+    def min(self, *args, **kwargs):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.expanding_min(
+                self.axis, self.expanding_kwargs, *args, **kwargs
+            )
+        )
+
+    def max(self, *args, **kwargs):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.expanding_max(
+                self.axis, self.expanding_kwargs, *args, **kwargs
+            )
+        )
+
+    def median(self, *args, **kwargs):
+        return self._default_to_pandas("median", *args, **kwargs)
+
+    def sem(self, *args, **kwargs):
+        return self._default_to_pandas("sem", *args, **kwargs)
+
+    def skew(self, *args, **kwargs):
+        return self._default_to_pandas("skew", *args, **kwargs)
+
+    def kurt(self, *args, **kwargs):
+        return self._default_to_pandas("kurt", *args, **kwargs)
+
+    def quantile(self, *args, **kwargs):
+        return self._default_to_pandas("quantile", *args, **kwargs)
+
+    def rank(self, *args, **kwargs):
+        return self._default_to_pandas("rank", *args, **kwargs)
+
+    def corr(self, *args, **kwargs):
+        return self._default_to_pandas("corr", *args, **kwargs)
+
+    def cov(self, *args, **kwargs):
+        return self._default_to_pandas("cov", *args, **kwargs)
+
+    def apply(self, *args, **kwargs):
+        return self._default_to_pandas("apply", *args, **kwargs)
+
+    def aggregate(self, *args, **kwargs):
+        return self._default_to_pandas("aggregate", *args, **kwargs)
+
+    agg = aggregate
+
+
+@_inherit_docstrings(
+    pandas.core.window.ewm.ExponentialMovingWindow,
+    excluded=[pandas.core.window.ewm.ExponentialMovingWindow.__init__],
+)
+class ExponentialMovingWindow(ClassLogger):
+    def __init__(self, dataframe, ewm_kwargs, axis):
+        self._dataframe = dataframe
+        self._query_compiler = dataframe._query_compiler
+        self.ewm_kwargs = ewm_kwargs
+        self.axis = axis
+
+    def _default_to_pandas(self, op, *args, **kwargs):
+        """
+        Apply the specified function to the exponentially weighted window in pandas.
+
+        Parameters
+        ----------
+        op : str
+            Name of the ``pandas.core.window.ewm.ExponentialMovingWindow`` method.
+        *args : iterable
+            Positional arguments to pass to `op`.
+        **kwargs : dict
+            Keyword arguments to pass to `op`.
+
+        Returns
+        -------
+        object
+            Result of the function.
+        """
+        ewm_kwargs = self.ewm_kwargs
+
+        def ewm_op(df, *args, **kwargs):
+            return getattr(df.ewm(**ewm_kwargs), op)(*args, **kwargs)
+
+        ewm_op.__name__ = f"ewm.{op}"
+        return self._dataframe._default_to_pandas(ewm_op, *args, **kwargs)
+
+    def mean(self, *args, **kwargs):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.ewm_mean(
+                self.axis, self.ewm_kwargs, *args, **kwargs
+            )
+        )
+
+    def sum(self, *args, **kwargs):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.ewm_sum(
+                self.axis, self.ewm_kwargs, *args, **kwargs
+            )
+        )
+
+    def var(self, bias=False, *args, **kwargs):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.ewm_var(
+                self.axis, self.ewm_kwargs, bias, *args, **kwargs
+            )
+        )
+
+    def std(self, bias=False, *args, **kwargs):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.ewm_std(
+                self.axis, self.ewm_kwargs, bias, *args, **kwargs
+            )
+        )
+
+    def corr(self, *args, **kwargs):
+        return self._default_to_pandas("corr", *args, **kwargs)
+
+    def cov(self, *args, **kwargs):
+        return self._default_to_pandas("cov", *args, **kwargs)
+
+    def aggregate(self, *args, **kwargs):
+        return self._default_to_pandas("aggregate", *args, **kwargs)
+
+    agg = aggregate
@@ -13,19 +13,21 @@
 
 """Dataframe exchange protocol tests that are specific for pandas storage format implementation."""
 
+import numpy as np
+
 import modin.pandas as pd
+from modin.config import NPartitions
 from modin.pandas.utils import from_dataframe
 from modin.pandas.test.utils import df_equals, test_data
-from modin.test.test_utils import warns_that_defaulting_to_pandas
+from modin.core.dataframe.pandas.interchange.dataframe_protocol.from_dataframe import (
+    bitmask_to_bool_ndarray,
+)
 
 
 def eval_df_protocol(modin_df_producer):
     internal_modin_df_producer = modin_df_producer.__dataframe__()
-    # Our configuration in pytest.ini requires that we explicitly catch all
-    # instances of defaulting to pandas, this one raises a warning on `.from_dataframe`
-    with warns_that_defaulting_to_pandas():
-        modin_df_consumer = from_dataframe(modin_df_producer)
-        internal_modin_df_consumer = from_dataframe(internal_modin_df_producer)
+    modin_df_consumer = from_dataframe(modin_df_producer)
+    internal_modin_df_consumer = from_dataframe(internal_modin_df_producer)
 
     # TODO: the following assertions verify that `from_dataframe` doesn't return
     # the same object untouched due to optimization branching, it actually should
@@ -54,3 +56,31 @@ def test_categorical_from_dataframe():
         {"foo": pd.Series(["0", "1", "2", "3", "0", "3", "2", "3"], dtype="category")}
     )
     eval_df_protocol(modin_df)
+
+
+def test_string_from_dataframe():
+    modin_df = pd.DataFrame(
+        {"foo": ["a", None, "", "ÿ€😀 b", "ascii", None, "中文", "z" * 100] * 4}
+    )
+    eval_df_protocol(modin_df)
+
+
+def test_from_dataframe_keeps_chunks():
+    modin_df = pd.concat(
+        [pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})] * NPartitions.get()
+    )
+    modin_df = modin_df.reset_index(drop=True)
+    n_chunks = modin_df._query_compiler._modin_frame._partitions.shape[0]
+
+    result = from_dataframe(modin_df)
+    assert result._query_compiler._modin_frame._partitions.shape[0] == n_chunks
+    df_equals(modin_df, result)
+
+
+def test_bitmask_to_bool_ndarray():
+    bools = np.random.default_rng(0).random(50) > 0.5
+    bitmask = np.packbits(bools, bitorder="little")
+    np.testing.assert_array_equal(bitmask_to_bool_ndarray(bitmask, 50), bools)
+    np.testing.assert_array_equal(
+        bitmask_to_bool_ndarray(bitmask, 37, first_byte_offset=11), bools[11:48]
+    )
@@ -58,6 +58,35 @@ elif Engine.get() == "Dask":
     block_partition_class = PandasOnDaskDataframePartition
     virtual_column_partition_class = PandasOnDaskDataframeColumnPartition
     virtual_row_partition_class = PandasOnDaskDataframeRowPartition
+elif Engine.get() == "Threads":
+    from modin.core.execution.threads.implementations.pandas_on_threads.partitioning.virtual_partition import (
+        PandasOnThreadsDataframeColumnPartition,
+        PandasOnThreadsDataframeRowPartition,
+    )
+    from modin.core.execution.threads.implementations.pandas_on_threads.partitioning.partition import (
+        PandasOnThreadsDataframePartition,
+    )
+    from modin.core.execution.threads.common import ThreadsWrapper
+
+    put = ThreadsWrapper.put
+    block_partition_class = PandasOnThreadsDataframePartition
+    virtual_column_partition_class = PandasOnThreadsDataframeColumnPartition
+    virtual_row_partition_class = PandasOnThreadsDataframeRowPartition
+elif Engine.get() == "Python":
+    from modin.core.execution.python.implementations.pandas_on_python.partitioning.virtual_partition import (
+        PandasOnPythonDataframeColumnPartition,
+        PandasOnPythonDataframeRowPartition,
+    )
+    from modin.core.execution.python.implementations.pandas_on_python.partitioning.partition import (
+        PandasOnPythonDataframePartition,
+    )
+
+    def put(x):
+        return x
+
+    block_partition_class = PandasOnPythonDataframePartition
+    virtual_column_partition_class = PandasOnPythonDataframeColumnPartition
+    virtual_row_partition_class = PandasOnPythonDataframeRowPartition
 
 
 @pytest.fixture
@@ -161,8 +190,8 @@ def test_apply_func_to_both_axis(has_partitions_shape_cache, has_frame_shape_cac
 
 
 @pytest.mark.skipif(
-    Engine.get() not in ("Dask", "Ray"),
-    reason="Rebalancing partitions is only supported for Dask and Ray engines",
+    Engine.get() not in ("Dask", "Ray", "Threads"),
+    reason="Rebalancing partitions is only supported for Dask, Ray and Threads engines",
 )
 @pytest.mark.parametrize(
     "test_type",
@@ -271,8 +300,8 @@ def test_rebalance_partitions(test_type, set_num_partitions):
 
 
 @pytest.mark.skipif(
-    Engine.get() not in ("Dask", "Ray"),
-    reason="Only Dask and Ray engines have virtual partitions.",
+    Engine.get() not in ("Dask", "Ray", "Threads"),
+    reason="Only Dask, Ray and Threads engines have virtual partitions.",
 )
 @pytest.mark.parametrize(
     "axis,virtual_partition_class",
@@ -387,8 +416,8 @@ class TestDrainVirtualPartitionCallQueue:
 
 
 @pytest.mark.skipif(
-    Engine.get() not in ("Dask", "Ray"),
-    reason="Only Dask and Ray engines have virtual partitions.",
+    Engine.get() not in ("Dask", "Ray", "Threads"),
+    reason="Only Dask, Ray and Threads engines have virtual partitions.",
 )
 @pytest.mark.parametrize(
     "virtual_partition_class",
@@ -424,3 +453,28 @@ def test_virtual_partition_dup_object_ref():
     ), "Test setup did not contain duplicate objects"
     # The below call to wait() should not crash
     partition.wait()
+
+
+@pytest.mark.skipif(
+    Engine.get() not in ("Python", "Threads"),
+    reason="Only Python and Threads engines share the partition data with the functions.",
+)
+def test_partition_copy_on_write():
+    pandas_df = pandas.DataFrame({"a": np.arange(10.0), "b": np.arange(10)})
+    modin_df = pd.DataFrame(pandas_df)
+    partition = modin_df._query_compiler._modin_frame._partitions[0][0]
+    data = partition.get()
+
+    # Functions not writing to the data must get it without copying
+    result = partition.apply(lambda df: df).get()
+    assert np.shares_memory(result["a"].to_numpy(), data["a"].to_numpy())
+
+    def mutate(df):
+        df.iloc[0, 0] = -1.0
+        return df
+
+    result = partition.apply(mutate).get()
+    assert result.iloc[0, 0] == -1.0
+    # The data of the partition must stay untouched
+    df_equals(partition.get(), pandas_df)
+    df_equals(modin_df, pandas_df)
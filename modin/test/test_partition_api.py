@@ -39,6 +39,13 @@ elif Engine.get() == "Dask":
     put_func = lambda x: DaskWrapper.put(x)  # noqa: E731
     get_func = lambda x: DaskWrapper.materialize(x)  # noqa: E731
     FutureType = Future
+elif Engine.get() == "Threads":
+    from modin.core.execution.threads.common import ThreadsWrapper
+    from concurrent.futures import Future
+
+    put_func = lambda x: ThreadsWrapper.put(x)  # noqa: E731
+    get_func = lambda x: ThreadsWrapper.materialize(x)  # noqa: E731
+    FutureType = Future
 elif Engine.get() == "Python":
     put_func = lambda x: x  # noqa: E731
     get_func = lambda x: x  # noqa: E731
@@ -94,7 +101,7 @@ def test_unwrap_partitions(axis, reverse_index, reverse_columns):
         actual_axis_partitions = unwrap_partitions(df, axis=axis)
         assert len(expected_axis_partitions) == len(actual_axis_partitions)
         for item_idx in range(len(expected_axis_partitions)):
-            if Engine.get() in ["Ray", "Dask"]:
+            if Engine.get() in ["Ray", "Dask", "Threads"]:
                 df_equals(
                     get_func(expected_axis_partitions[item_idx]),
                     get_func(actual_axis_partitions[item_idx]),
@@ -134,6 +141,11 @@ def test_from_partitions(axis, index, columns, row_lengths, column_widths):
             futures = [[put_func(df1), put_func(df2)]]
         else:
             futures = [put_func(df1), put_func(df2)]
+    if Engine.get() == "Threads":
+        if axis is None:
+            futures = [[put_func(df1), put_func(df2)]]
+        else:
+            futures = [put_func(df1), put_func(df2)]
     if Engine.get() == "Dask":
         if axis is None:
             futures = [put_func([df1, df2], hash=False)]